@@ -0,0 +1,5 @@
+from above_the_rim.asgi import create_asgi_app
+from above_the_rim.configs.prod import ProdConfig
+
+# ASGI-режим: uvicorn basketball_asgi:app
+app = create_asgi_app(ProdConfig())
@@ -0,0 +1,93 @@
+"""
+Бенчмарк ASGI-режима против синхронного Flask: N одновременных клиентов запрашивают страницу игр
+GET /api/v2/games/?limit=100. Синхронный стек обслуживает их пулом из --threads потоков (как gunicorn --threads),
+асинхронный - одним потоком с asyncio
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python benchmarks/bench_async.py --games 20000 --clients 500
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from above_the_rim.asgi import create_asgi_app
+from above_the_rim.configs.base import BaseConfig
+from seed import seed_db
+
+PATH = "/api/v2/games/"
+QUERY_STRING = "limit=100"
+
+
+def sync_path(app, clients: int, threads: int) -> float:
+    def one_request(_):
+        response = app.flask_app.test_client().get(PATH, query_string=QUERY_STRING)
+        assert response.status_code == 200
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(one_request, range(clients)))
+    return time.perf_counter() - started
+
+
+async def async_path(app, clients: int) -> float:
+    async def one_request():
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await app({
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": PATH, "raw_path": PATH.encode(), "root_path": "", "query_string": QUERY_STRING.encode(),
+            "headers": [], "server": ("localhost", 80), "client": ("127.0.0.1", 12345),
+        }, receive, send)
+        assert messages[0]["status"] == 200
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(clients)))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(BaseConfig):
+            DB_URL = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+            # Сравниваем работу с БД, а не кэш готовых ответов
+            RESPONSE_CACHE_ENABLED = False
+            DB_POOL_SIZE = 20
+
+        app = create_asgi_app(BenchConfig())
+        seed_db(app.flask_app.db, games_count=args.games, quarters_per_game=4)
+        app.flask_app.db.commit()
+        app.flask_app.db.remove()
+
+        sync_time = sync_path(app, args.clients, args.threads)
+
+        async def run_async() -> float:
+            try:
+                return await async_path(app, args.clients)
+            finally:
+                await app.session_maker.kw["bind"].dispose()
+
+        async_time = asyncio.run(run_async())
+        print(f"games: {args.games}, clients: {args.clients}")
+        print(f"sync Flask, {args.threads} threads: {sync_time * 1000:.1f} ms ({args.clients / sync_time:.0f} req/s)")
+        print(f"ASGI, 1 thread:          {async_time * 1000:.1f} ms ({args.clients / async_time:.0f} req/s)")
+        app.flask_app.db.get_bind().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Бенчмарк сжатия ответа GET /api/v2/games: размер тела и время ответа без сжатия, со сжатием на каждый запрос
+(кэш готовых ответов выключен) и со сжатыми версиями из кэша готовых ответов
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src:benchmarks python benchmarks/bench_compression.py --games 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.base import BaseConfig
+from seed import seed_db
+
+
+def measure(client, headers: dict, repeat: int) -> tuple[float, int]:
+    client.get("/api/v2/games/", headers=headers)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get("/api/v2/games/", headers=headers)
+        body = response.get_data()
+        best = min(best, time.perf_counter() - started)
+    return best, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(BaseConfig):
+            DB_URL = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+
+        class NotCachedConfig(BenchConfig):
+            RESPONSE_CACHE_ENABLED = False
+
+        app = create_app(BenchConfig())
+        seed_db(app.db, games_count=args.games, quarters_per_game=4)
+        app.db.remove()
+        app.team_registry.invalidate()
+        not_cached_app = create_app(NotCachedConfig())
+
+        encodings = ["identity", *app.response_compressor.encodings]
+        print(f"games: {args.games} (best of {args.repeat})")
+        for name, flask_app in (("per request", not_cached_app), ("cached", app)):
+            client = flask_app.test_client()
+            for encoding in encodings:
+                elapsed, size = measure(client, {"Accept-Encoding": encoding}, args.repeat)
+                print(f"{name:12} {encoding:9} {size / 1024:8.0f} KiB {elapsed * 1000:8.1f} ms")
+        app.db.get_bind().dispose()
+        not_cached_app.db.get_bind().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Бенчмарк загрузки игр с четвертями: POST /api/v2/games + POST /api/v2/games/<id> на каждую четверть
+против одного POST /api/v2/games/batch
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python benchmarks/bench_games_batch.py --games 2000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.base import BaseConfig
+from seed import seed_db
+
+
+def make_games(games_count: int, teams_count: int, quarters_per_game: int, seed: int = 42) -> list[dict]:
+    rnd = random.Random(seed)
+    games = []
+    for _ in range(games_count):
+        home_id, visiting_id = rnd.sample(range(1, teams_count + 1), 2)
+        games.append({
+            "home_team": f"T{home_id:02d}"[:3],
+            "visiting_team": f"T{visiting_id:02d}"[:3],
+            "quarters": [f"{rnd.randint(10, 35)}:{rnd.randint(10, 35)}" for _ in range(quarters_per_game)],
+        })
+    return games
+
+
+def per_row_path(client, games: list[dict]):
+    for game in games:
+        response = client.post("/api/v2/games/", json={"home_team": game["home_team"], "visiting_team": game["visiting_team"]})
+        game_id = response.get_json()["data"]
+        for quarter in game["quarters"]:
+            client.post(f"/api/v2/games/{game_id}", json={"quarters": quarter})
+
+
+def batch_path(client, games: list[dict]):
+    response = client.post("/api/v2/games/batch", json=games)
+    assert response.status_code == 201, response.get_json()
+
+
+def measure(games: list[dict], teams_count: int, func) -> float:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(BaseConfig):
+            DB_URL = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+            GAMES_BATCH_MAX_SIZE = len(games)
+
+        app = create_app(BenchConfig)
+        seed_db(app.db, teams_count=teams_count, games_count=0)
+        app.db.commit()
+        app.team_registry.invalidate()
+
+        started = time.perf_counter()
+        func(app.test_client(), games)
+        elapsed = time.perf_counter() - started
+        app.db.remove()
+        app.db.get_bind().dispose()
+        return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=2_000)
+    parser.add_argument("--teams", type=int, default=30)
+    parser.add_argument("--quarters", type=int, default=4)
+    args = parser.parse_args()
+
+    games = make_games(args.games, args.teams, args.quarters)
+    per_row_time = measure(games, args.teams, per_row_path)
+    batch_time = measure(games, args.teams, batch_path)
+    print(f"games: {args.games}, quarters per game: {args.quarters}")
+    print(f"per-row requests: {per_row_time * 1000:.1f} ms")
+    print(f"batch request:    {batch_time * 1000:.1f} ms")
+    print(f"speedup:          x{per_row_time / batch_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Бенчмарк GET /api/v1/games: ORM + ленивые загрузки команд против плоского JOIN-запроса
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python benchmarks/bench_games_list.py --games 50000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from above_the_rim.database.db import init_db
+from above_the_rim.services.repository_factory import RepositoryFactory
+from seed import seed_db
+
+
+def orm_path(db) -> dict:
+    games = RepositoryFactory(db).get_game_repository().get_all_games()
+    return {
+        game.ID: f"{game.home_team.NAME} {game.HOME_TEAM_SCORE}:{game.VISITING_TEAM_SCORE} {game.visiting_team.NAME}"
+        for game in games
+    }
+
+
+def rows_path(db) -> dict:
+    games = RepositoryFactory(db).get_game_repository().get_all_game_rows()
+    return {
+        game.ID: f"{game.HOME_TEAM_NAME} {game.HOME_TEAM_SCORE}:{game.VISITING_TEAM_SCORE} {game.VISITING_TEAM_NAME}"
+        for game in games
+    }
+
+
+def measure(db, func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        db.remove()
+        started = time.perf_counter()
+        func(db)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = init_db(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        seed_db(db, games_count=args.games)
+        assert orm_path(db) == rows_path(db)
+
+        orm_time = measure(db, orm_path, args.repeat)
+        rows_time = measure(db, rows_path, args.repeat)
+        print(f"games: {args.games}")
+        print(f"ORM + lazy loads: {orm_time * 1000:.1f} ms")
+        print(f"JOIN rows:        {rows_time * 1000:.1f} ms")
+        print(f"speedup:          x{orm_time / rows_time:.1f}")
+        db.get_bind().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Бенчмарк очных встреч GET /api/v1/team/<short>/vs/<other>: время ответа роута и агрегирующего запроса
+GameRepository.get_head_to_head с индексом по паре (HOME_TEAM_ID, VISITING_TEAM_ID) и с прежним
+индексом только по HOME_TEAM_ID
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src:benchmarks python benchmarks/bench_head_to_head.py --games 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import text
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.base import BaseConfig
+from above_the_rim.services.repository_factory import RepositoryFactory
+from seed import seed_db
+
+
+def measure(call, repeat: int) -> float:
+    call()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(BaseConfig):
+            DB_URL = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+
+        app = create_app(BenchConfig())
+        seed_db(app.db, games_count=args.games)
+        app.db.execute(text("ANALYZE"))
+        app.db.commit()
+        app.team_registry.invalidate()
+
+        client = app.test_client()
+        game_repository = RepositoryFactory(app.db).get_game_repository()
+        response = client.get("/api/v1/team/T01/vs/T02")
+        assert response.status_code == 200, response.data
+        print(f"games: {args.games} (best of {args.repeat}), T01 vs T02: {response.json['data']['games']} games")
+
+        route_time = measure(lambda: client.get("/api/v1/team/T01/vs/T02"), args.repeat)
+        query_time = measure(lambda: game_repository.get_head_to_head(1, 2), args.repeat)
+        print(f"{'route':40} {route_time * 1000:8.2f} ms")
+        print(f"{'query, (HOME_TEAM_ID, VISITING_TEAM_ID)':40} {query_time * 1000:8.2f} ms")
+
+        app.db.execute(text('DROP INDEX "ix_games_HOME_TEAM_ID_VISITING_TEAM_ID_scores"'))
+        app.db.execute(text(
+            'CREATE INDEX "ix_games_HOME_TEAM_ID_scores" ON games ("HOME_TEAM_ID", "HOME_TEAM_SCORE", "VISITING_TEAM_SCORE")'
+        ))
+        app.db.execute(text("ANALYZE"))
+        app.db.commit()
+        old_index_time = measure(lambda: game_repository.get_head_to_head(1, 2), args.repeat)
+        print(f"{'query, (HOME_TEAM_ID) only':40} {old_index_time * 1000:8.2f} ms")
+        app.db.remove()
+        app.db.get_bind().dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Бенчмарк сериализации ответа GET /api/v2/games: DefaultJSONProvider Flask (json) против FastJSONProvider (orjson),
+а также словарь игр-объектов по ID
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python benchmarks/bench_json.py --games 50000
+"""
+
+import argparse
+import time
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from above_the_rim.json_provider import FastJSONProvider
+
+
+def build_payload(games_count: int) -> dict:
+    return {
+        "data": {
+            game_id: f"Team {game_id % 30} {game_id % 120}:{game_id % 97} Team {game_id % 29} (25:20,31:18)"
+            for game_id in range(1, games_count + 1)
+        },
+        "success": True,
+    }
+
+
+def build_objects_payload(games_count: int) -> dict:
+    return {
+        "data": {
+            game_id: {
+                "id": game_id,
+                "home_team": f"Team number {game_id % 30}",
+                "home_team_score": game_id % 120,
+                "visiting_team": f"Team number {game_id % 29}",
+                "visiting_team_score": game_id % 97,
+                "quarters": ["25:20", "31:18"],
+            }
+            for game_id in range(1, games_count + 1)
+        },
+        "success": True,
+    }
+
+
+def measure(app: Flask, provider, payload: dict, repeat: int) -> tuple[float, bytes]:
+    best = float("inf")
+    with app.app_context():
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = provider.response(payload).get_data()
+            best = min(best, time.perf_counter() - started)
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    fast_provider = FastJSONProvider(app)
+    payload = build_payload(args.games)
+    default_time, default_body = measure(app, default_provider, payload, args.repeat)
+    fast_time, fast_body = measure(app, fast_provider, payload, args.repeat)
+    fallback_time, fallback_body = measure(app, FastJSONProvider(app, use_orjson=False), payload, args.repeat)
+    assert default_body == fast_body == fallback_body
+
+    objects_payload = build_objects_payload(args.games)
+    objects_default_time, objects_default_body = measure(app, default_provider, objects_payload, args.repeat)
+    objects_fast_time, objects_fast_body = measure(app, fast_provider, objects_payload, args.repeat)
+    assert objects_default_body == objects_fast_body
+
+    print(f"games: {args.games} (best of {args.repeat})")
+    print(f"summaries, {len(default_body) / 1024:.0f} KiB:")
+    print(f"  DefaultJSONProvider (json):    {default_time * 1000:.1f} ms")
+    print(f"  FastJSONProvider (orjson):     {fast_time * 1000:.1f} ms (x{default_time / fast_time:.1f})")
+    print(f"  FastJSONProvider (json):       {fallback_time * 1000:.1f} ms")
+    print(f"game objects, {len(objects_default_body) / 1024:.0f} KiB:")
+    print(f"  DefaultJSONProvider (json):    {objects_default_time * 1000:.1f} ms")
+    print(f"  FastJSONProvider (orjson):     {objects_fast_time * 1000:.1f} ms "
+          f"(x{objects_default_time / objects_fast_time:.1f})")
+
+if __name__ == "__main__":
+    main()
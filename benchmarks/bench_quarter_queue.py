@@ -0,0 +1,76 @@
+"""
+Бенчмарк записи четвертей: POST /api/v2/games/<id> с commit на каждый запрос против отложенной записи
+пачками (QUARTER_QUEUE_ENABLED). Для очереди время считается до записи последней четверти в БД
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python benchmarks/bench_quarter_queue.py --quarters 5000 --threads 16
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.base import BaseConfig
+from seed import seed_db
+
+
+def post_quarters(app, quarters_count: int, threads_count: int, games_count: int):
+    def worker(thread_number: int):
+        client = app.test_client()
+        for number in range(thread_number, quarters_count, threads_count):
+            response = client.post(f"/api/v2/games/{number % games_count + 1}", json={"quarters": "21:12"})
+            assert response.status_code in (201, 202), response.get_json()
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if app.quarter_queue is not None:
+        app.quarter_queue.join()
+
+
+def measure(quarters_count: int, threads_count: int, games_count: int, queue_enabled: bool) -> float:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        class BenchConfig(BaseConfig):
+            DB_URL = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+            # synchronous=FULL: каждый commit ждет fsync, как на живом сервере
+            DB_SQLITE_PRAGMAS = {**BaseConfig.DB_SQLITE_PRAGMAS, "synchronous": "FULL"}
+            QUARTER_QUEUE_ENABLED = queue_enabled
+
+        app = create_app(BenchConfig)
+        seed_db(app.db, teams_count=30, games_count=games_count, quarters_per_game=0)
+        app.db.commit()
+        app.db.remove()
+
+        started = time.perf_counter()
+        post_quarters(app, quarters_count, threads_count, games_count)
+        elapsed = time.perf_counter() - started
+        if app.quarter_queue is not None:
+            print(f"queue: {app.quarter_queue.written} quarters in {app.quarter_queue.batches} batches")
+            app.quarter_queue.stop()
+        app.db.remove()
+        app.db.get_bind().dispose()
+        return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--quarters", type=int, default=5_000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--games", type=int, default=100)
+    args = parser.parse_args()
+
+    commit_time = measure(args.quarters, args.threads, args.games, queue_enabled=False)
+    queue_time = measure(args.quarters, args.threads, args.games, queue_enabled=True)
+    print(f"quarters: {args.quarters}, threads: {args.threads}, games: {args.games}")
+    print(f"commit per request: {commit_time * 1000:.1f} ms ({args.quarters / commit_time:.0f} quarters/s)")
+    print(f"write-behind queue: {queue_time * 1000:.1f} ms ({args.quarters / queue_time:.0f} quarters/s)")
+    print(f"speedup:            x{commit_time / queue_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
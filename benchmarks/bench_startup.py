@@ -0,0 +1,80 @@
+"""
+Бенчмарк старта процесса-воркера: импорт приложения и create_app в отдельном процессе.
+Сравнивается старт по умолчанию (сканирование пакетов с блюпринтами, create_all на каждом старте)
+и быстрый старт (BLUEPRINT_MANIFEST_ENABLED, БД на ревизии Alembic SCHEMA_REVISION - create_all пропускается)
+
+Запуск (из корня репозитория):
+    PYTHONPATH=src python benchmarks/bench_startup.py --runs 20
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+
+WORKER = """
+import json, sys, time
+started = time.perf_counter()
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.base import BaseConfig
+imported = time.perf_counter()
+
+class StartupConfig(BaseConfig):
+    DB_URL = sys.argv[1]
+    BLUEPRINT_MANIFEST_ENABLED = sys.argv[2] == "1"
+
+app = create_app(StartupConfig)
+created = time.perf_counter()
+print(json.dumps({"import": imported - started, "create_app": created - imported}))
+"""
+
+
+def prepare_db(db_path: str, at_head: bool):
+    """
+    Создает БД со схемой моделей. at_head - как после alembic upgrade head (есть alembic_version)
+    """
+    from above_the_rim.database.db import init_db, SCHEMA_REVISION
+    import above_the_rim.database.models  # noqa: F401 - регистрирует таблицы в Base.metadata
+
+    init_db(f"sqlite:///{db_path}").get_bind().dispose()
+    if at_head:
+        connection = sqlite3.connect(db_path)
+        connection.execute("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+        connection.execute("INSERT INTO alembic_version VALUES (?)", (SCHEMA_REVISION,))
+        connection.commit()
+        connection.close()
+
+
+def measure(runs: int, fast: bool) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        prepare_db(db_path, at_head=fast)
+        results = []
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-c", WORKER, f"sqlite:///{db_path}", "1" if fast else "0"],
+                check=True, capture_output=True, text=True, env=os.environ
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(result[key] for result in results) for key in ("import", "create_app")}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    default = measure(args.runs, fast=False)
+    fast = measure(args.runs, fast=True)
+    print(f"runs: {args.runs} (median)")
+    for name, result in (("default startup", default), ("fast startup", fast)):
+        print(f"{name:16} import: {result['import'] * 1000:.1f} ms, create_app: {result['create_app'] * 1000:.1f} ms")
+    print(f"create_app speedup: x{default['create_app'] / fast['create_app']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Наполнение БД синтетическими данными для бенчмарков
+"""
+
+import random
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from above_the_rim.database.models import Team, Game, Quarters
+
+
+def seed_db(db: Session, teams_count: int = 30, games_count: int = 50_000, quarters_per_game: int = 0, seed: int = 42):
+    """
+    Заполняет БД командами, играми и (опционально) четвертями через executemany
+
+    Args:
+        db (Session): сессия БД
+        teams_count (int): количество команд
+        games_count (int): количество игр
+        quarters_per_game (int): количество четвертей у каждой игры
+        seed (int): seed генератора случайных чисел, для воспроизводимости
+
+    Returns:
+        None
+    """
+    rnd = random.Random(seed)
+    db.execute(insert(Team), [
+        {"ID": i, "SHORT": f"T{i:02d}"[:3], "NAME": f"Team number {i}"}
+        for i in range(1, teams_count + 1)
+    ])
+
+    games = []
+    quarters = []
+    for game_id in range(1, games_count + 1):
+        home_id, visiting_id = rnd.sample(range(1, teams_count + 1), 2)
+        home_score = visiting_score = 0
+        for number in range(1, quarters_per_game + 1):
+            home_points, visiting_points = rnd.randint(10, 35), rnd.randint(10, 35)
+            home_score += home_points
+            visiting_score += visiting_points
+            quarters.append({
+                "GAME_ID": game_id, "NUMBER": number, "HOME_POINTS": home_points, "VISITING_POINTS": visiting_points
+            })
+        if not quarters_per_game:
+            home_score, visiting_score = rnd.randint(60, 130), rnd.randint(60, 130)
+        games.append({
+            "ID": game_id,
+            "HOME_TEAM_ID": home_id,
+            "VISITING_TEAM_ID": visiting_id,
+            "HOME_TEAM_SCORE": home_score,
+            "VISITING_TEAM_SCORE": visiting_score,
+        })
+
+    db.execute(insert(Game), games)
+    if quarters:
+        db.execute(insert(Quarters), quarters)
+    db.commit()
@@ -0,0 +1,30 @@
+"""added games.VERSION for optimistic score updates
+
+Revision ID: 0a6c4e2f8b51
+Revises: f2b8e60c9d17
+Create Date: 2026-10-18 15:21:37.446019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a6c4e2f8b51'
+down_revision: Union[str, None] = 'f2b8e60c9d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('VERSION', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_column('VERSION')
@@ -0,0 +1,38 @@
+"""made (GAME_ID, NUMBER) index of quarters unique
+
+Revision ID: 3c9e8f1a2b47
+Revises: 7d3f5a9c1e24
+Create Date: 2026-10-18 19:40:52.104387
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e8f1a2b47'
+down_revision: Union[str, None] = '7d3f5a9c1e24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Четверти, записанные с повторяющимся номером, перенумеровываются по порядку добавления (ID)
+    op.execute(
+        'UPDATE quarters SET "NUMBER" = ('
+        'SELECT COUNT(*) FROM quarters AS previous '
+        'WHERE previous."GAME_ID" = quarters."GAME_ID" AND previous."ID" <= quarters."ID")'
+    )
+    with op.batch_alter_table('quarters', schema=None) as batch_op:
+        batch_op.drop_index('ix_quarters_GAME_ID_NUMBER')
+        batch_op.create_index('ix_quarters_GAME_ID_NUMBER', ['GAME_ID', 'NUMBER'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('quarters', schema=None) as batch_op:
+        batch_op.drop_index('ix_quarters_GAME_ID_NUMBER')
+        batch_op.create_index('ix_quarters_GAME_ID_NUMBER', ['GAME_ID', 'NUMBER'], unique=False)
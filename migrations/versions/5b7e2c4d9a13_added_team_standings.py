@@ -0,0 +1,62 @@
+"""added team_standings
+
+Revision ID: 5b7e2c4d9a13
+Revises: 09c1464f5f61
+Create Date: 2026-10-18 10:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2c4d9a13'
+down_revision: Union[str, None] = '09c1464f5f61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'team_standings',
+        sa.Column('TEAM_ID', sa.Integer(), nullable=False),
+        sa.Column('WINS', sa.Integer(), nullable=False),
+        sa.Column('LOSSES', sa.Integer(), nullable=False),
+        sa.Column('POINTS_FOR', sa.Integer(), nullable=False),
+        sa.Column('POINTS_AGAINST', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['TEAM_ID'], ['teams.ID'], name=op.f('fk_team_standings_TEAM_ID_teams'), onupdate='CASCADE', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('TEAM_ID', name=op.f('pk_team_standings'))
+    )
+    # Заполнение по существующим играм (то же, что GameRepository.get_standings)
+    op.execute('''
+        INSERT INTO team_standings ("TEAM_ID", "WINS", "LOSSES", "POINTS_FOR", "POINTS_AGAINST")
+        SELECT
+            t."ID",
+            COALESCE(SUM(CASE
+                WHEN g."HOME_TEAM_ID" = t."ID" AND g."HOME_TEAM_SCORE" > g."VISITING_TEAM_SCORE" THEN 1
+                WHEN g."VISITING_TEAM_ID" = t."ID" AND g."VISITING_TEAM_SCORE" > g."HOME_TEAM_SCORE" THEN 1
+                ELSE 0 END), 0),
+            COALESCE(SUM(CASE
+                WHEN g."HOME_TEAM_ID" = t."ID" AND g."HOME_TEAM_SCORE" < g."VISITING_TEAM_SCORE" THEN 1
+                WHEN g."VISITING_TEAM_ID" = t."ID" AND g."VISITING_TEAM_SCORE" < g."HOME_TEAM_SCORE" THEN 1
+                ELSE 0 END), 0),
+            COALESCE(SUM(CASE
+                WHEN g."HOME_TEAM_ID" = t."ID" THEN g."HOME_TEAM_SCORE"
+                WHEN g."VISITING_TEAM_ID" = t."ID" THEN g."VISITING_TEAM_SCORE"
+                ELSE 0 END), 0),
+            COALESCE(SUM(CASE
+                WHEN g."HOME_TEAM_ID" = t."ID" THEN g."VISITING_TEAM_SCORE"
+                WHEN g."VISITING_TEAM_ID" = t."ID" THEN g."HOME_TEAM_SCORE"
+                ELSE 0 END), 0)
+        FROM teams t
+        LEFT OUTER JOIN games g ON g."HOME_TEAM_ID" = t."ID" OR g."VISITING_TEAM_ID" = t."ID"
+        GROUP BY t."ID"
+    ''')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('team_standings')
@@ -0,0 +1,39 @@
+"""replaced games home team index with (HOME_TEAM_ID, VISITING_TEAM_ID) covering index for head-to-head
+
+Revision ID: 7d3f5a9c1e24
+Revises: 0a6c4e2f8b51
+Create Date: 2026-10-18 16:02:11.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3f5a9c1e24'
+down_revision: Union[str, None] = '0a6c4e2f8b51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Новый индекс начинается с HOME_TEAM_ID и тоже покрывает счет, поэтому заменяет ix_games_HOME_TEAM_ID_scores
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_games_HOME_TEAM_ID_VISITING_TEAM_ID_scores',
+            ['HOME_TEAM_ID', 'VISITING_TEAM_ID', 'HOME_TEAM_SCORE', 'VISITING_TEAM_SCORE'],
+            unique=False
+        )
+        batch_op.drop_index('ix_games_HOME_TEAM_ID_scores')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_games_HOME_TEAM_ID_scores', ['HOME_TEAM_ID', 'HOME_TEAM_SCORE', 'VISITING_TEAM_SCORE'], unique=False
+        )
+        batch_op.drop_index('ix_games_HOME_TEAM_ID_VISITING_TEAM_ID_scores')
@@ -0,0 +1,34 @@
+"""added data_versions
+
+Revision ID: a41f7d0e6c28
+Revises: 5b7e2c4d9a13
+Create Date: 2026-10-18 11:02:17.540631
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f7d0e6c28'
+down_revision: Union[str, None] = '5b7e2c4d9a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    data_versions = op.create_table(
+        'data_versions',
+        sa.Column('NAME', sa.String(length=50), nullable=False),
+        sa.Column('VERSION', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('NAME', name=op.f('pk_data_versions'))
+    )
+    op.bulk_insert(data_versions, [{'NAME': 'teams', 'VERSION': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('data_versions')
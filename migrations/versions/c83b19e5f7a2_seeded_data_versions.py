@@ -0,0 +1,38 @@
+"""seeded data_versions for games, quarters, standings
+
+Revision ID: c83b19e5f7a2
+Revises: a41f7d0e6c28
+Create Date: 2026-10-18 11:47:05.302914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c83b19e5f7a2'
+down_revision: Union[str, None] = 'a41f7d0e6c28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+data_versions = sa.table(
+    'data_versions',
+    sa.column('NAME', sa.String),
+    sa.column('VERSION', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.bulk_insert(data_versions, [
+        {'NAME': 'games', 'VERSION': 0},
+        {'NAME': 'quarters', 'VERSION': 0},
+        {'NAME': 'standings', 'VERSION': 0},
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(data_versions.delete().where(data_versions.c.NAME.in_(['games', 'quarters', 'standings'])))
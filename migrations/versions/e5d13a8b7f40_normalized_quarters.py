@@ -0,0 +1,89 @@
+"""normalized quarters: NUMBER, HOME_POINTS, VISITING_POINTS instead of QUARTERS string
+
+Revision ID: e5d13a8b7f40
+Revises: c83b19e5f7a2
+Create Date: 2026-10-18 14:05:51.620417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5d13a8b7f40'
+down_revision: Union[str, None] = 'c83b19e5f7a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+quarters = sa.table(
+    'quarters',
+    sa.column('ID', sa.Integer),
+    sa.column('GAME_ID', sa.Integer),
+    sa.column('QUARTERS', sa.String),
+    sa.column('NUMBER', sa.Integer),
+    sa.column('HOME_POINTS', sa.Integer),
+    sa.column('VISITING_POINTS', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('quarters', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('NUMBER', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('HOME_POINTS', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('VISITING_POINTS', sa.Integer(), nullable=True))
+
+    # Разбор строк "<home>:<visiting>" и нумерация четвертей игры в порядке добавления (по ID)
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(quarters.c.ID, quarters.c.GAME_ID, quarters.c.QUARTERS).order_by(quarters.c.GAME_ID, quarters.c.ID)
+    ).all()
+    numbers: dict[int, int] = {}
+    values = []
+    for row in rows:
+        numbers[row.GAME_ID] = numbers.get(row.GAME_ID, 0) + 1
+        home_points, visiting_points = [int(points) for points in row.QUARTERS.split(":")]
+        values.append({
+            'quarter_id': row.ID,
+            'NUMBER': numbers[row.GAME_ID],
+            'HOME_POINTS': home_points,
+            'VISITING_POINTS': visiting_points,
+        })
+    if values:
+        connection.execute(
+            quarters.update()
+            .where(quarters.c.ID == sa.bindparam('quarter_id'))
+            .values(
+                NUMBER=sa.bindparam('NUMBER'),
+                HOME_POINTS=sa.bindparam('HOME_POINTS'),
+                VISITING_POINTS=sa.bindparam('VISITING_POINTS'),
+            ),
+            values
+        )
+
+    with op.batch_alter_table('quarters', schema=None) as batch_op:
+        batch_op.alter_column('NUMBER', existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column('HOME_POINTS', existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column('VISITING_POINTS', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('QUARTERS')
+        batch_op.create_index('ix_quarters_GAME_ID_NUMBER', ['GAME_ID', 'NUMBER'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('quarters', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('QUARTERS', sa.String(length=50), nullable=True))
+
+    op.execute(
+        quarters.update().values(
+            QUARTERS=sa.cast(quarters.c.HOME_POINTS, sa.String) + ':' + sa.cast(quarters.c.VISITING_POINTS, sa.String)
+        )
+    )
+
+    with op.batch_alter_table('quarters', schema=None) as batch_op:
+        batch_op.drop_index('ix_quarters_GAME_ID_NUMBER')
+        batch_op.drop_column('VISITING_POINTS')
+        batch_op.drop_column('HOME_POINTS')
+        batch_op.drop_column('NUMBER')
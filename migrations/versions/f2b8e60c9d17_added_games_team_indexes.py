@@ -0,0 +1,36 @@
+"""added covering indexes on games for team stats
+
+Revision ID: f2b8e60c9d17
+Revises: e5d13a8b7f40
+Create Date: 2026-10-18 14:48:12.905361
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8e60c9d17'
+down_revision: Union[str, None] = 'e5d13a8b7f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_games_HOME_TEAM_ID_scores', ['HOME_TEAM_ID', 'HOME_TEAM_SCORE', 'VISITING_TEAM_SCORE'], unique=False
+        )
+        batch_op.create_index(
+            'ix_games_VISITING_TEAM_ID_scores', ['VISITING_TEAM_ID', 'VISITING_TEAM_SCORE', 'HOME_TEAM_SCORE'], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_index('ix_games_VISITING_TEAM_ID_scores')
+        batch_op.drop_index('ix_games_HOME_TEAM_ID_scores')
@@ -4,9 +4,13 @@ Blueprint: game_route. Содержит роуты для /api/v1/games
 
 from flask import Blueprint, jsonify, current_app, request
 
+from above_the_rim.errors.pagination_errors import InvalidPaginationError
 from above_the_rim.errors.team_errors import TeamNotFoundError, InvalidTeamShortError
 from above_the_rim.services.game_service import GameService
+from above_the_rim.services.responses import WRONG_PAGINATION_RESPONSE, build_games_response
 from above_the_rim.services.team_service import TeamService
+from above_the_rim.database.repositories.data_version import TEAMS_VERSION, GAMES_VERSION
+from above_the_rim.utils import get_page_params, conditional_by_data_versions
 
 game_route = Blueprint('game', __name__, url_prefix='/api/v1/games')
 
@@ -29,24 +33,33 @@ def _get_game_service() -> GameService:
     return current_app.service_factory.get_game_service()
 
 @game_route.route('/', methods=['GET'])
+@conditional_by_data_versions(TEAMS_VERSION, GAMES_VERSION, cache=True)
 def get_games():
     """
-    Возвращает полный список игр (Game)
+    Возвращает полный список игр (Game), либо страницу игр при keyset-пагинации
+
+    Args:
+        Query string (опционально):
+            limit (int): размер страницы, 1..1000 (по умолчанию 100, если указан только after_id)
+            after_id (int): курсор - next_cursor из предыдущей страницы
 
     Returns:
+        400 BAD REQUEST: {"success": false, "data": "Wrong pagination parameters"}
         200 OK: {"success": true, "data": {
             "1": "Chicago Wizards 123:89 Prague Gulls",
             "2": "Prague Gulls 76:67 Chicago Wizards"
         }}
+        200 OK (с пагинацией): {"success": true, "data": {...}, "next_cursor": 2}
+            next_cursor равен null на последней странице
     """
     game_service = _get_game_service()
-    games = game_service.get_all_games()
-    games_data = {
-        game.ID: f"{game.home_team.NAME} {game.HOME_TEAM_SCORE}:{game.VISITING_TEAM_SCORE} {game.visiting_team.NAME}"
-        for game in games
-    }
-    response = {"data": games_data, "success": True}
-    return jsonify(response), 200
+    try:
+        page_params = get_page_params(request.args)
+    except InvalidPaginationError:
+        return jsonify(WRONG_PAGINATION_RESPONSE), 400
+
+    games, next_cursor = game_service.get_game_rows_by_page_params(page_params)
+    return jsonify(build_games_response(games, page_params, next_cursor)), 200
 
 @game_route.route('/', methods=['POST'])
 def add_game():
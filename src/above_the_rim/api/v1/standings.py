@@ -0,0 +1,36 @@
+"""
+Blueprint: standings_route. Содержит роуты для /api/v1/standings
+"""
+
+from flask import Blueprint, jsonify, current_app
+
+from above_the_rim.database.repositories.data_version import TEAMS_VERSION, GAMES_VERSION, STANDINGS_VERSION
+from above_the_rim.services.team_service import TeamService
+from above_the_rim.utils import conditional_by_data_versions
+
+standings_route = Blueprint('standings', __name__, url_prefix='/api/v1/standings')
+
+def _get_team_service() -> TeamService:
+    """
+    Дает TeamService из current_app. Служит для единообразия получения сервиса в контроллерах
+
+    Returns:
+        TeamService: сервис реализующий бизнес-логику работы с Team
+    """
+    return current_app.service_factory.get_team_service()
+
+@standings_route.route('/', methods=['GET'])
+@conditional_by_data_versions(TEAMS_VERSION, GAMES_VERSION, STANDINGS_VERSION)
+def get_standings():
+    """
+    Возвращает турнирную таблицу: победы и поражения всех команд, посчитанные одним запросом
+
+    Returns:
+        200 OK: {"success": true, "data": [
+            {"name": "Prague Giants", "short": "PRG", "win": 3, "lost": 1},
+            {"name": "Chicago Wizards", "short": "CHW", "win": 1, "lost": 3}
+        ]}
+    """
+    team_service = _get_team_service()
+    standings = team_service.get_standings()
+    return jsonify({"success": True, "data": standings}), 200
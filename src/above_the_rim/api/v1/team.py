@@ -5,8 +5,11 @@ Blueprint: team_route. Содержит роуты для /api/v1/team (/api/v1/
 from flask import Blueprint, jsonify, current_app, request
 from sqlalchemy.exc import IntegrityError
 
-from above_the_rim.errors.team_errors import InvalidTeamShortError, TeamNotFoundError, TeamAlreadyExistsError
+from above_the_rim.errors.team_errors import InvalidTeamShortError, TeamNotFoundError, TeamAlreadyExistsError, SameTeamError
+from above_the_rim.database.repositories.data_version import TEAMS_VERSION, GAMES_VERSION
+from above_the_rim.services.responses import build_teams_response
 from above_the_rim.services.team_service import TeamService
+from above_the_rim.utils import conditional_by_data_versions
 
 team_route = Blueprint('team', __name__, url_prefix='/api/v1')
 
@@ -20,6 +23,7 @@ def get_team_service() -> TeamService:
     return current_app.service_factory.get_team_service()
 
 @team_route.route('/teams', methods=['GET'])
+@conditional_by_data_versions(TEAMS_VERSION)
 def get_teams():
     """
     Возвращает полный список команд
@@ -29,11 +33,7 @@ def get_teams():
 
     """
     team_service = get_team_service()
-    teams = team_service.get_all_teams()
-    teams_for_response = dict()
-    for team in teams:
-        teams_for_response[team.SHORT] = team.NAME
-    return jsonify({"data": teams_for_response, "success": True}), 200
+    return jsonify(build_teams_response(team_service.get_all_teams())), 200
 
 @team_route.route("/teams", methods=['POST'])
 def add_team():
@@ -119,4 +119,44 @@ def get_team_stats(short):
             "data": team_stats
         }), 200
     except (InvalidTeamShortError, TeamNotFoundError) as e:
-        return jsonify({"success": False, "data": f"There is no team {short}"}), 400
\ No newline at end of file
+        return jsonify({"success": False, "data": f"There is no team {short}"}), 400
+
+@team_route.route('team/<short>/vs/<other>', methods=['GET'])
+@conditional_by_data_versions(TEAMS_VERSION, GAMES_VERSION)
+def get_head_to_head(short, other):
+    """
+    Возвращает очные встречи команды short с командой other
+
+    Args:
+        short (str): 3 буквы, латиница, верхний регистр
+        other (str): соперник, 3 буквы, латиница, верхний регистр
+
+    Validation:
+    - формат short и other
+    - short и other - разные команды
+
+    Returns:
+        400 BAD REQUEST: {"success": false, "data": "Wrong team short"}
+        400 BAD REQUEST: {"success": false, "data": "Team cannot play against itself"}
+        200 OK: {"success": true, "data": {
+            "team": {"name": "Example Team", "short": "EXP"},
+            "opponent": {"name": "Other Team", "short": "OTH"},
+            "games": 5,
+            "win": 3,
+            "lost": 2,
+            "home": {"games": 3, "win": 2, "lost": 1},
+            "away": {"games": 2, "win": 1, "lost": 1},
+            "average_margin": 4.2
+        }}
+
+    """
+    team_service: TeamService = get_team_service()
+    try:
+        team_service.validate_team_short_or_rise(short)
+        team_service.validate_team_short_or_rise(other)
+        head_to_head = team_service.get_head_to_head(short, other)
+    except (InvalidTeamShortError, TeamNotFoundError):
+        return jsonify({"success": False, "data": "Wrong team short"}), 400
+    except SameTeamError:
+        return jsonify({"success": False, "data": "Team cannot play against itself"}), 400
+    return jsonify({"success": True, "data": head_to_head}), 200
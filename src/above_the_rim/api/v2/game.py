@@ -2,13 +2,21 @@
 Blueprint: game_route_v2. Содержит роуты для /api/v2/games
 """
 
-from flask import Blueprint, jsonify, current_app, request
+from typing import Optional
 
-from above_the_rim.errors.game_errors import GameNotFoundError
+from flask import Blueprint, jsonify, current_app, request, Response, stream_with_context
+
+from above_the_rim.errors.game_errors import (
+    GameNotFoundError, InvalidQuarterError, GameUpdateConflictError, QuarterQueueFullError, QuarterQueueClosedError
+)
+from above_the_rim.errors.pagination_errors import InvalidPaginationError
 from above_the_rim.errors.team_errors import InvalidTeamShortError, TeamNotFoundError
 from above_the_rim.services.game_service import GameService
+from above_the_rim.services.responses import WRONG_PAGINATION_RESPONSE, build_games_with_quarters_response
 from above_the_rim.services.team_service import TeamService
 from above_the_rim.database.models import Game
+from above_the_rim.database.repositories.data_version import TEAMS_VERSION, GAMES_VERSION, QUARTERS_VERSION
+from above_the_rim.utils import get_page_params, conditional_by_data_versions
 
 game_route_v2 = Blueprint("game_v2", __name__, url_prefix="/api/v2/games")
 
@@ -70,10 +78,104 @@ def create_game():
 
     return jsonify({"success": True, "data": added_game.ID}), 201
 
+def _validate_batch_game(game_data) -> Optional[str]:
+    """
+    Проверяет одну игру из пачки /api/v2/games/batch
+
+    Args:
+        game_data: элемент JSON-массива
+
+    Returns:
+        None: игра валидна
+        str: сообщение об ошибке для ответа
+    """
+    if not isinstance(game_data, dict):
+        return "Wrong game format"
+    for key in ("home_team", "visiting_team"):
+        if not isinstance(game_data.get(key), str) or not TeamService.validate_team_short(game_data[key]):
+            return "Wrong team short"
+    for key in ("home_team_score", "visiting_team_score"):
+        score = game_data.get(key, 0)
+        if not isinstance(score, int) or isinstance(score, bool) or score < 0:
+            return "Wrong score format"
+    quarters = game_data.get("quarters", [])
+    if not isinstance(quarters, list):
+        return "Wrong quarters format"
+    try:
+        for quarter in quarters:
+            if not isinstance(quarter, str):
+                return "Wrong quarters format"
+            GameService.parse_quarter(quarter)
+    except InvalidQuarterError:
+        return "Wrong quarters format"
+    return None
+
+@game_route_v2.route("/batch", methods=["POST"])
+def create_games_batch():
+    """
+    Добавляет пачку Games (опционально со счетом и Quarters) в одной транзакции.
+    Игры с ошибками пропускаются, остальные добавляются
+
+    Args:
+        JSON body:
+            [
+              {"home_team": "PRW", "visiting_team": "CHG", "quarters": ["12:20", "21:12"]},
+              {"home_team": "CHG", "visiting_team": "PRW", "home_team_score": 76, "visiting_team_score": 67}
+            ]
+            home_team_score/visiting_team_score по умолчанию 0, итоговый счет - они плюс сумма quarters
+
+    Returns:
+        400 BAD REQUEST: {"success": false, "data": "Expected a list of games"}
+        400 BAD REQUEST: {"success": false, "data": "Too many games in batch, max <GAMES_BATCH_MAX_SIZE>"}
+        201 CREATED: {
+            "success": true,
+            "data": [
+                {"success": true, "data": <GAME_ID>},
+                {"success": false, "data": "Wrong team short"}
+            ]
+        }
+        Результаты в порядке игр в запросе
+    """
+    game_service = _get_game_service()
+    request_data = request.get_json(silent=True)
+    if not isinstance(request_data, list):
+        return jsonify({"success": False, "data": "Expected a list of games"}), 400
+
+    max_size = current_app.config.get("GAMES_BATCH_MAX_SIZE", 10_000)
+    if len(request_data) > max_size:
+        return jsonify({"success": False, "data": f"Too many games in batch, max {max_size}"}), 400
+
+    results = [None] * len(request_data)
+    positions, games = [], []
+    for position, game_data in enumerate(request_data):
+        error = _validate_batch_game(game_data)
+        if error is not None:
+            results[position] = {"success": False, "data": error}
+            continue
+        positions.append(position)
+        games.append({
+            "home_short": game_data["home_team"],
+            "visiting_short": game_data["visiting_team"],
+            "home_score": game_data.get("home_team_score", 0),
+            "visiting_score": game_data.get("visiting_team_score", 0),
+            "quarters": game_data.get("quarters", []),
+        })
+
+    game_ids = game_service.add_games_batch(games) if games else []
+    for position, game_id in zip(positions, game_ids):
+        if game_id is None:
+            results[position] = {"success": False, "data": "Wrong team short"}
+        else:
+            results[position] = {"success": True, "data": game_id}
+
+    return jsonify({"success": True, "data": results}), 201
+
 @game_route_v2.route("/<game_id>", methods=["POST"])
 def add_quarters(game_id: int):
     """
-    Добавляет счет одной четвертой игры в БД
+    Добавляет счет одной четвертой игры в БД.
+    При включенной очереди отложенной записи (QUARTER_QUEUE_ENABLED) четверть только проверяется
+    и ставится в очередь, а в БД попадает с ближайшей пачкой - ответ 202
 
     Args:
         PATH variables:
@@ -86,23 +188,53 @@ def add_quarters(game_id: int):
 
     Returns:
         400 BAD REQUEST: {'success': False, 'data': 'There is no game with id <GAME_ID>'}
+        400 BAD REQUEST: {"success": false, "data": "Wrong quarters format"}
+        409 CONFLICT: {"success": false, "data": "Game score was updated concurrently, try again"}
+        503 SERVICE UNAVAILABLE: {"success": false, "data": "Quarter queue is full, try again later"}
+        503 SERVICE UNAVAILABLE: {"success": false, "data": "Quarter queue is not running, try again later"}
         200 OK: {"success": True, "data": "Score updated"}
+        202 ACCEPTED: {"success": true, "data": "Quarter accepted"}
     """
     game_service = _get_game_service()
     request_data = request.get_json()
+    quarter_queue = current_app.quarter_queue
+    if quarter_queue is not None:
+        try:
+            quarter_queue.put(*game_service.validate_game_quarter(game_id, request_data['quarters']))
+        except GameNotFoundError:
+            return jsonify({f'success': False, 'data': f'There is no game with id {game_id}'}), 400
+        except InvalidQuarterError:
+            return jsonify({"success": False, "data": "Wrong quarters format"}), 400
+        except QuarterQueueFullError:
+            return jsonify({"success": False, "data": "Quarter queue is full, try again later"}), 503, {"Retry-After": "1"}
+        except QuarterQueueClosedError:
+            return jsonify({"success": False, "data": "Quarter queue is not running, try again later"}), 503
+        return jsonify({"success": True, "data": "Quarter accepted"}), 202
+
     try:
         game_service.add_game_quarter(game_id, request_data['quarters'])
     except GameNotFoundError:
         return jsonify({f'success': False, 'data': f'There is no game with id {game_id}'}), 400
+    except InvalidQuarterError:
+        return jsonify({"success": False, "data": "Wrong quarters format"}), 400
+    except GameUpdateConflictError:
+        return jsonify({"success": False, "data": "Game score was updated concurrently, try again"}), 409
 
     return jsonify({"success": True, "data": "Score updated"}), 201
 
 @game_route_v2.route("/", methods=["GET"])
+@conditional_by_data_versions(TEAMS_VERSION, GAMES_VERSION, QUARTERS_VERSION, cache=True)
 def get_games():
     """
-    Возвращает список Games с дополнительными данными по Quarters
+    Возвращает список Games с дополнительными данными по Quarters, либо страницу при keyset-пагинации
+
+    Args:
+        Query string (опционально):
+            limit (int): размер страницы, 1..1000 (по умолчанию 100, если указан только after_id)
+            after_id (int): курсор - next_cursor из предыдущей страницы
 
     Returns:
+        400 BAD REQUEST: {"success": false, "data": "Wrong pagination parameters"}
         200 OK: {
             "success": True,
              "data": {
@@ -111,14 +243,44 @@ def get_games():
                "3": "Prague Wizards 33:32 Chicago Gulls (12:20,21:12)"
             }
         }
+        200 OK (с пагинацией): {"success": true, "data": {...}, "next_cursor": 3}
+            next_cursor равен null на последней странице
+    """
+    game_service = _get_game_service()
+    try:
+        page_params = get_page_params(request.args)
+    except InvalidPaginationError:
+        return jsonify(WRONG_PAGINATION_RESPONSE), 400
+
+    games_with_quarters, next_cursor = game_service.get_games_with_quarters_by_page_params(page_params)
+    return jsonify(build_games_with_quarters_response(games_with_quarters, page_params, next_cursor)), 200
+
+@game_route_v2.route("/export", methods=["GET"])
+@conditional_by_data_versions(TEAMS_VERSION, GAMES_VERSION, QUARTERS_VERSION, compressible=False)
+def export_games():
+    """
+    Потоковая выгрузка всех Games с Quarters в формате NDJSON (один JSON-объект на строку).
+    Ответ формируется генератором по мере чтения из БД, полный список в памяти не собирается.
+    Строки сериализуются JSON-провайдером приложения (app.json) в компактном виде, как и остальные ответы
+
+    Returns:
+        200 OK (application/x-ndjson):
+            {"home_team":"Prague Gulls","home_team_score":33,"id":1,"quarters":["12:20","21:12"],"visiting_team":"Chicago Wizards","visiting_team_score":32}
+            {"home_team":"Chicago Wizards",...}
     """
     game_service = _get_game_service()
-    games_with_quarters = game_service.get_all_games_with_quarters()
-    games_data = {}
-    for gm in games_with_quarters:
-        game = gm["game"]
-        quarters = gm["quarters"]
-        quarters_str = f" ({','.join([q.QUARTERS for q in quarters])})" if len(quarters) else ""
-        games_data[game.ID] = f"{game.home_team.NAME} {game.HOME_TEAM_SCORE}:{game.VISITING_TEAM_SCORE} {game.visiting_team.NAME}{quarters_str}"
-    response = {"data": games_data, "success": True}
-    return jsonify(response), 200
\ No newline at end of file
+    json_provider = current_app.json
+
+    def generate():
+        for gm in game_service.iter_games_with_quarters():
+            game = gm["game"]
+            yield json_provider.dumps({
+                "id": game.ID,
+                "home_team": game.HOME_TEAM_NAME,
+                "home_team_score": game.HOME_TEAM_SCORE,
+                "visiting_team": game.VISITING_TEAM_NAME,
+                "visiting_team_score": game.VISITING_TEAM_SCORE,
+                "quarters": gm["quarters"],
+            }, separators=(",", ":")) + "\n"
+
+    return Response(stream_with_context(generate()), status=200, mimetype="application/x-ndjson")
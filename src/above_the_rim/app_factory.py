@@ -2,11 +2,18 @@ import os
 from flask import Flask
 
 from above_the_rim.configs.base import BaseConfig
-from above_the_rim.database.db import init_db
+from above_the_rim.database.db import init_db, get_engine_options
 from above_the_rim.services.repository_factory import RepositoryFactory
 from above_the_rim.services.service_factory import ServiceFactory
+from above_the_rim.services.team_registry import TeamRegistry
 from above_the_rim.utils import register_blueprints
 from above_the_rim.error_handlers import register_error_handlers
+from above_the_rim.session_lifecycle import register_session_lifecycle
+from above_the_rim.sql_instrumentation import register_sql_instrumentation
+from above_the_rim.response_cache import ResponseCache
+from above_the_rim.response_compression import ResponseCompressor, register_response_compression
+from above_the_rim.request_metrics import RequestMetrics, register_request_metrics
+from above_the_rim.json_provider import FastJSONProvider
 
 def create_app(config: BaseConfig):
     """
@@ -20,25 +27,104 @@ def create_app(config: BaseConfig):
         которое нужно только запустить с нужными параметрами
     """
     app = Flask(__name__, root_path=os.getcwd())
+    app.config.from_object(config)
+    # jsonify и app.json.response - через orjson (если установлен) с тем же результатом, что у json
+    app.json = FastJSONProvider(app, use_orjson=config.JSON_ORJSON_ENABLED)
 
     register_error_handlers(app)
 
-    db = init_db(config.DB_URL)
+    db = init_db(config.DB_URL, **get_engine_options(config))
     app.db = db
 
+    app.request_metrics = None
+    if config.METRICS_ENABLED:
+        # Первым среди before_request - в длительность запроса входит работа остальных хуков
+        app.request_metrics = RequestMetrics()
+        register_request_metrics(app, db, app.request_metrics)
+
     repo_factory = RepositoryFactory(db)
-    service_factory = ServiceFactory(db, repo_factory)
+
+    # Справочник команд в памяти процесса, прогревается до первого запроса
+    team_registry = TeamRegistry(
+        repo_factory.get_team_repository(),
+        repo_factory.get_data_version_repository(),
+        check_interval=config.TEAM_REGISTRY_CHECK_INTERVAL
+    )
+    team_registry.warm()
+    app.team_registry = team_registry
+    # Сессия, открытая при прогреве, не должна переходить в первый запрос
+    db.remove()
+    register_session_lifecycle(app, db, read_only_get=config.DB_READ_ONLY_GET)
+    if config.SQL_INSTRUMENTATION_ENABLED:
+        register_sql_instrumentation(app, db)
+
+    service_factory = ServiceFactory(
+        db, repo_factory, team_registry,
+        optimistic_score_updates=config.GAME_SCORE_OPTIMISTIC_UPDATES,
+        score_update_retries=config.GAME_SCORE_UPDATE_RETRIES
+    )
     app.service_factory = service_factory
 
+    app.quarter_queue = None
+    if config.QUARTER_QUEUE_ENABLED:
+        import atexit
+        from above_the_rim.services.quarter_queue import QuarterQueue
+
+        quarter_queue = QuarterQueue(
+            service_factory.get_game_service, db,
+            max_size=config.QUARTER_QUEUE_MAX_SIZE,
+            batch_size=config.QUARTER_QUEUE_BATCH_SIZE,
+            flush_interval=config.QUARTER_QUEUE_FLUSH_INTERVAL,
+            put_timeout=config.QUARTER_QUEUE_PUT_TIMEOUT
+        )
+        quarter_queue.start()
+        # Принятые, но еще не записанные четверти дописываются при завершении процесса
+        atexit.register(quarter_queue.stop)
+        app.quarter_queue = quarter_queue
+
+    app.response_compressor = None
+    if config.RESPONSE_COMPRESSION_ENABLED:
+        app.response_compressor = ResponseCompressor(
+            min_size=config.RESPONSE_COMPRESSION_MIN_SIZE,
+            gzip_level=config.RESPONSE_COMPRESSION_GZIP_LEVEL,
+            brotli_quality=config.RESPONSE_COMPRESSION_BROTLI_QUALITY
+        )
+        register_response_compression(app, app.response_compressor)
+
+    app.response_cache = None
+    if config.RESPONSE_CACHE_ENABLED:
+        # Сжатые версии закэшированных ответов хранятся в кэше и не сжимаются заново на каждый запрос
+        app.response_cache = ResponseCache(
+            config.RESPONSE_CACHE_MAX_BYTES,
+            gzip_enabled=config.RESPONSE_CACHE_GZIP,
+            compressor=app.response_compressor
+        )
+
+    # Без сканирования пакетов - по явному списку utils.BLUEPRINT_MANIFEST
+    use_manifest = config.BLUEPRINT_MANIFEST_ENABLED
+
     # Автоматическая регистрация всех блюпринтов из пакета v1
     from above_the_rim.api.v1 import __path__ as api_v1_path
-    register_blueprints(app, "above_the_rim.api.v1", api_v1_path[0])
+    register_blueprints(app, "above_the_rim.api.v1", api_v1_path[0], use_manifest)
 
     # Автоматическая регистрация всех блюпринтов из пакета v1
     from above_the_rim.api.v2 import __path__ as api_v2_path
-    register_blueprints(app, "above_the_rim.api.v2", api_v2_path[0])
+    register_blueprints(app, "above_the_rim.api.v2", api_v2_path[0], use_manifest)
 
     from above_the_rim.pages import __path__ as pages_path
-    register_blueprints(app, "above_the_rim.pages", pages_path[0])
+    register_blueprints(app, "above_the_rim.pages", pages_path[0], use_manifest)
+
+    if config.METRICS_ENABLED:
+        from above_the_rim.monitoring import __path__ as monitoring_path
+        register_blueprints(app, "above_the_rim.monitoring", monitoring_path[0], use_manifest)
+
+    if config.PROFILER_ENABLED:
+        from above_the_rim.request_profiler import RequestProfiler
+
+        app.wsgi_app = RequestProfiler(
+            app.wsgi_app, app.url_map, config.PROFILER_DIR,
+            secret=config.PROFILER_SECRET,
+            sample_rates=config.PROFILER_SAMPLE_RATES
+        )
 
     return app
\ No newline at end of file
@@ -0,0 +1,284 @@
+"""
+ASGI-режим: асинхронные роуты для частых GET-запросов (списки команд и игр) поверх SQLAlchemy asyncio,
+все остальные запросы передаются в Flask-приложение через WsgiToAsgi.
+
+Ожидание БД не занимает поток, поэтому один процесс держит тысячи одновременных медленных клиентов
+(например, опрашивающих счет). Ответы совпадают с Flask-роутами байт в байт, включая ETag и 304
+
+Запуск:
+    uvicorn basketball_asgi:app
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Awaitable, Callable, NamedTuple, Optional
+from urllib.parse import parse_qsl
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from flask import Flask
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from werkzeug.datastructures import Headers, MultiDict
+from werkzeug.http import parse_accept_header, parse_etags
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.conditional_response import (
+    PreparedResponse, find_prepared_response, prepare_response, store_response
+)
+from above_the_rim.configs.base import BaseConfig
+from above_the_rim.database.async_db import init_async_db
+from above_the_rim.database.db import get_engine_options, set_read_only
+from above_the_rim.errors.pagination_errors import InvalidPaginationError
+from above_the_rim.services.async_service_factory import AsyncServiceFactory
+from above_the_rim.services.data_version_service import DataVersionService
+from above_the_rim.services.responses import (
+    WRONG_PAGINATION_RESPONSE, build_games_response, build_games_with_quarters_response, build_teams_response
+)
+from above_the_rim.sql_instrumentation import instrument_engine, query_stats_headers, record_queries
+from above_the_rim.utils import get_page_params
+
+# Обработчик роута: (сервисы запроса, query string) -> (HTTP-статус, тело ответа для JSON)
+RouteHandler = Callable[[AsyncServiceFactory, MultiDict], Awaitable[tuple[int, dict]]]
+
+
+async def get_teams(services: AsyncServiceFactory, args: MultiDict) -> tuple[int, dict]:
+    """
+    GET /api/v1/teams, см. above_the_rim.api.v1.team.get_teams
+    """
+    return 200, build_teams_response(await services.get_team_service().get_all_teams())
+
+
+async def get_games_v1(services: AsyncServiceFactory, args: MultiDict) -> tuple[int, dict]:
+    """
+    GET /api/v1/games/, см. above_the_rim.api.v1.game.get_games
+    """
+    try:
+        page_params = get_page_params(args)
+    except InvalidPaginationError:
+        return 400, WRONG_PAGINATION_RESPONSE
+    games, next_cursor = await services.get_game_service().get_game_rows_by_page_params(page_params)
+    return 200, build_games_response(games, page_params, next_cursor)
+
+
+async def get_games_v2(services: AsyncServiceFactory, args: MultiDict) -> tuple[int, dict]:
+    """
+    GET /api/v2/games/, см. above_the_rim.api.v2.game.get_games
+    """
+    try:
+        page_params = get_page_params(args)
+    except InvalidPaginationError:
+        return 400, WRONG_PAGINATION_RESPONSE
+    games_with_quarters, next_cursor = await services.get_game_service().get_games_with_quarters_by_page_params(
+        page_params
+    )
+    return 200, build_games_with_quarters_response(games_with_quarters, page_params, next_cursor)
+
+
+# path -> (обработчик, endpoint Flask-роута с тем же ответом). Пути совпадают с Flask-роутами (с завершающим "/",
+# как у них); остальные варианты (например, без "/") уходят во Flask и получают его редирект.
+# Наборы данных для ETag и кэширование ответа берутся из Flask-роута (conditional_by_data_versions)
+ROUTES: dict[str, tuple[RouteHandler, str]] = {
+    "/api/v1/teams": (get_teams, "team.get_teams"),
+    "/api/v1/games/": (get_games_v1, "game.get_games"),
+    "/api/v2/games/": (get_games_v2, "game_v2.get_games"),
+}
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    """
+    WsgiToAsgi, выполняющий WSGI-приложение в ограниченном пуле потоков.
+
+    Стандартный WsgiToAsgi вызывает приложение через sync_to_async(thread_sensitive=True) - все запросы
+    стоят в очереди к одному общему потоку, и запись, турнирная таблица или выгрузка в ASGI-режиме
+    обслуживаются медленнее, чем многопоточным Flask
+    """
+
+    def __init__(self, wsgi_application: Callable, executor: ThreadPoolExecutor):
+        super().__init__(wsgi_application)
+        self.executor = executor
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable):
+        await _ThreadPoolWsgiToAsgiInstance(self.wsgi_application, self.duplicate_header_limit, self.executor)(
+            scope, receive, send
+        )
+
+
+class _ThreadPoolWsgiToAsgiInstance(WsgiToAsgiInstance):
+    # В WsgiToAsgiInstance run_wsgi_app - синхронная функция, обернутая декоратором sync_to_async
+    _run_wsgi_app_sync = WsgiToAsgiInstance.__dict__["run_wsgi_app"].func
+
+    def __init__(self, wsgi_application: Callable, duplicate_header_limit: int, executor: ThreadPoolExecutor):
+        super().__init__(wsgi_application, duplicate_header_limit)
+        self.executor = executor
+
+    async def run_wsgi_app(self, body):
+        await sync_to_async(self._run_wsgi_app_sync, thread_sensitive=False, executor=self.executor)(body)
+
+
+class AsyncRoute(NamedTuple):
+    """
+    Асинхронный роут: обработчик и параметры ответа его Flask-двойника
+    """
+    handler: RouteHandler
+    endpoint: str
+    version_names: tuple[str, ...]
+    cached: bool
+    compressible: bool
+
+
+class AsgiApp:
+    """
+    ASGI-приложение: асинхронные GET-роуты из ROUTES, остальное - Flask-приложение.
+
+    Остальные запросы выполняет Flask в пуле из ASGI_WSGI_THREADS потоков (ThreadPoolWsgiToAsgi).
+
+    Асинхронные роуты отвечают через ту же логику, что и Flask-роуты (conditional_response, services.responses):
+    ETag и 304, общий с Flask кэш готовых ответов, сжатие, сессия только для чтения, учет SQL-запросов
+    (SQL_INSTRUMENTATION_ENABLED) и метрики (METRICS_ENABLED). Запросы с заголовком X-Profile при включенном
+    профилировщике передаются во Flask - профилировщик работает как WSGI-middleware
+    """
+
+    def __init__(self, flask_app: Flask, session_maker: async_sessionmaker[AsyncSession]):
+        self.flask_app = flask_app
+        self.session_maker = session_maker
+        self.wsgi_executor = ThreadPoolExecutor(
+            max_workers=flask_app.config.get("ASGI_WSGI_THREADS", 16), thread_name_prefix="wsgi"
+        )
+        self.wsgi_app = ThreadPoolWsgiToAsgi(flask_app, self.wsgi_executor)
+        self.routes: dict[str, AsyncRoute] = {}
+        for path, (handler, endpoint) in ROUTES.items():
+            view = flask_app.view_functions[endpoint]
+            self.routes[path] = AsyncRoute(
+                handler, endpoint, view.data_versions, view.response_cached, view.response_compressible
+            )
+        self.read_only = flask_app.config.get("DB_READ_ONLY_GET", True)
+        self.profiler_enabled = flask_app.config.get("PROFILER_ENABLED", False)
+        self.sql_instrumentation = flask_app.config.get("SQL_INSTRUMENTATION_ENABLED", False)
+        if self.sql_instrumentation:
+            instrument_engine(session_maker.kw["bind"].sync_engine)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        route = self.routes.get(scope.get("path")) if scope["type"] == "http" else None
+        if route is None or scope["method"] not in ("GET", "HEAD") or self._is_profiled(scope):
+            await self.wsgi_app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        with record_queries() if self.sql_instrumentation else nullcontext() as query_stats:
+            prepared = await self._handle(scope, route)
+        headers = self._encode_headers(prepared)
+        if query_stats is not None:
+            headers.extend((name.lower().encode("latin-1"), value.encode("latin-1"))
+                           for name, value in query_stats_headers(query_stats))
+        await send({"type": "http.response.start", "status": prepared.status, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else prepared.body})
+
+        metrics = self.flask_app.request_metrics
+        if metrics is not None:
+            metrics.observe_request(
+                route.endpoint, scope["method"], prepared.status, time.perf_counter() - started_at, query_stats
+            )
+
+    def _is_profiled(self, scope: dict) -> bool:
+        """
+        Запрос на профилирование (X-Profile) - его выполняет Flask под RequestProfiler, секрет проверяет он же
+        """
+        return self.profiler_enabled and any(name == b"x-profile" for name, _ in scope["headers"])
+
+    async def _handle(self, scope: dict, route: AsyncRoute) -> PreparedResponse:
+        """
+        Выполняет обработчик в своей сессии с той же логикой ETag / 304, кэша готовых ответов и сжатия,
+        что и conditional_by_data_versions с response_compression во Flask
+
+        Args:
+            scope (dict): ASGI scope запроса
+            route (AsyncRoute): роут
+
+        Returns:
+            PreparedResponse: ответ
+        """
+        request_headers = Headers([(name.decode("latin-1"), value.decode("latin-1")) for name, value in scope["headers"]])
+        query_string = scope.get("query_string", b"")
+        args = MultiDict(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+        accept_encodings = parse_accept_header(request_headers.get("Accept-Encoding"))
+        response_cache = self.flask_app.response_cache if route.cached else None
+        # Ключ как у Flask-роута - асинхронный и Flask-роут пользуются одними записями кэша
+        cache_key = (route.endpoint, query_string)
+
+        async with self.session_maker() as session:
+            if self.read_only:
+                set_read_only(session.sync_session)
+            services = AsyncServiceFactory(session)
+            versions = await services.get_data_version_repository().get_versions(route.version_names)
+            etag = DataVersionService.format_etag(versions)
+            prepared = find_prepared_response(
+                etag, parse_etags(request_headers.get("If-None-Match")), accept_encodings, response_cache, cache_key,
+                route.compressible and self.flask_app.response_compressor is not None
+            )
+            if prepared is not None:
+                return prepared
+            status, data = await route.handler(services, args)
+
+        body = self.flask_app.json.response(data).get_data()
+        mimetype = self.flask_app.json.mimetype
+        if status == 200 and response_cache is not None:
+            return store_response(response_cache, cache_key, etag, body, mimetype, accept_encodings)
+        return prepare_response(
+            status, body, mimetype, etag if status == 200 else None, accept_encodings, self.flask_app.response_compressor
+        )
+
+    @staticmethod
+    def _encode_headers(prepared: PreparedResponse) -> list[tuple[bytes, bytes]]:
+        """
+        Заголовки PreparedResponse в формате ASGI
+        """
+        headers = []
+        if prepared.mimetype is not None:
+            headers.append((b"content-type", prepared.mimetype.encode("latin-1")))
+        if prepared.status != 304:
+            headers.append((b"content-length", str(len(prepared.body)).encode("latin-1")))
+        headers.extend((name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in prepared.headers)
+        return headers
+
+    async def _lifespan(self, receive: Callable, send: Callable):
+        """
+        Обрабатывает ASGI lifespan: при остановке закрывает соединения асинхронного engine и пул потоков Flask
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.session_maker.kw["bind"].dispose()
+                self.wsgi_executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app(config: BaseConfig, flask_app: Optional[Flask] = None) -> AsgiApp:
+    """
+    Точка входа в ASGI-режим. Инициализирует Flask-приложение (для записи и остальных роутов)
+    и асинхронный engine для роутов чтения
+
+    Args:
+        config (BaseConfig): конфиг приложения, лежат в above_the_rim.configs.
+            Асинхронный engine подключается к config.ASYNC_DB_URL, по умолчанию - к реплике (READ_DB_URL),
+            если она есть, иначе к DB_URL: асинхронные роуты только читают
+        flask_app (Flask): уже созданное Flask-приложение. По умолчанию создается create_app(config)
+
+    Returns:
+        AsgiApp: ASGI-приложение
+    """
+    flask_app = flask_app or create_app(config)
+    engine_options = get_engine_options(config)
+    session_maker = init_async_db(
+        config.ASYNC_DB_URL or config.READ_DB_URL or config.DB_URL,
+        pool_options=engine_options["pool_options"],
+        sqlite_pragmas=engine_options["sqlite_pragmas"]
+    )
+    return AsgiApp(flask_app, session_maker)
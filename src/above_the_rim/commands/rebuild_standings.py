@@ -0,0 +1,22 @@
+"""
+Команда полной пересборки материализованной турнирной таблицы team_standings по таблице games
+
+Запуск:
+    python -m above_the_rim.commands.rebuild_standings
+"""
+
+from above_the_rim.configs.prod import ProdConfig
+from above_the_rim.database.db import init_db, get_engine_options
+from above_the_rim.services.repository_factory import RepositoryFactory
+from above_the_rim.services.service_factory import ServiceFactory
+
+
+def main():
+    db = init_db(ProdConfig.DB_URL, **get_engine_options(ProdConfig))
+    service_factory = ServiceFactory(db, RepositoryFactory(db))
+    teams_count = service_factory.get_game_service().rebuild_standings()
+    print(f"team_standings rebuilt for {teams_count} teams")
+
+
+if __name__ == '__main__':
+    main()
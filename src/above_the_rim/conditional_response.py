@@ -0,0 +1,162 @@
+"""
+Ответы GET-роутов по версиям данных: 304 по ETag, кэш готовых ответов и выбор сжатого представления.
+Общая логика для Flask (utils.conditional_by_data_versions) и ASGI-режима (above_the_rim.asgi) -
+ответы, заголовки и записи кэша у двух стеков одни и те же
+"""
+
+from typing import Hashable, NamedTuple, Optional
+
+from werkzeug.datastructures import Accept, ETags
+from werkzeug.http import quote_etag
+
+from above_the_rim.response_cache import CachedResponse, ResponseCache
+from above_the_rim.response_compression import (
+    ENCODINGS_PREFERENCE, IDENTITY, ResponseCompressor, compress_for_client, encoded_etag, find_matching_etag,
+    negotiate_encoding
+)
+
+
+class PreparedResponse(NamedTuple):
+    """
+    Готовый ответ, не привязанный к фреймворку: Flask и ASGI-режим переводят его в свой формат
+    """
+    status: int
+    body: bytes
+    mimetype: Optional[str]
+    headers: list[tuple[str, str]]
+
+
+def not_modified_response(
+        etag: str,
+        if_none_match: ETags,
+        accept_encodings: Accept,
+        compressible: bool) -> Optional[PreparedResponse]:
+    """
+    Ответ 304 Not Modified, если в If-None-Match есть ETag представления текущих данных
+
+    Args:
+        etag (str): ETag данных (DataVersionService.format_etag)
+        if_none_match (ETags): If-None-Match запроса
+        accept_encodings (Accept): Accept-Encoding запроса
+        compressible (bool): полный ответ роута может сжиматься - тогда 304 несет тот же Vary: Accept-Encoding,
+            что и 200, иначе промежуточный кэш обновит по нему запись без Vary (RFC 9110, 15.4.5)
+
+    Returns:
+        PreparedResponse: 304 с совпавшим ETag
+        None: данные изменились, нужен полный ответ
+    """
+    # У сжатого и несжатого представлений разные ETag - подходит любое, которое клиент может принять
+    matching_etag = find_matching_etag(etag, if_none_match, accept_encodings)
+    if matching_etag is None:
+        return None
+    headers = [("Vary", "Accept-Encoding")] if compressible else []
+    headers.append(("ETag", quote_etag(matching_etag)))
+    return PreparedResponse(304, b"", None, headers)
+
+
+def cached_response(entry: CachedResponse, accept_encodings: Accept) -> PreparedResponse:
+    """
+    Ответ из записи кэша готовых ответов: сжатые версии уже лежат в записи, выбирается одна из них
+
+    Args:
+        entry (CachedResponse): запись кэша
+        accept_encodings (Accept): Accept-Encoding запроса
+
+    Returns:
+        PreparedResponse: 200 с телом в выбранном сжатии
+    """
+    encoding = negotiate_encoding(
+        accept_encodings, [encoding for encoding in ENCODINGS_PREFERENCE if encoding in entry.bodies]
+    )
+    headers = []
+    if encoding != IDENTITY:
+        headers.append(("Content-Encoding", encoding))
+    if len(entry.bodies) > 1:
+        headers.append(("Vary", "Accept-Encoding"))
+    headers.append(("ETag", quote_etag(encoded_etag(entry.etag, encoding))))
+    return PreparedResponse(200, entry.bodies[encoding], entry.mimetype, headers)
+
+
+def find_prepared_response(
+        etag: str,
+        if_none_match: ETags,
+        accept_encodings: Accept,
+        response_cache: Optional[ResponseCache],
+        cache_key: Hashable,
+        compressible: bool) -> Optional[PreparedResponse]:
+    """
+    Ищет ответ, для которого не нужно выполнять роут: 304 по ETag или готовое тело из кэша
+
+    Args:
+        etag (str): ETag данных
+        if_none_match (ETags): If-None-Match запроса
+        accept_encodings (Accept): Accept-Encoding запроса
+        response_cache (Optional[ResponseCache]): кэш готовых ответов. None - роут не кэшируется
+        cache_key (Hashable): ключ ответа в кэше - (endpoint, query string)
+        compressible (bool): полный ответ роута может сжиматься (см. not_modified_response)
+
+    Returns:
+        PreparedResponse: готовый ответ
+        None: нужно выполнить роут
+    """
+    response = not_modified_response(etag, if_none_match, accept_encodings, compressible)
+    if response is not None or response_cache is None:
+        return response
+    entry = response_cache.get(cache_key, etag)
+    return None if entry is None else cached_response(entry, accept_encodings)
+
+
+def store_response(
+        response_cache: ResponseCache,
+        cache_key: Hashable,
+        etag: str,
+        body: bytes,
+        mimetype: str,
+        accept_encodings: Accept) -> PreparedResponse:
+    """
+    Сохраняет тело успешного ответа в кэш (вместе со сжатыми версиями) и отдает его в нужном сжатии
+
+    Args:
+        response_cache (ResponseCache): кэш готовых ответов
+        cache_key (Hashable): ключ ответа в кэше - (endpoint, query string)
+        etag (str): ETag данных, по которым построен ответ
+        body (bytes): сериализованное тело ответа
+        mimetype (str): mimetype ответа
+        accept_encodings (Accept): Accept-Encoding запроса
+
+    Returns:
+        PreparedResponse: 200 с телом в выбранном сжатии
+    """
+    return cached_response(response_cache.put(cache_key, etag, body, mimetype), accept_encodings)
+
+
+def prepare_response(
+        status: int,
+        body: bytes,
+        mimetype: str,
+        etag: Optional[str],
+        accept_encodings: Accept,
+        compressor: Optional[ResponseCompressor]) -> PreparedResponse:
+    """
+    Ответ, не попадающий в кэш: тело сжимается на этот запрос (как response_compression во Flask)
+
+    Args:
+        status (int): HTTP-статус
+        body (bytes): сериализованное тело ответа
+        mimetype (str): mimetype ответа
+        etag (Optional[str]): ETag данных. None - без ETag (ответы с ошибкой)
+        accept_encodings (Accept): Accept-Encoding запроса
+        compressor (Optional[ResponseCompressor]): настройки сжатия. None - сжатие выключено
+
+    Returns:
+        PreparedResponse: ответ
+    """
+    body, encoding, vary = compress_for_client(body, accept_encodings, compressor)
+    headers = []
+    if encoding != IDENTITY:
+        headers.append(("Content-Encoding", encoding))
+    if vary:
+        headers.append(("Vary", "Accept-Encoding"))
+    if etag is not None:
+        headers.append(("ETag", quote_etag(encoded_etag(etag, encoding))))
+    return PreparedResponse(status, body, mimetype, headers)
@@ -1,3 +1,98 @@
+from typing import Optional
+
+
+def parse_sample_rates(value: Optional[str]) -> dict[str, int]:
+    """
+    Разбирает частоты выборочного профилирования из строки окружения
+
+    Args:
+        value (Optional[str]): "<endpoint>=<N>,...", например "game_v2.get_games=100,team.get_team_stats=50"
+
+    Returns:
+        dict[str, int]: endpoint -> N (профилируется каждый N-й запрос endpoint)
+
+    Raises:
+        ValueError: строка не в этом формате или N < 1
+    """
+    rates = {}
+    for item in filter(None, (part.strip() for part in (value or "").split(","))):
+        endpoint, rate = item.split("=")
+        if int(rate) < 1:
+            raise ValueError(f"Sample rate must be positive: {item}")
+        rates[endpoint.strip()] = int(rate)
+    return rates
+
 
 class BaseConfig:
-    DB_URL = ""
\ No newline at end of file
+    DB_URL = ""
+    # URL реплики только для чтения. Если задан, SELECT идут в реплику, запись и чтение после записи - в DB_URL
+    READ_DB_URL = None
+    # URL для асинхронных роутов чтения ASGI-режима (above_the_rim.asgi). По умолчанию READ_DB_URL или DB_URL
+    ASYNC_DB_URL = None
+    # Сколько потоков ASGI-режима выполняют остальные (не асинхронные) роуты через Flask
+    ASGI_WSGI_THREADS = 16
+    # Пул соединений: размер, сколько соединений сверх него можно открыть, сколько секунд ждать свободное,
+    # через сколько секунд пересоздавать соединение и проверять ли его перед выдачей (pre-ping)
+    DB_POOL_SIZE = 5
+    DB_MAX_OVERFLOW = 10
+    DB_POOL_TIMEOUT = 30
+    DB_POOL_RECYCLE = 1800
+    DB_POOL_PRE_PING = True
+    # PRAGMA для каждого соединения SQLite: WAL - читатели не блокируются пишущим, foreign_keys - работают
+    # ondelete="CASCADE" из моделей. Для других СУБД игнорируются
+    DB_SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "busy_timeout": 5000,
+        "foreign_keys": "ON",
+    }
+    # Сессии GET-запросов только для чтения: без autoflush, попытка записи - ReadOnlySessionError
+    DB_READ_ONLY_GET = True
+    # Как часто (в секундах) справочник команд сверяет свою версию с БД, чтобы увидеть изменения других процессов
+    TEAM_REGISTRY_CHECK_INTERVAL = 1.0
+    # Кэш готовых тел ответов для списков игр: включен ли, лимит размера (байт), хранить ли gzip-версию
+    # любого размера (сжатые версии от RESPONSE_COMPRESSION_MIN_SIZE хранятся и без этого, если включено сжатие)
+    RESPONSE_CACHE_ENABLED = True
+    RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    RESPONSE_CACHE_GZIP = False
+    # Сжатие JSON-ответов по Accept-Encoding: gzip и br (если установлен пакет brotli) для тел
+    # от RESPONSE_COMPRESSION_MIN_SIZE байт, с уровнями сжатия gzip (1-9) и brotli (0-11)
+    RESPONSE_COMPRESSION_ENABLED = True
+    RESPONSE_COMPRESSION_MIN_SIZE = 1024
+    RESPONSE_COMPRESSION_GZIP_LEVEL = 6
+    RESPONSE_COMPRESSION_BROTLI_QUALITY = 5
+    # Счет игры увеличивается атомарным UPDATE. Оптимистичная блокировка по Game.VERSION дополнительно
+    # отклоняет изменение, если игра поменялась между чтением и записью, с повтором до GAME_SCORE_UPDATE_RETRIES раз
+    GAME_SCORE_OPTIMISTIC_UPDATES = False
+    GAME_SCORE_UPDATE_RETRIES = 3
+    # Сериализация JSON-ответов через orjson, если он установлен (above_the_rim.json_provider). Ответы те же, что у json
+    JSON_ORJSON_ENABLED = True
+    # Регистрировать блюпринты по явному списку utils.BLUEPRINT_MANIFEST, не сканируя пакеты при старте
+    BLUEPRINT_MANIFEST_ENABLED = False
+    # Метрики в формате Prometheus на /metrics: запросы и их длительность по endpoint, пул соединений, кэши.
+    # Выключены по умолчанию - раскрывают внутреннее состояние приложения. Если задан METRICS_TOKEN,
+    # /metrics отвечает только на запрос с заголовком Authorization: Bearer <METRICS_TOKEN>
+    METRICS_ENABLED = False
+    METRICS_TOKEN = None
+    # Профилирование отдельных запросов (above_the_rim.request_profiler): запрос с заголовком
+    # X-Profile: <PROFILER_SECRET> (и X-Profile-Mode: memory для tracemalloc) либо каждый N-й запрос endpoint
+    # из PROFILER_SAMPLE_RATES ({"game_v2.get_games": 100}). Дампы pstats/tracemalloc пишутся в PROFILER_DIR
+    PROFILER_ENABLED = False
+    PROFILER_SECRET = None
+    PROFILER_DIR = "profiles"
+    PROFILER_SAMPLE_RATES = {}
+    # Учет SQL-запросов каждого HTTP-запроса: количество и время в БД в заголовках X-DB-Queries и Server-Timing
+    SQL_INSTRUMENTATION_ENABLED = False
+    # Отложенная запись четвертей POST /api/v2/games/<game_id> (services.quarter_queue): запрос отвечает 202 сразу
+    # после проверки, фоновый поток пишет четверти пачками до QUARTER_QUEUE_BATCH_SIZE штук одной транзакцией,
+    # ожидая пачку не дольше QUARTER_QUEUE_FLUSH_INTERVAL секунд. Если в очереди уже QUARTER_QUEUE_MAX_SIZE четвертей,
+    # запрос ждет место до QUARTER_QUEUE_PUT_TIMEOUT секунд и получает 503
+    QUARTER_QUEUE_ENABLED = False
+    QUARTER_QUEUE_MAX_SIZE = 10_000
+    QUARTER_QUEUE_BATCH_SIZE = 500
+    QUARTER_QUEUE_FLUSH_INTERVAL = 0.05
+    QUARTER_QUEUE_PUT_TIMEOUT = 1.0
+    # Максимальное количество игр в одном запросе POST /api/v2/games/batch
+    GAMES_BATCH_MAX_SIZE = 10_000
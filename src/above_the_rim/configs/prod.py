@@ -2,9 +2,24 @@ import os
 
 from dotenv import load_dotenv
 
-from above_the_rim.configs.base import BaseConfig
+from above_the_rim.configs.base import BaseConfig, parse_sample_rates
 
 load_dotenv()
 
 class ProdConfig(BaseConfig):
-    DB_URL = os.environ.get("DB_URL")
\ No newline at end of file
+    DB_URL = os.environ.get("DB_URL")
+    READ_DB_URL = os.environ.get("READ_DB_URL")
+    ASYNC_DB_URL = os.environ.get("ASYNC_DB_URL")
+    ASGI_WSGI_THREADS = int(os.environ.get("ASGI_WSGI_THREADS", BaseConfig.ASGI_WSGI_THREADS))
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", BaseConfig.DB_POOL_SIZE))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", BaseConfig.DB_MAX_OVERFLOW))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", BaseConfig.DB_POOL_TIMEOUT))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", BaseConfig.DB_POOL_RECYCLE))
+    BLUEPRINT_MANIFEST_ENABLED = True
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "").lower() in ("1", "true", "yes")
+    METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+    PROFILER_ENABLED = os.environ.get("PROFILER_ENABLED", "").lower() in ("1", "true", "yes")
+    PROFILER_SECRET = os.environ.get("PROFILER_SECRET")
+    PROFILER_DIR = os.environ.get("PROFILER_DIR", BaseConfig.PROFILER_DIR)
+    # Формат: "game_v2.get_games=100,team.get_team_stats=50"
+    PROFILER_SAMPLE_RATES = parse_sample_rates(os.environ.get("PROFILER_SAMPLE_RATES"))
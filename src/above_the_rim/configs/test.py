@@ -7,4 +7,8 @@ from above_the_rim.configs.base import BaseConfig
 load_dotenv()
 
 class TestConfig(BaseConfig):
-    DB_URL = "sqlite://"
\ No newline at end of file
+    DB_URL = "sqlite://"
+    # БД в памяти: WAL и mmap для нее не применимы, внешние ключи включены как в prod
+    DB_SQLITE_PRAGMAS = {
+        "foreign_keys": "ON",
+    }
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import Session
+
+from above_the_rim.database.db import (
+    DEFAULT_SQLITE_PRAGMAS, _set_sqlite_pragmas, _is_sqlite_memory, _forbid_read_only_flush
+)
+
+# Асинхронные драйверы для синхронных URL из конфигов: sqlite:///... -> sqlite+aiosqlite:///...
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+class AsyncReadSession(Session):
+    """
+    Синхронная сессия внутри AsyncSession. Как и сессии init_db, после set_read_only(session.sync_session)
+    не дает записать изменения (ReadOnlySessionError)
+    """
+
+
+event.listen(AsyncReadSession, "before_flush", _forbid_read_only_flush)
+
+def get_async_db_url(db_url: str) -> str:
+    """
+    Переводит URL БД на асинхронный драйвер
+
+    Args:
+        db_url (str): URL для подключения к БД, например 'sqlite:///above_the_rim.db'
+
+    Returns:
+        str: URL с асинхронным драйвером, например 'sqlite+aiosqlite:///above_the_rim.db'.
+            URL, где драйвер уже указан явно, возвращается без изменений
+    """
+    url = make_url(db_url)
+    if "+" in url.drivername or url.drivername not in ASYNC_DRIVERS:
+        return db_url
+    return url.set(drivername=f"{url.drivername}+{ASYNC_DRIVERS[url.drivername]}").render_as_string(hide_password=False)
+
+def init_async_db(
+        db_url: str,
+        pool_options: Optional[dict] = None,
+        sqlite_pragmas: Optional[dict] = None) -> async_sessionmaker[AsyncSession]:
+    """
+    Инициализирует асинхронный engine (SQLAlchemy asyncio) и возвращает фабрику асинхронных сессий.
+    Схему не создает - она создается синхронным init_db / миграциями
+
+    Args:
+        db_url (str): URL для подключения к БД, синхронный (переводится через get_async_db_url) или асинхронный
+        pool_options (dict): параметры пула соединений для create_async_engine
+        sqlite_pragmas (dict): PRAGMA для соединений SQLite, по умолчанию DEFAULT_SQLITE_PRAGMAS
+
+    Returns:
+        async_sessionmaker[AsyncSession]: фабрика сессий, одна сессия на запрос
+    """
+    async_db_url = get_async_db_url(db_url)
+    engine_options = {}
+    if pool_options and not _is_sqlite_memory(async_db_url):
+        engine_options.update(pool_options)
+    engine = create_async_engine(async_db_url, echo=False, **engine_options)
+
+    sqlite_pragmas = DEFAULT_SQLITE_PRAGMAS if sqlite_pragmas is None else sqlite_pragmas
+    if sqlite_pragmas and engine.dialect.name == "sqlite":
+        # События соединений вешаются на синхронный engine, который оборачивает асинхронный
+        _set_sqlite_pragmas(engine.sync_engine, sqlite_pragmas)
+    return async_sessionmaker(engine, expire_on_commit=False, autoflush=False, sync_session_class=AsyncReadSession)
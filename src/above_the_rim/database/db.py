@@ -1,7 +1,14 @@
-from sqlalchemy import create_engine, MetaData, Engine
+from typing import Optional
+
+from sqlalchemy import create_engine, event, make_url, text, MetaData, Engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.sql.dml import UpdateBase
 from sqlalchemy.ext.declarative import declarative_base
 
+from above_the_rim.configs.base import BaseConfig
+from above_the_rim.errors.db_errors import ReadOnlySessionError
+
 convention = {
     "ix": 'ix_%(column_0_label)s',
     "uq": "uq_%(table_name)s_%(column_0_name)s",
@@ -13,24 +20,205 @@ convention = {
 Base = declarative_base()
 Base.metadata = MetaData(naming_convention=convention)
 
-def _get_engine(db_url: str) -> Engine:
-    return create_engine(db_url, echo=False)
+# Ревизия Alembic (head), которой соответствуют модели. Меняется вместе с каждой новой миграцией -
+# tests/test_startup.py сверяет ее с migrations/versions
+SCHEMA_REVISION = "3c9e8f1a2b47"
+
+def _is_sqlite_memory(db_url: str) -> bool:
+    url = make_url(db_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+def _set_sqlite_pragmas(engine: Engine, pragmas: dict):
+    """
+    Подписывает engine на выполнение PRAGMA при каждом новом соединении SQLite
+
+    Args:
+        engine (Engine): engine SQLite
+        pragmas (dict): имя PRAGMA -> значение, например {"journal_mode": "WAL"}
+
+    Returns:
+        None
+    """
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+def _get_engine(db_url: str, pool_options: Optional[dict] = None, sqlite_pragmas: Optional[dict] = None) -> Engine:
+    """
+    Создает engine с настройками пула и, для SQLite, с PRAGMA на каждое соединение
+
+    Args:
+        db_url (str): URL для подключения к БД
+        pool_options (dict): параметры пула для create_engine (pool_size, max_overflow, pool_timeout, ...)
+        sqlite_pragmas (dict): PRAGMA для соединений SQLite. Для других СУБД игнорируются
+
+    Returns:
+        Engine: engine SQLAlchemy
+
+    Note:
+        SQLite в памяти работает на SingletonThreadPool без размера и переполнения, поэтому pool_options
+        для него не применяются
+    """
+    engine_options = {}
+    if pool_options and not _is_sqlite_memory(db_url):
+        engine_options.update(pool_options)
+    engine = create_engine(db_url, echo=False, **engine_options)
+    if sqlite_pragmas and engine.dialect.name == "sqlite":
+        _set_sqlite_pragmas(engine, sqlite_pragmas)
+    return engine
+
+class RoutingSession(Session):
+    """
+    Сессия с маршрутизацией на реплику: SELECT идут в read_bind (реплику), а flush, INSERT/UPDATE/DELETE
+    и запросы без конкретного выражения (session.connection(), get_bind()) - в основную БД (bind).
+
+    Read-your-writes: после первой записи сессия до своего закрытия читает из основной БД,
+    поэтому запрос, который что-то записал, видит свои изменения независимо от отставания реплики.
+    Принудительно читать из основной БД - use_primary(session)
+    """
+
+    def __init__(self, *args, read_bind: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_bind = read_bind
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.read_bind is None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if self._flushing or isinstance(clause, UpdateBase):
+            use_primary(self)
+        if clause is None or self.info.get("use_primary"):
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        return self.read_bind
+
+def use_primary(session: Session):
+    """
+    Направляет все дальнейшие чтения сессии в основную БД (read-your-writes). Действует до закрытия сессии
+
+    Args:
+        session (Session): сессия SQLAlchemy (или scoped_session - тогда текущая сессия потока)
+
+    Returns:
+        None
+    """
+    session.info["use_primary"] = True
 
-def _get_session(engine: Engine) -> Session:
-    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _get_session(engine: Engine, read_engine: Optional[Engine] = None) -> Session:
+    session_factory = sessionmaker(
+        class_=RoutingSession, autocommit=False, autoflush=False, bind=engine, read_bind=read_engine
+    )
+    event.listen(session_factory, "before_flush", _forbid_read_only_flush)
     return scoped_session(session_factory)
 
-def init_db(db_url: str) -> Session:
+def get_engines(db: scoped_session) -> list[Engine]:
+    """
+    Возвращает engine сессии из init_db: основной БД и, если задана, реплики
+
+    Args:
+        db (scoped_session): сессия из init_db
+
+    Returns:
+        list[Engine]: [основная БД] или [основная БД, реплика]
+    """
+    options = db.session_factory.kw
+    return [engine for engine in (options["bind"], options.get("read_bind")) if engine is not None]
+
+def _forbid_read_only_flush(session: Session, flush_context, instances):
+    if session.info.get("read_only"):
+        raise ReadOnlySessionError("Attempt to flush changes in a read-only session")
+
+def set_read_only(session: Session):
+    """
+    Переводит сессию в режим только для чтения: autoflush выключен, попытка flush/commit изменений
+    выбрасывает ReadOnlySessionError. Действует до закрытия сессии (scoped_session.remove)
+
+    Args:
+        session (Session): сессия SQLAlchemy (или scoped_session - тогда текущая сессия потока)
+
+    Returns:
+        None
+    """
+    session.autoflush = False
+    session.info["read_only"] = True
+
+def _is_schema_at_revision(engine: Engine, revision: str) -> bool:
+    """
+    Проверяет по таблице alembic_version, что схема БД уже доведена миграциями до ревизии revision
+
+    Args:
+        engine (Engine): engine основной БД
+        revision (str): ожидаемая ревизия Alembic
+
+    Returns:
+        bool: True - БД на этой ревизии. False - другая ревизия, либо БД не под управлением Alembic
+    """
+    try:
+        with engine.connect() as connection:
+            versions = connection.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    except DBAPIError:
+        return False
+    return versions == [revision]
+
+def get_engine_options(config) -> dict:
+    """
+    Собирает параметры _get_engine из конфига приложения
+
+    Args:
+        config (BaseConfig): конфиг приложения, лежат в above_the_rim.configs
+
+    Returns:
+        dict: {"pool_options": {...}, "sqlite_pragmas": {...}, "read_db_url": ...}
+    """
+    return {
+        "read_db_url": config.READ_DB_URL,
+        "pool_options": {
+            "pool_size": config.DB_POOL_SIZE,
+            "max_overflow": config.DB_MAX_OVERFLOW,
+            "pool_timeout": config.DB_POOL_TIMEOUT,
+            "pool_recycle": config.DB_POOL_RECYCLE,
+            "pool_pre_ping": config.DB_POOL_PRE_PING,
+        },
+        "sqlite_pragmas": config.DB_SQLITE_PRAGMAS,
+    }
+
+# Значения по умолчанию для init_db без параметров - те же, что в BaseConfig (единственный источник настроек)
+_BASE_ENGINE_OPTIONS = get_engine_options(BaseConfig)
+DEFAULT_POOL_OPTIONS = _BASE_ENGINE_OPTIONS["pool_options"]
+DEFAULT_SQLITE_PRAGMAS = _BASE_ENGINE_OPTIONS["sqlite_pragmas"]
+
+def init_db(
+        db_url: str,
+        pool_options: Optional[dict] = None,
+        sqlite_pragmas: Optional[dict] = None,
+        read_db_url: Optional[str] = None) -> Session:
     """
     Инициализирует БД и возвращает сессию для дальнейшего использования
 
     Args:
         db_url (str): URL для подключения к БД
+        pool_options (dict): параметры пула соединений, по умолчанию DEFAULT_POOL_OPTIONS
+        sqlite_pragmas (dict): PRAGMA для соединений SQLite, по умолчанию DEFAULT_SQLITE_PRAGMAS
+        read_db_url (str): URL реплики для чтения. Если задан, SELECT идут в нее (см. RoutingSession)
 
     Returns:
         sqlalchemy.Session: сессия SQLAlchemy
+
+    Note:
+        Параметры из конфига приложения: init_db(config.DB_URL, **get_engine_options(config)).
+        Схема создается только в основной БД, реплика получает ее репликацией.
+        Если основная БД уже на ревизии Alembic SCHEMA_REVISION, create_all не выполняется
     """
-    engine = _get_engine(db_url)
-    db = _get_session(engine)
-    Base.metadata.create_all(bind=engine)
-    return db
\ No newline at end of file
+    pool_options = DEFAULT_POOL_OPTIONS if pool_options is None else pool_options
+    sqlite_pragmas = DEFAULT_SQLITE_PRAGMAS if sqlite_pragmas is None else sqlite_pragmas
+    engine = _get_engine(db_url, pool_options, sqlite_pragmas)
+    read_engine = _get_engine(read_db_url, pool_options, sqlite_pragmas) if read_db_url else None
+    db = _get_session(engine, read_engine)
+    # Схема, доведенная миграциями до head, уже совпадает с моделями - create_all не нужен
+    # (он проверяет каждую таблицу отдельным запросом при каждом старте каждого процесса)
+    if not _is_schema_at_revision(engine, SCHEMA_REVISION):
+        Base.metadata.create_all(bind=engine)
+    return db
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, cast, event, insert
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from above_the_rim.database.db import Base
@@ -16,12 +17,81 @@ class Game(Base):
     VISITING_TEAM_ID = Column(Integer, ForeignKey("teams.ID", ondelete="CASCADE", onupdate="CASCADE"))
     HOME_TEAM_SCORE = Column(Integer, default=0)
     VISITING_TEAM_SCORE = Column(Integer, default=0)
+    # Увеличивается при каждом изменении счета, для оптимистичной блокировки (см. GameRepository.increment_scores)
+    VERSION = Column(Integer, nullable=False, default=0, server_default="0")
     home_team = relationship(Team, foreign_keys=[HOME_TEAM_ID])
     visiting_team = relationship(Team, foreign_keys=[VISITING_TEAM_ID])
 
+    # Покрывающие индексы для статистики команды: поиск по команде и сравнение счета без чтения строк таблицы.
+    # Индекс по паре (HOME_TEAM_ID, VISITING_TEAM_ID) заодно дает поиск очных встреч двух команд
+    __table_args__ = (
+        Index(
+            "ix_games_HOME_TEAM_ID_VISITING_TEAM_ID_scores",
+            "HOME_TEAM_ID", "VISITING_TEAM_ID", "HOME_TEAM_SCORE", "VISITING_TEAM_SCORE"
+        ),
+        Index("ix_games_VISITING_TEAM_ID_scores", "VISITING_TEAM_ID", "VISITING_TEAM_SCORE", "HOME_TEAM_SCORE"),
+    )
+
 class Quarters(Base):
+    """
+    Счет одной четверти игры. NUMBER - порядковый номер четверти в игре (с 1), уникален в пределах игры.
+    Очки хранятся числами, поэтому агрегаты по четвертям считаются в SQL
+    """
     __tablename__ = 'quarters'
     ID = Column(Integer, primary_key=True, autoincrement=True)
     GAME_ID = Column(Integer, ForeignKey("games.ID", ondelete="CASCADE", onupdate="CASCADE"))
-    QUARTERS = Column(String(50))
-    game = relationship(Game, foreign_keys=[GAME_ID])
\ No newline at end of file
+    NUMBER = Column(Integer, nullable=False)
+    HOME_POINTS = Column(Integer, nullable=False)
+    VISITING_POINTS = Column(Integer, nullable=False)
+    game = relationship(Game, foreign_keys=[GAME_ID])
+
+    __table_args__ = (
+        Index("ix_quarters_GAME_ID_NUMBER", "GAME_ID", "NUMBER", unique=True),
+    )
+
+    @hybrid_property
+    def QUARTERS(self) -> str:
+        """
+        Счет четверти в формате API: "<HOME_POINTS>:<VISITING_POINTS>", например "21:12".
+        В запросах - SQL-выражение с тем же значением и именем колонки QUARTERS
+        """
+        return f"{self.HOME_POINTS}:{self.VISITING_POINTS}"
+
+    @QUARTERS.inplace.setter
+    def _quarters_setter(self, value: str):
+        self.HOME_POINTS, self.VISITING_POINTS = [int(points) for points in value.split(":")]
+
+    @QUARTERS.inplace.expression
+    @classmethod
+    def _quarters_expression(cls):
+        return (cast(cls.HOME_POINTS, String) + ":" + cast(cls.VISITING_POINTS, String)).label("QUARTERS")
+
+class TeamStandings(Base):
+    """
+    Материализованная турнирная таблица. Поддерживается GameService инкрементально,
+    в той же транзакции, что и изменение games. Полная пересборка - above_the_rim.commands.rebuild_standings
+    """
+    __tablename__ = 'team_standings'
+    TEAM_ID = Column(Integer, ForeignKey("teams.ID", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    WINS = Column(Integer, nullable=False, default=0)
+    LOSSES = Column(Integer, nullable=False, default=0)
+    POINTS_FOR = Column(Integer, nullable=False, default=0)
+    POINTS_AGAINST = Column(Integer, nullable=False, default=0)
+
+class DataVersion(Base):
+    """
+    Счетчики версий данных (по имени набора данных, например 'teams'). Увеличиваются сервисами
+    при каждой записи и позволяют процессам дешево проверять актуальность своих кэшей
+    """
+    __tablename__ = 'data_versions'
+    NAME = Column(String(50), primary_key=True)
+    VERSION = Column(Integer, nullable=False, default=0)
+
+# Наборы данных с версиями (TEAMS_VERSION и др. из repositories.data_version). Их строки создаются вместе
+# с таблицей - миграциями a41f7d0e6c28 и c83b19e5f7a2 или при create_all, поэтому DataVersionRepository.bump
+# всегда только обновляет существующую строку и первые параллельные записи не соревнуются за ее INSERT
+DATA_VERSION_NAMES = ("teams", "games", "quarters", "standings")
+
+@event.listens_for(DataVersion.__table__, "after_create")
+def _seed_data_versions(table, connection, **kwargs):
+    connection.execute(insert(table), [{"NAME": name, "VERSION": 0} for name in DATA_VERSION_NAMES])
@@ -0,0 +1,31 @@
+from typing import Iterable
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from above_the_rim.database.models import DataVersion
+
+
+class AsyncDataVersionRepository:
+    """
+    Асинхронный репозиторий счетчиков версий данных DataVersion (только чтение - пишут синхронные сервисы)
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_versions(self, names: Iterable[str]) -> dict[str, int]:
+        """
+        Возвращает версии нескольких наборов данных одним запросом
+
+        Args:
+            names (Iterable[str]): имена наборов данных
+
+        Returns:
+            dict[str, int]: имя -> версия. Для ни разу не изменявшихся наборов - 0
+        """
+        names = list(names)
+        rows = (await self.db.execute(
+            select(DataVersion.NAME, DataVersion.VERSION).where(DataVersion.NAME.in_(names))
+        )).all()
+        versions = dict.fromkeys(names, 0)
+        versions.update({row.NAME: row.VERSION for row in rows})
+        return versions
@@ -0,0 +1,39 @@
+from typing import Optional
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from above_the_rim.database.models import Game
+from above_the_rim.database.repositories.game import GameRepository
+
+
+class AsyncGameRepository:
+    """
+    Асинхронный репозиторий Game для ASGI-режима. Запросы те же, что у GameRepository
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_all_game_rows(self) -> list[Row]:
+        """
+        Возвращает плоский список всех игр с именами команд одним JOIN-запросом
+
+        Returns:
+            list[Row]: строки как у GameRepository.get_all_game_rows
+        """
+        return list((await self.db.execute(GameRepository._game_rows_query())).all())
+
+    async def get_game_rows_after_id(self, limit: int, after_id: Optional[int] = None) -> list[Row]:
+        """
+        Возвращает страницу игр по ключу (keyset pagination), см. GameRepository.get_game_rows_after_id
+
+        Args:
+            limit (int): максимальное количество игр на странице
+            after_id (Optional[int]): ID последней игры предыдущей страницы. None - первая страница
+
+        Returns:
+            list[Row]: строки как у GameRepository.get_all_game_rows
+        """
+        query = GameRepository._game_rows_query()
+        if after_id is not None:
+            query = query.where(Game.ID > after_id)
+        return list((await self.db.execute(query.limit(limit))).all())
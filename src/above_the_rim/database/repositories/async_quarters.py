@@ -0,0 +1,44 @@
+from typing import List, Iterable
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from above_the_rim.database.models import Quarters
+from above_the_rim.database.repositories.quarters import QuartersRepository
+
+
+class AsyncQuartersRepository:
+    """
+    Асинхронный репозиторий Quarters для ASGI-режима. Запросы те же, что у QuartersRepository
+    """
+    IN_CHUNK_SIZE = QuartersRepository.IN_CHUNK_SIZE
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_all_quarter_rows(self) -> List[Row]:
+        """
+        Возвращает все Quarters одним запросом в виде плоских строк
+
+        Returns:
+            list[Row]: строки как у QuartersRepository._quarter_rows_query, отсортированные по GAME_ID и NUMBER
+        """
+        return list((await self.db.execute(QuartersRepository._quarter_rows_query())).all())
+
+    async def get_quarter_rows_by_game_ids(self, game_ids: Iterable[int]) -> List[Row]:
+        """
+        Возвращает Quarters для набора Game.ID запросами с IN (...) пачками по IN_CHUNK_SIZE
+
+        Args:
+            game_ids (Iterable[int]): ID сущностей Game
+
+        Returns:
+            list[Row]: строки как у QuartersRepository._quarter_rows_query, отсортированные по GAME_ID и NUMBER
+        """
+        game_ids = sorted(set(game_ids))
+        rows = []
+        for start in range(0, len(game_ids), self.IN_CHUNK_SIZE):
+            chunk = game_ids[start:start + self.IN_CHUNK_SIZE]
+            query = QuartersRepository._quarter_rows_query().where(Quarters.GAME_ID.in_(chunk))
+            rows.extend((await self.db.execute(query)).all())
+        return rows
@@ -0,0 +1,38 @@
+from typing import Optional
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from above_the_rim.database.models import Team
+
+
+class AsyncTeamRepository:
+    """
+    Асинхронный репозиторий Team для ASGI-режима. Возвращает плоские строки, без ORM-объектов:
+    у асинхронной сессии нет ленивых загрузок, и строк достаточно для ответов
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_team_by_short(self, short: str) -> Optional[Row]:
+        """
+        Возвращает Team по ее сокращенному имени
+
+        Args:
+            short (str): сокращенное имя команды
+
+        Returns:
+            Row: строка (ID, SHORT, NAME)
+            None: команды нет
+        """
+        query = select(Team.ID, Team.SHORT, Team.NAME).where(Team.SHORT == short)
+        return (await self.db.execute(query)).first()
+
+    async def get_all_teams(self) -> list[Row]:
+        """
+        Возвращает все Team из БД
+
+        Returns:
+            list[Row]: строки (ID, SHORT, NAME) в порядке Team.ID
+        """
+        query = select(Team.ID, Team.SHORT, Team.NAME).order_by(Team.ID)
+        return list((await self.db.execute(query)).all())
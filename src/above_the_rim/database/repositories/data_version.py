@@ -0,0 +1,67 @@
+from typing import Iterable
+from sqlalchemy import select, update, insert
+from sqlalchemy.orm import Session
+
+from above_the_rim.database.models import DataVersion
+
+# Имена наборов данных, версии которых увеличиваются при записи (их строки - models.DATA_VERSION_NAMES)
+TEAMS_VERSION = "teams"
+GAMES_VERSION = "games"
+QUARTERS_VERSION = "quarters"
+STANDINGS_VERSION = "standings"
+
+
+class DataVersionRepository:
+    """
+    Репозиторий для обмена данными по счетчикам версий данных DataVersion
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_version(self, name: str) -> int:
+        """
+        Возвращает текущую версию набора данных (поиск по первичному ключу)
+
+        Args:
+            name (str): имя набора данных, например 'teams'
+
+        Returns:
+            int: версия. 0 - набор данных еще ни разу не изменялся
+        """
+        version = self.db.execute(select(DataVersion.VERSION).where(DataVersion.NAME == name)).scalar()
+        return version or 0
+
+    def get_versions(self, names: Iterable[str]) -> dict[str, int]:
+        """
+        Возвращает версии нескольких наборов данных одним запросом
+
+        Args:
+            names (Iterable[str]): имена наборов данных
+
+        Returns:
+            dict[str, int]: имя -> версия. Для ни разу не изменявшихся наборов - 0
+        """
+        names = list(names)
+        rows = self.db.execute(
+            select(DataVersion.NAME, DataVersion.VERSION).where(DataVersion.NAME.in_(names))
+        ).all()
+        versions = dict.fromkeys(names, 0)
+        versions.update({row.NAME: row.VERSION for row in rows})
+        return versions
+
+    def bump(self, name: str):
+        """
+        Увеличивает версию набора данных на 1 атомарным UPDATE (без commit)
+
+        Args:
+            name (str): имя набора данных, например 'teams'
+
+        Returns:
+            None
+        """
+        result = self.db.execute(
+            update(DataVersion).where(DataVersion.NAME == name).values(VERSION=DataVersion.VERSION + 1)
+        )
+        if not result.rowcount:
+            # Строки наборов из DATA_VERSION_NAMES создаются вместе с таблицей - сюда попадает только новое имя
+            self.db.execute(insert(DataVersion).values(NAME=name, VERSION=1))
@@ -1,7 +1,8 @@
-from typing import Type, Optional
-from sqlalchemy.orm import Session
+from typing import Type, Optional, Iterator, Iterable
+from sqlalchemy import Row, select, insert, update, func, case, or_, and_
+from sqlalchemy.orm import Session, aliased
 
-from above_the_rim.database.models import Game
+from above_the_rim.database.models import Game, Team, Quarters
 
 
 class GameRepository:
@@ -17,6 +18,81 @@ class GameRepository:
         """
         return self.db.query(Game).all()
 
+    @staticmethod
+    def _game_rows_query():
+        """
+        Базовый запрос плоских строк игр: games JOIN teams (дважды), отсортированный по Game.ID
+
+        Returns:
+            Select: запрос строк (ID, HOME_TEAM_NAME, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VISITING_TEAM_NAME)
+        """
+        home_team = aliased(Team)
+        visiting_team = aliased(Team)
+        return (
+            select(
+                Game.ID,
+                home_team.NAME.label("HOME_TEAM_NAME"),
+                Game.HOME_TEAM_SCORE,
+                Game.VISITING_TEAM_SCORE,
+                visiting_team.NAME.label("VISITING_TEAM_NAME"),
+            )
+            .join(home_team, Game.HOME_TEAM_ID == home_team.ID)
+            .join(visiting_team, Game.VISITING_TEAM_ID == visiting_team.ID)
+            .order_by(Game.ID)
+        )
+
+    def get_all_game_rows(self) -> list[Row]:
+        """
+        Возвращает плоский список всех игр с именами команд одним JOIN-запросом.
+        Не создает ORM-объекты Game/Team и не затрагивает identity map сессии,
+        поэтому нет ленивых загрузок Game.home_team/visiting_team (N+1)
+
+        Returns:
+            list[Row]: строки (ID, HOME_TEAM_NAME, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VISITING_TEAM_NAME),
+                отсортированные по Game.ID
+        """
+        return list(self.db.execute(self._game_rows_query()).all())
+
+    def get_game_rows_after_id(self, limit: int, after_id: Optional[int] = None) -> list[Row]:
+        """
+        Возвращает страницу игр по ключу (keyset pagination): WHERE Game.ID > after_id ORDER BY Game.ID LIMIT limit.
+        В отличие от OFFSET, поиск начала страницы идет по первичному ключу, поэтому глубокие страницы
+        стоят столько же, сколько первая
+
+        Args:
+            limit (int): максимальное количество игр на странице
+            after_id (Optional[int]): ID последней игры предыдущей страницы. None - первая страница
+
+        Returns:
+            list[Row]: строки как у GameRepository.get_all_game_rows
+        """
+        query = self._game_rows_query()
+        if after_id is not None:
+            query = query.where(Game.ID > after_id)
+        return list(self.db.execute(query.limit(limit)).all())
+
+    def iter_game_rows_with_quarters(self, batch_size: int = 1000) -> Iterator[Row]:
+        """
+        Потоково отдает все игры вместе с четвертями: games JOIN teams LEFT JOIN quarters одним запросом.
+        Строки читаются с сервера пачками по batch_size (yield_per / server-side cursor),
+        поэтому потребление памяти не зависит от размера таблицы
+
+        Args:
+            batch_size (int): количество строк, забираемых из курсора за раз
+
+        Returns:
+            Iterator[Row]: строки (ID, HOME_TEAM_NAME, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VISITING_TEAM_NAME, QUARTERS),
+                отсортированные по Game.ID и Quarters.NUMBER. У игры без четвертей одна строка с QUARTERS = None
+        """
+        query = (
+            self._game_rows_query()
+            .add_columns(Quarters.QUARTERS)
+            .outerjoin(Quarters, Quarters.GAME_ID == Game.ID)
+            .order_by(Quarters.NUMBER)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.execute(query)
+
     def get_game_by_id(self, game_id: int) -> Optional[Type[Game]]:
         """
         Возвращает Game по id
@@ -43,6 +119,74 @@ class GameRepository:
         """
         self.db.add(game)
 
+    def add_games(self, games: list[dict]) -> list[int]:
+        """
+        Добавляет пачку Game одним INSERT (executemany) и возвращает их ID
+
+        Args:
+            games (list[dict]): значения колонок Game, например
+                [{"HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 76, "VISITING_TEAM_SCORE": 67}]
+
+        Returns:
+            list[int]: ID добавленных игр в порядке games
+        """
+        if not games:
+            return []
+        query = insert(Game).returning(Game.ID, sort_by_parameter_order=True)
+        return list(self.db.execute(query, games).scalars().all())
+
+    def get_score_row(self, game_id: int) -> Optional[Row]:
+        """
+        Возвращает счет и версию игры без загрузки ORM-объекта
+
+        Args:
+            game_id (int): ID сущности Game
+
+        Returns:
+            Row: строка (ID, HOME_TEAM_ID, VISITING_TEAM_ID, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VERSION)
+            None: игра не найдена
+        """
+        query = select(
+            Game.ID, Game.HOME_TEAM_ID, Game.VISITING_TEAM_ID, Game.HOME_TEAM_SCORE, Game.VISITING_TEAM_SCORE, Game.VERSION
+        ).where(Game.ID == game_id)
+        return self.db.execute(query).first()
+
+    def increment_scores(
+            self,
+            game_id: int,
+            home_points: int,
+            visiting_points: int,
+            expected_version: Optional[int] = None) -> Optional[Row]:
+        """
+        Атомарно увеличивает счет игры одним UPDATE ... SET SCORE = SCORE + :points RETURNING (без commit).
+        Счет не читается в Python заранее, поэтому параллельные изменения одной игры не теряются
+
+        Args:
+            game_id (int): ID сущности Game
+            home_points (int): очки домашней команды
+            visiting_points (int): очки гостей
+            expected_version (Optional[int]): оптимистичная блокировка - обновить, только если Game.VERSION
+                все еще равна этому значению
+
+        Returns:
+            Row: строка после обновления (HOME_TEAM_ID, VISITING_TEAM_ID, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VERSION)
+            None: игра не найдена, либо ее версия уже не равна expected_version
+        """
+        query = (
+            update(Game)
+            .where(Game.ID == game_id)
+            .values(
+                HOME_TEAM_SCORE=func.coalesce(Game.HOME_TEAM_SCORE, 0) + home_points,
+                VISITING_TEAM_SCORE=func.coalesce(Game.VISITING_TEAM_SCORE, 0) + visiting_points,
+                VERSION=Game.VERSION + 1,
+            )
+            .returning(Game.HOME_TEAM_ID, Game.VISITING_TEAM_ID, Game.HOME_TEAM_SCORE, Game.VISITING_TEAM_SCORE, Game.VERSION)
+            .execution_options(synchronize_session=False)
+        )
+        if expected_version is not None:
+            query = query.where(Game.VERSION == expected_version)
+        return self.db.execute(query).first()
+
     def get_home_wins_by_team_id(self, team_id: int) -> int:
         """
         Возвращает количество игр, где команда победила и была дома:
@@ -105,4 +249,93 @@ class GameRepository:
         return self.db.query(Game).filter(
             Game.VISITING_TEAM_ID == team_id,
             Game.VISITING_TEAM_SCORE < Game.HOME_TEAM_SCORE
-        ).count()
\ No newline at end of file
+        ).count()
+
+    def get_standings(self, team_short: Optional[str] = None, team_ids: Optional[Iterable[int]] = None) -> list[Row]:
+        """
+        Считает победы, поражения и набранные/пропущенные очки команд одним агрегирующим запросом
+        по таблице games: teams LEFT JOIN games с условными суммами вместо четырех отдельных COUNT.
+        Служит источником истины для материализованной таблицы team_standings
+
+        Args:
+            team_short (Optional[str]): сокращенное имя команды. Если передано - только по этой команде
+            team_ids (Optional[Iterable[int]]): ID команд. Если переданы - только по этим командам
+
+        Returns:
+            list[Row]: строки (ID, SHORT, NAME, WIN, LOST, POINTS_FOR, POINTS_AGAINST), отсортированные по Team.ID.
+                Команды без игр тоже попадают в результат с нулями
+        """
+        is_home = Game.HOME_TEAM_ID == Team.ID
+        is_visiting = Game.VISITING_TEAM_ID == Team.ID
+        won = or_(
+            and_(is_home, Game.HOME_TEAM_SCORE > Game.VISITING_TEAM_SCORE),
+            and_(is_visiting, Game.VISITING_TEAM_SCORE > Game.HOME_TEAM_SCORE),
+        )
+        lost = or_(
+            and_(is_home, Game.HOME_TEAM_SCORE < Game.VISITING_TEAM_SCORE),
+            and_(is_visiting, Game.VISITING_TEAM_SCORE < Game.HOME_TEAM_SCORE),
+        )
+        points_for = case((is_home, Game.HOME_TEAM_SCORE), (is_visiting, Game.VISITING_TEAM_SCORE), else_=0)
+        points_against = case((is_home, Game.VISITING_TEAM_SCORE), (is_visiting, Game.HOME_TEAM_SCORE), else_=0)
+        query = (
+            select(
+                Team.ID,
+                Team.SHORT,
+                Team.NAME,
+                func.coalesce(func.sum(case((won, 1), else_=0)), 0).label("WIN"),
+                func.coalesce(func.sum(case((lost, 1), else_=0)), 0).label("LOST"),
+                func.coalesce(func.sum(points_for), 0).label("POINTS_FOR"),
+                func.coalesce(func.sum(points_against), 0).label("POINTS_AGAINST"),
+            )
+            .outerjoin(Game, or_(is_home, is_visiting))
+            .group_by(Team.ID, Team.SHORT, Team.NAME)
+            .order_by(Team.ID)
+        )
+        if team_short is not None:
+            query = query.where(Team.SHORT == team_short)
+        if team_ids is not None:
+            query = query.where(Team.ID.in_(list(team_ids)))
+        return list(self.db.execute(query).all())
+
+    def get_head_to_head(self, team_id: int, opponent_id: int) -> Row:
+        """
+        Считает очные встречи двух команд одним агрегирующим запросом: победы и поражения команды team_id
+        дома и в гостях против opponent_id и суммарную разницу очков. Каждая из двух веток
+        WHERE (HOME_TEAM_ID, VISITING_TEAM_ID) = (team_id, opponent_id) / (opponent_id, team_id) - поиск
+        по покрывающему индексу ix_games_HOME_TEAM_ID_VISITING_TEAM_ID_scores, без чтения строк таблицы
+
+        Args:
+            team_id (int): ID Team, с точки зрения которой считается статистика
+            opponent_id (int): ID Team соперника
+
+        Returns:
+            Row: строка (HOME_GAMES, HOME_WIN, HOME_LOST, VISITING_GAMES, VISITING_WIN, VISITING_LOST, MARGIN),
+                где MARGIN - сумма (очки team_id - очки opponent_id) по всем встречам. Без встреч - нули
+        """
+        is_home = Game.HOME_TEAM_ID == team_id
+        is_visiting = Game.VISITING_TEAM_ID == team_id
+        home_won = Game.HOME_TEAM_SCORE > Game.VISITING_TEAM_SCORE
+        home_lost = Game.HOME_TEAM_SCORE < Game.VISITING_TEAM_SCORE
+
+        def count(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        query = (
+            select(
+                count(is_home).label("HOME_GAMES"),
+                count(and_(is_home, home_won)).label("HOME_WIN"),
+                count(and_(is_home, home_lost)).label("HOME_LOST"),
+                count(is_visiting).label("VISITING_GAMES"),
+                count(and_(is_visiting, home_lost)).label("VISITING_WIN"),
+                count(and_(is_visiting, home_won)).label("VISITING_LOST"),
+                func.coalesce(func.sum(case(
+                    (is_home, Game.HOME_TEAM_SCORE - Game.VISITING_TEAM_SCORE),
+                    else_=Game.VISITING_TEAM_SCORE - Game.HOME_TEAM_SCORE
+                )), 0).label("MARGIN"),
+            )
+            .where(or_(
+                and_(Game.HOME_TEAM_ID == team_id, Game.VISITING_TEAM_ID == opponent_id),
+                and_(Game.HOME_TEAM_ID == opponent_id, Game.VISITING_TEAM_ID == team_id),
+            ))
+        )
+        return self.db.execute(query).one()
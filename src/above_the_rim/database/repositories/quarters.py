@@ -1,5 +1,6 @@
-from typing import List, Type
+from typing import List, Type, Iterable
 
+from sqlalchemy import Row, select, insert, func
 from sqlalchemy.orm import Session
 
 from above_the_rim.database.models import Quarters
@@ -9,6 +10,9 @@ class QuartersRepository:
     """
     Репозиторий для обмена данными по сущности Quarters
     """
+    # Максимум параметров в одном IN (...). Держим ниже лимита SQLite на количество bind-параметров
+    IN_CHUNK_SIZE = 500
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -24,6 +28,20 @@ class QuartersRepository:
         """
         self.db.add(quarter)
 
+    def add_quarters(self, quarters: List[dict]):
+        """
+        Добавляет пачку Quarters одним INSERT (executemany)
+
+        Args:
+            quarters (list[dict]): значения колонок Quarters, например
+                [{"GAME_ID": 1, "NUMBER": 1, "HOME_POINTS": 21, "VISITING_POINTS": 12}]
+
+        Returns:
+            None: ничего не возвращает
+        """
+        if quarters:
+            self.db.execute(insert(Quarters), quarters)
+
     def get_quarters_by_game_id(self, game_id: int) -> List[Type[Quarters]]:
         """
         Возвращает Quarters по Game.ID
@@ -33,4 +51,62 @@ class QuartersRepository:
         Returns:
             list[Type[Quarters]]: список найденных Quarters
         """
-        return self.db.query(Quarters).filter(Quarters.GAME_ID == game_id).all()
\ No newline at end of file
+        return self.db.query(Quarters).filter(Quarters.GAME_ID == game_id).order_by(Quarters.NUMBER).all()
+
+    def get_next_number(self, game_id: int) -> int:
+        """
+        Возвращает номер следующей четверти игры: MAX(NUMBER) + 1 по индексу (GAME_ID, NUMBER)
+
+        Args:
+            game_id (int): ID сущности Game
+
+        Returns:
+            int: номер для новой четверти, 1 - у игры еще нет четвертей
+        """
+        query = select(func.coalesce(func.max(Quarters.NUMBER), 0) + 1).where(Quarters.GAME_ID == game_id)
+        return self.db.execute(query).scalar()
+
+    @staticmethod
+    def _quarter_rows_query():
+        """
+        Базовый запрос плоских строк четвертей, отсортированный по индексу (GAME_ID, NUMBER)
+
+        Returns:
+            Select: запрос строк (ID, GAME_ID, NUMBER, HOME_POINTS, VISITING_POINTS, QUARTERS).
+                QUARTERS - счет строкой "<HOME_POINTS>:<VISITING_POINTS>", как его отдает API
+        """
+        return (
+            select(
+                Quarters.ID, Quarters.GAME_ID, Quarters.NUMBER,
+                Quarters.HOME_POINTS, Quarters.VISITING_POINTS, Quarters.QUARTERS
+            )
+            .order_by(Quarters.GAME_ID, Quarters.NUMBER)
+        )
+
+    def get_all_quarter_rows(self) -> List[Row]:
+        """
+        Возвращает все Quarters одним запросом в виде плоских строк (без ORM-объектов)
+
+        Returns:
+            list[Row]: строки как у QuartersRepository._quarter_rows_query, отсортированные по GAME_ID и NUMBER
+        """
+        return list(self.db.execute(self._quarter_rows_query()).all())
+
+    def get_quarter_rows_by_game_ids(self, game_ids: Iterable[int]) -> List[Row]:
+        """
+        Возвращает Quarters для набора Game.ID запросом с IN (...) вместо запроса на каждую игру.
+        Большие наборы ID разбиваются на пачки по IN_CHUNK_SIZE
+
+        Args:
+            game_ids (Iterable[int]): ID сущностей Game
+
+        Returns:
+            list[Row]: строки как у QuartersRepository._quarter_rows_query, отсортированные по GAME_ID и NUMBER
+        """
+        game_ids = sorted(set(game_ids))
+        rows = []
+        for start in range(0, len(game_ids), self.IN_CHUNK_SIZE):
+            chunk = game_ids[start:start + self.IN_CHUNK_SIZE]
+            query = self._quarter_rows_query().where(Quarters.GAME_ID.in_(chunk))
+            rows.extend(self.db.execute(query).all())
+        return rows
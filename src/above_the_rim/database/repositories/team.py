@@ -1,4 +1,4 @@
-from typing import Optional, List, Type
+from typing import Optional, List, Type, Iterable
 from sqlalchemy.orm import Session
 
 from above_the_rim.database.models import Team
@@ -20,6 +20,18 @@ class TeamRepository:
         """
         return self.db.query(Team).filter_by(SHORT=short).first()
 
+    def get_teams_by_shorts(self, shorts: Iterable[str]) -> List[Type[Team]]:
+        """
+        Возвращает Team по набору сокращенных имен одним запросом
+
+        Args:
+            shorts (Iterable[str]): сокращенные имена команд
+
+        Returns:
+            List[Type[Team]]: найденные команды (ненайденные short просто отсутствуют в списке)
+        """
+        return self.db.query(Team).filter(Team.SHORT.in_(list(shorts))).all()
+
     def get_all_teams(self) -> List[Type[Team]]:
         """
         Возвращает все Team из БД
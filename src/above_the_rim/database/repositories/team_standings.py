@@ -0,0 +1,172 @@
+from typing import Optional, List, Iterable
+from sqlalchemy import Row, select, update, delete, insert, func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from above_the_rim.database.models import Team, TeamStandings
+
+
+class TeamStandingsRepository:
+    """
+    Репозиторий для обмена данными по материализованной турнирной таблице TeamStandings
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_standings(self, team_short: Optional[str] = None) -> List[Row]:
+        """
+        Возвращает турнирную таблицу из team_standings: чтение по первичному ключу, без пересчета по games
+
+        Args:
+            team_short (Optional[str]): сокращенное имя команды. Если передано - только по этой команде,
+                иначе - по всем командам
+
+        Returns:
+            list[Row]: строки (ID, SHORT, NAME, WIN, LOST, POINTS_FOR, POINTS_AGAINST), отсортированные по Team.ID.
+                Команды без строки в team_standings попадают в результат с нулями
+        """
+        query = (
+            select(
+                Team.ID,
+                Team.SHORT,
+                Team.NAME,
+                func.coalesce(TeamStandings.WINS, 0).label("WIN"),
+                func.coalesce(TeamStandings.LOSSES, 0).label("LOST"),
+                func.coalesce(TeamStandings.POINTS_FOR, 0).label("POINTS_FOR"),
+                func.coalesce(TeamStandings.POINTS_AGAINST, 0).label("POINTS_AGAINST"),
+            )
+            .outerjoin(TeamStandings, TeamStandings.TEAM_ID == Team.ID)
+            .order_by(Team.ID)
+        )
+        if team_short is not None:
+            query = query.where(Team.SHORT == team_short)
+        return list(self.db.execute(query).all())
+
+    def get_by_team_id(self, team_id: int) -> Optional[Row]:
+        """
+        Возвращает строку турнирной таблицы команды (поиск по первичному ключу)
+
+        Args:
+            team_id (int): ID Team
+
+        Returns:
+            Row: строка (WIN, LOST, POINTS_FOR, POINTS_AGAINST)
+            None: строки для команды нет
+        """
+        query = select(
+            TeamStandings.WINS.label("WIN"),
+            TeamStandings.LOSSES.label("LOST"),
+            TeamStandings.POINTS_FOR,
+            TeamStandings.POINTS_AGAINST,
+        ).where(TeamStandings.TEAM_ID == team_id)
+        return self.db.execute(query).first()
+
+    def add_to_team(self, team_id: int, wins: int, losses: int, points_for: int, points_against: int) -> int:
+        """
+        Атомарно прибавляет значения к строке команды: UPDATE ... SET WINS = WINS + :wins, ...
+
+        Args:
+            team_id (int): ID Team
+            wins (int): изменение количества побед (может быть отрицательным)
+            losses (int): изменение количества поражений (может быть отрицательным)
+            points_for (int): изменение набранных очков
+            points_against (int): изменение пропущенных очков
+
+        Returns:
+            int: количество обновленных строк. 0 - строки для команды еще нет
+        """
+        result = self.db.execute(
+            update(TeamStandings)
+            .where(TeamStandings.TEAM_ID == team_id)
+            .values(
+                WINS=TeamStandings.WINS + wins,
+                LOSSES=TeamStandings.LOSSES + losses,
+                POINTS_FOR=TeamStandings.POINTS_FOR + points_for,
+                POINTS_AGAINST=TeamStandings.POINTS_AGAINST + points_against,
+            )
+        )
+        return result.rowcount
+
+    def add_empty_row(self, team_id: int):
+        """
+        Добавляет нулевую строку новой команды, чтобы дальше ее строка менялась только через add_to_team
+
+        Args:
+            team_id (int): ID Team
+
+        Returns:
+            None
+        """
+        self.db.execute(insert(TeamStandings).values(TEAM_ID=team_id, WINS=0, LOSSES=0, POINTS_FOR=0, POINTS_AGAINST=0))
+
+    def insert_or_add(self, standings: Row, wins: int, losses: int, points_for: int, points_against: int):
+        """
+        Добавляет строку команды, а если ее уже вставила параллельная транзакция - прибавляет к ней изменения:
+        INSERT ... ON CONFLICT (TEAM_ID) DO UPDATE SET WINS = WINS + :wins, ... (ON DUPLICATE KEY UPDATE в MySQL)
+
+        Args:
+            standings (Row): строка (ID, WIN, LOST, POINTS_FOR, POINTS_AGAINST), посчитанная по games,
+                например из GameRepository.get_standings
+            wins (int): изменение количества побед текущей транзакции
+            losses (int): изменение количества поражений
+            points_for (int): изменение набранных очков
+            points_against (int): изменение пропущенных очков
+
+        Returns:
+            None
+        """
+        values = {
+            "TEAM_ID": standings.ID,
+            "WINS": standings.WIN,
+            "LOSSES": standings.LOST,
+            "POINTS_FOR": standings.POINTS_FOR,
+            "POINTS_AGAINST": standings.POINTS_AGAINST,
+        }
+        increments = {
+            "WINS": TeamStandings.WINS + wins,
+            "LOSSES": TeamStandings.LOSSES + losses,
+            "POINTS_FOR": TeamStandings.POINTS_FOR + points_for,
+            "POINTS_AGAINST": TeamStandings.POINTS_AGAINST + points_against,
+        }
+        dialect = self.db.get_bind(TeamStandings).dialect.name
+        if dialect == "mysql":
+            statement = mysql.insert(TeamStandings).values(values).on_duplicate_key_update(**increments)
+        else:
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = dialect_insert(TeamStandings).values(values).on_conflict_do_update(
+                index_elements=[TeamStandings.TEAM_ID], set_=increments
+            )
+        self.db.execute(statement)
+
+    def insert_rows(self, standings: Iterable[Row]):
+        """
+        Добавляет строки турнирной таблицы (executemany)
+
+        Args:
+            standings (Iterable[Row]): строки (ID, WIN, LOST, POINTS_FOR, POINTS_AGAINST),
+                например из GameRepository.get_standings
+
+        Returns:
+            None
+        """
+        values = [
+            {
+                "TEAM_ID": row.ID,
+                "WINS": row.WIN,
+                "LOSSES": row.LOST,
+                "POINTS_FOR": row.POINTS_FOR,
+                "POINTS_AGAINST": row.POINTS_AGAINST,
+            }
+            for row in standings
+        ]
+        if values:
+            self.db.execute(insert(TeamStandings), values)
+
+    def delete_all(self) -> int:
+        """
+        Удаляет все строки турнирной таблицы
+
+        Returns:
+            int: количество удаленных строк
+        """
+        return self.db.execute(delete(TeamStandings)).rowcount
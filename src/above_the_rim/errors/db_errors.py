@@ -0,0 +1,4 @@
+
+class ReadOnlySessionError(RuntimeError):
+    """Raised when a read-only session (GET request) tries to flush changes to the database."""
+    pass
@@ -1,3 +1,19 @@
 class GameNotFoundError(ValueError):
     """Raised when the provided game id not found in database."""
-    pass
\ No newline at end of file
+    pass
+
+class InvalidQuarterError(ValueError):
+    """Raised when the provided quarter score is not in '<home_score>:<visiting_score>' format."""
+    pass
+
+class GameUpdateConflictError(RuntimeError):
+    """Raised when the game score was changed concurrently and optimistic update retries are exhausted."""
+    pass
+
+class QuarterQueueFullError(RuntimeError):
+    """Raised when the write-behind quarter queue is full and the quarter was not accepted in time."""
+    pass
+
+class QuarterQueueClosedError(RuntimeError):
+    """Raised when a quarter is put into the write-behind queue that was stopped or whose writer is not running."""
+    pass
@@ -0,0 +1,4 @@
+
+class InvalidPaginationError(ValueError):
+    """Raised when the provided pagination parameters (limit, after_id) are invalid."""
+    pass
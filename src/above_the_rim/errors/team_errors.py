@@ -9,4 +9,8 @@ class TeamNotFoundError(ValueError):
 
 class TeamAlreadyExistsError(ValueError):
     """Raised when the provided team short code already exists in database."""
-    pass
\ No newline at end of file
+    pass
+
+class SameTeamError(ValueError):
+    """Raised when a team is compared with itself (head-to-head of a team against the same team)."""
+    pass
@@ -0,0 +1,189 @@
+import re
+import secrets
+from typing import Any, Optional
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Типы, которые не нужно обходить при подготовке данных для orjson
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# json.dumps(ensure_ascii=True) экранирует все символы вне печатного ASCII, включая DEL (0x7f)
+_NON_ASCII = re.compile(r"[^\x00-\x7e]")
+
+_STR_TYPE = frozenset((str,))
+
+# datetime и dataclass - через DefaultJSONProvider.default, как в json
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson is not None else 0
+
+# Компактный вывод без пробелов - его строит orjson, с остальными параметрами json.dumps используется json
+_COMPACT = {"separators": (",", ":")}
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    # Символы вне BMP - суррогатной парой, как в json.dumps
+    code -= 0x10000
+    return f"\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}"
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON-провайдер Flask (jsonify, app.json.response) на orjson, если он установлен, иначе на json.
+
+    Результат совпадает с DefaultJSONProvider байт в байт: ключи сортируются так же, как json.dumps(sort_keys=True)
+    (в том числе int-ключи - по числу, а не по строке), символы вне ASCII экранируются, datetime и dataclass
+    проходят через DefaultJSONProvider.default, int больше 64 бит переводит документ на json.dumps.
+    Отличаются только float: в экспоненциальной записи orjson пишет 1e16 и 1e-7 (json - 1e+16 и 1e-07),
+    NaN и Infinity - null (json - NaN и Infinity, которые не являются корректным JSON). float в ответах API
+    (average_margin, округленный до сотых) в экспоненциальную запись не попадают и выводятся так же, как в json.
+
+    Разбор JSON (loads) остается на json: orjson превращает слишком большие целые числа в float
+    """
+
+    def __init__(self, app: Flask, use_orjson: bool = True):
+        super().__init__(app)
+        self.use_orjson = use_orjson and orjson is not None
+        # Заглушка на месте вложенного объекта, уже сериализованного orjson (см. _prepare): случайная часть
+        # исключает совпадение с настоящими строками ответа. Фрагменты собираются в порядке их появления в выводе,
+        # поэтому заглушки без номера
+        self._fragment_placeholder = f"__json_fragment_{secrets.token_hex(8)}__"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Сериализует obj в строку JSON
+
+        Args:
+            obj (Any): данные
+            **kwargs: параметры json.dumps. orjson используется только для компактного separators=(",", ":")
+
+        Returns:
+            str: JSON
+        """
+        return self._encode(obj, **kwargs).decode()
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Как DefaultJSONProvider.response, но тело собирается сразу в байтах, без промежуточной строки
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            body = self._encode(obj, indent=2)
+        else:
+            body = self._encode(obj, **_COMPACT)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+    def _encode(self, obj: Any, **kwargs: Any) -> bytes:
+        fragments = []
+        data = None
+        if self.use_orjson and kwargs == _COMPACT:
+            data = self._encode_orjson(obj, fragments)
+        if data is None:
+            fragments.clear()
+            data = super().dumps(obj, **kwargs).encode()
+
+        if fragments:
+            data = self._insert_fragments(data.decode(), fragments).encode()
+        if self.ensure_ascii and (not data.isascii() or b"\x7f" in data):
+            data = _NON_ASCII.sub(_escape_non_ascii, data.decode()).encode()
+        return data
+
+    def _encode_orjson(self, obj: Any, fragments: list[str]) -> Optional[bytes]:
+        """
+        Сериализует через orjson. Сначала - с сортировкой ключей самим orjson: при ключах-строках порядок
+        тот же, что у json.dumps. Если есть ключи не-строки (например, ID игр) - через _prepare,
+        который сортирует ключи в Python
+
+        Args:
+            obj (Any): данные
+            fragments (list[str]): сюда складываются уже сериализованные вложенные объекты в порядке их появления
+                в выводе
+
+        Returns:
+            bytes: JSON (фрагменты - заглушками, без экранирования не-ASCII)
+            None: документ нельзя сериализовать через orjson так же, как через json.dumps
+        """
+        option = _ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if self.sort_keys else orjson.OPT_NON_STR_KEYS)
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+
+        def default(value: Any) -> Any:
+            # Вызывается уже во время сериализации - фрагмент здесь нарушил бы порядок fragments
+            return self._prepare(self.default(value), None)
+
+        fragments.clear()
+        try:
+            return orjson.dumps(
+                self._prepare(obj, fragments), default=default, option=_ORJSON_OPTIONS | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            return None
+
+    def _prepare(self, obj: Any, fragments: Optional[list[str]]) -> Any:
+        """
+        Готовит данные для orjson без его сортировки ключей: сортирует ключи dict как json.dumps(sort_keys=True)
+        (orjson сравнивал бы int-ключи как строки)
+
+        Args:
+            obj (Any): данные
+            fragments (Optional[list[str]]): сюда складываются вложенные объекты, сериализованные orjson,
+                в порядке обхода (он же порядок вывода). None - объекты обходятся только в Python
+
+        Returns:
+            Any: данные с dict в нужном порядке ключей
+        """
+        # Проверки через map и sorted по ключам идут на C: список игр обычно уже упорядочен по ID
+        # и состоит из строк, тогда он отдается orjson как есть, без копирования
+        if isinstance(obj, dict):
+            if fragments is not None and self.sort_keys and obj and _STR_TYPE.issuperset(map(type, obj)):
+                # Вложенный объект с ключами-строками (например, игра в списке по ID) сортирует сам orjson,
+                # результат вставляется фрагментом. Если глубже есть ключи не-строки или фрагменты - обход в Python
+                try:
+                    data = orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+                except orjson.JSONEncodeError:
+                    pass
+                else:
+                    fragments.append(data.decode())
+                    return self._fragment_placeholder
+            if self.sort_keys:
+                keys = list(obj)
+                sorted_keys = sorted(keys)
+                if sorted_keys != keys:
+                    obj = {key: obj[key] for key in sorted_keys}
+            if not _PLAIN_TYPES.issuperset(map(type, obj.values())):
+                obj = {
+                    key: value if type(value) in _PLAIN_TYPES else self._prepare(value, fragments)
+                    for key, value in obj.items()
+                }
+            return obj
+        if isinstance(obj, (list, tuple)):
+            if _PLAIN_TYPES.issuperset(map(type, obj)):
+                return obj
+            return [value if type(value) in _PLAIN_TYPES else self._prepare(value, fragments) for value in obj]
+        return obj
+
+    def _insert_fragments(self, data: str, fragments: list[str]) -> str:
+        """
+        Заменяет заглушки фрагментов (по порядку) их JSON
+
+        Args:
+            data (str): JSON с заглушками
+            fragments (list[str]): фрагменты в порядке появления в data
+
+        Returns:
+            str: JSON с фрагментами
+        """
+        parts = data.split(f'"{self._fragment_placeholder}"')
+        result = [None] * (len(parts) + len(fragments))
+        result[::2] = parts
+        result[1::2] = fragments
+        return "".join(result)
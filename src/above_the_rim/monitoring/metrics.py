@@ -0,0 +1,36 @@
+"""
+Blueprint: metrics_route. Содержит роут /metrics для Prometheus
+"""
+
+import hmac
+
+from flask import Blueprint, current_app, request, Response
+
+from above_the_rim.request_metrics import collect_app_samples
+
+metrics_route = Blueprint('metrics', __name__)
+
+@metrics_route.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Возвращает метрики приложения в текстовом формате Prometheus: количество и длительность запросов
+    по endpoint, коды ответов, пул соединений, кэши, очередь отложенной записи четвертей
+
+    Note:
+        Если задан METRICS_TOKEN, запрос должен содержать заголовок Authorization: Bearer <METRICS_TOKEN>
+
+    Returns:
+        401 UNAUTHORIZED: задан METRICS_TOKEN, а в запросе его нет или он другой
+        200 OK (text/plain; version=0.0.4):
+            # HELP above_the_rim_http_requests_total HTTP requests by endpoint, method and status code
+            # TYPE above_the_rim_http_requests_total counter
+            above_the_rim_http_requests_total{endpoint="team.get_teams",method="GET",status="200"} 3
+            ...
+    """
+    token = current_app.config.get("METRICS_TOKEN")
+    if token and not hmac.compare_digest(
+            request.headers.get("Authorization", "").encode(), f"Bearer {token}".encode()
+    ):
+        return Response("Unauthorized\n", status=401, mimetype="text/plain", headers={"WWW-Authenticate": "Bearer"})
+    body = current_app.request_metrics.render(collect_app_samples(current_app))
+    return Response(body, mimetype="text/plain", content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,382 @@
+import bisect
+import threading
+import time
+from typing import NamedTuple, Optional, TYPE_CHECKING
+
+from flask import Flask, g, request, Response
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import scoped_session
+
+from above_the_rim.database.db import get_engines
+
+if TYPE_CHECKING:
+    from above_the_rim.sql_instrumentation import QueryStats
+
+# Границы корзин гистограммы длительности запросов, секунд
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_PREFIX = "above_the_rim_"
+
+# Имя метрики -> (тип, описание) для строк # HELP и # TYPE
+METRIC_DESCRIPTIONS = {
+    "http_requests_total": ("counter", "HTTP requests by endpoint, method and status code"),
+    "http_request_duration_seconds": ("histogram", "HTTP request latency by endpoint and method"),
+    "http_request_db_queries_total": ("counter", "SQL queries issued by HTTP requests (SQL_INSTRUMENTATION_ENABLED)"),
+    "http_request_db_seconds_total": ("counter", "Time spent in SQL queries by HTTP requests (SQL_INSTRUMENTATION_ENABLED)"),
+    "db_pool_checkouts_total": ("counter", "Connections checked out from the pool"),
+    "db_pool_size": ("gauge", "Configured pool size"),
+    "db_pool_checked_out": ("gauge", "Connections currently checked out"),
+    "db_pool_checked_in": ("gauge", "Idle connections in the pool"),
+    "db_pool_overflow": ("gauge", "Connections open above pool size"),
+    "response_cache_hits_total": ("counter", "Response cache hits"),
+    "response_cache_misses_total": ("counter", "Response cache misses"),
+    "response_cache_hit_ratio": ("gauge", "Response cache hits / (hits + misses)"),
+    "response_cache_entries": ("gauge", "Responses in the cache"),
+    "response_cache_bytes": ("gauge", "Size of cached response bodies"),
+    "team_registry_checks_total": ("counter", "Team registry version checks against the database"),
+    "team_registry_reloads_total": ("counter", "Team registry reloads from the database"),
+    "team_registry_hit_ratio": ("gauge", "Share of team registry version checks that did not need a reload"),
+    "quarter_queue_length": ("gauge", "Quarters waiting in the write-behind queue"),
+    "quarter_queue_accepted_total": ("counter", "Quarters accepted into the write-behind queue"),
+    "quarter_queue_rejected_total": ("counter", "Quarters rejected because the queue was full or its writer was not running"),
+    "quarter_queue_written_total": ("counter", "Quarters written to the database by the queue writer"),
+    "quarter_queue_failed_total": ("counter", "Quarters the queue writer could not write"),
+    "quarter_queue_batches_total": ("counter", "Batches committed by the queue writer"),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Sample(NamedTuple):
+    """
+    Значение метрики, снятое в момент запроса /metrics (gauge или счетчик объекта приложения)
+    """
+    name: str
+    labels: Labels
+    value: float
+
+
+class _Shard:
+    """
+    Метрики одного потока. Пишет в шард только его поток, поэтому запись идет без блокировок
+    """
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self):
+        self.counters: dict[tuple[str, Labels], float] = {}
+        # (name, labels) -> [количество в каждой корзине..., в +Inf, общее количество, сумма]
+        self.histograms: dict[tuple[str, Labels], list[float]] = {}
+
+    def merge(self, other: "_Shard"):
+        """
+        Прибавляет к шарду значения другого шарда
+
+        Args:
+            other (_Shard): шард, в который уже никто не пишет, либо копия шарда
+
+        Returns:
+            None
+        """
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, histogram in other.histograms.items():
+            total = self.histograms.setdefault(key, [0] * len(histogram))
+            for index, value in enumerate(histogram):
+                total[index] += value
+
+
+# Минимальное количество шардов, при котором регистрация нового потока проверяет, не завершились ли старые
+_PRUNE_MIN_SHARDS = 64
+
+
+class RequestMetrics:
+    """
+    Счетчики и гистограммы в формате Prometheus.
+
+    Каждый поток пишет в свой шард (threading.local) без блокировок, а /metrics складывает шарды всех потоков.
+    Блокировка берется только при появлении нового потока и при чтении списка шардов, поэтому учет
+    метрик не сериализует обработку запросов.
+
+    Шарды завершившихся потоков (threaded-сервер Werkzeug запускает поток на каждый запрос) складываются
+    в общий шард завершенных потоков и удаляются из списка - при чтении метрик и при регистрации нового
+    потока, когда шардов стало вдвое больше, чем после прошлой проверки. Счетчики при этом не убывают,
+    а количество шардов ограничено числом живых потоков
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, _Shard]] = []
+        self._retired = _Shard()
+        self._prune_at = _PRUNE_MIN_SHARDS
+        self._shards_lock = threading.Lock()
+
+    def _get_shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            with self._shards_lock:
+                self._shards.append((threading.current_thread(), shard))
+                if len(self._shards) >= self._prune_at:
+                    self._prune_shards()
+                    self._prune_at = max(_PRUNE_MIN_SHARDS, 2 * len(self._shards))
+            self._local.shard = shard
+        return shard
+
+    def _prune_shards(self):
+        """
+        Переносит шарды завершившихся потоков в self._retired. Вызывается под self._shards_lock
+
+        Returns:
+            None
+        """
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                # Поток завершился - в его шард больше никто не пишет
+                self._retired.merge(shard)
+        self._shards = alive
+
+    def increment(self, name: str, labels: Labels = (), value: float = 1):
+        """
+        Увеличивает счетчик
+
+        Args:
+            name (str): имя метрики из METRIC_DESCRIPTIONS (без префикса)
+            labels (Labels): метки, например (("endpoint", "team.get_teams"),)
+            value (float): на сколько увеличить
+
+        Returns:
+            None
+        """
+        counters = self._get_shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Labels, value: float):
+        """
+        Добавляет наблюдение в гистограмму
+
+        Args:
+            name (str): имя метрики из METRIC_DESCRIPTIONS (без префикса)
+            labels (Labels): метки
+            value (float): наблюдаемое значение (для длительности - секунды)
+
+        Returns:
+            None
+        """
+        histograms = self._get_shard().histograms
+        key = (name, labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = [0] * (len(self.buckets) + 3)
+        histogram[bisect.bisect_left(self.buckets, value)] += 1
+        histogram[-2] += 1
+        histogram[-1] += value
+
+    def observe_request(
+            self,
+            endpoint: str,
+            method: str,
+            status_code: int,
+            duration: float,
+            query_stats: Optional["QueryStats"] = None):
+        """
+        Учитывает завершенный HTTP-запрос - общая для Flask (register_request_metrics) и ASGI-режима запись метрик
+
+        Args:
+            endpoint (str): endpoint роута ("unmatched" - роут не найден)
+            method (str): HTTP-метод
+            status_code (int): код ответа
+            duration (float): длительность, секунд
+            query_stats (Optional[QueryStats]): статистика SQL-запросов, если включен sql_instrumentation
+
+        Returns:
+            None
+        """
+        labels = (("endpoint", endpoint), ("method", method))
+        self.increment("http_requests_total", labels + (("status", str(status_code)),))
+        self.observe("http_request_duration_seconds", labels, duration)
+        if query_stats is not None:
+            self.increment("http_request_db_queries_total", (("endpoint", endpoint),), query_stats.count)
+            self.increment("http_request_db_seconds_total", (("endpoint", endpoint),), query_stats.duration)
+
+    def collect(self) -> tuple[dict[tuple[str, Labels], float], dict[tuple[str, Labels], list[float]]]:
+        """
+        Складывает шарды всех потоков
+
+        Returns:
+            tuple[dict, dict]: счетчики (name, labels) -> значение и гистограммы (name, labels) -> корзины
+                в формате _Shard.histograms
+        """
+        with self._shards_lock:
+            self._prune_shards()
+            total = _Shard()
+            total.merge(self._retired)
+            shards = [shard for _, shard in self._shards]
+        for shard in shards:
+            # dict.copy атомарна относительно записи в шард из его потока
+            copy = _Shard()
+            copy.counters = shard.counters.copy()
+            copy.histograms = {key: list(histogram) for key, histogram in shard.histograms.copy().items()}
+            total.merge(copy)
+        return total.counters, total.histograms
+
+    def render(self, samples: Optional[list[Sample]] = None) -> str:
+        """
+        Формирует текст в формате Prometheus (text exposition format 0.0.4)
+
+        Args:
+            samples (Optional[list[Sample]]): значения, снятые с объектов приложения (см. collect_app_samples)
+
+        Returns:
+            str: текст для ответа /metrics
+        """
+        counters, histograms = self.collect()
+        series: dict[str, list[str]] = {}
+        for (name, labels), value in sorted(counters.items()):
+            series.setdefault(name, []).append(_format_sample(name, labels, value))
+        for sample in samples or []:
+            series.setdefault(sample.name, []).append(_format_sample(sample.name, sample.labels, sample.value))
+        for (name, labels), histogram in sorted(histograms.items()):
+            lines = series.setdefault(name, [])
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), histogram):
+                cumulative += count
+                lines.append(_format_sample(f"{name}_bucket", labels + (("le", _format_value(bound)),), cumulative))
+            lines.append(_format_sample(f"{name}_count", labels, histogram[-2]))
+            lines.append(_format_sample(f"{name}_sum", labels, histogram[-1]))
+
+        output = []
+        for name in sorted(series):
+            metric_type, description = METRIC_DESCRIPTIONS.get(name, ("untyped", name))
+            output.append(f"# HELP {METRIC_PREFIX}{name} {description}")
+            output.append(f"# TYPE {METRIC_PREFIX}{name} {metric_type}")
+            output.extend(series[name])
+        return "\n".join(output) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_sample(name: str, labels: Labels, value: float) -> str:
+    if not labels:
+        return f"{METRIC_PREFIX}{name} {_format_value(value)}"
+    formatted_labels = ",".join(f'{key}="{_escape_label(str(label))}"' for key, label in labels)
+    return f"{METRIC_PREFIX}{name}{{{formatted_labels}}} {_format_value(value)}"
+
+
+def _engine_names(db: scoped_session) -> list[tuple[str, Engine]]:
+    return list(zip(("primary", "replica"), get_engines(db)))
+
+
+def collect_app_samples(app: Flask) -> list[Sample]:
+    """
+    Снимает текущие значения с объектов приложения: пул соединений, кэш ответов, справочник команд,
+    очередь отложенной записи четвертей (если они есть)
+
+    Args:
+        app (Flask): приложение из create_app
+
+    Returns:
+        list[Sample]: значения метрик
+    """
+    samples = []
+    for db_name, engine in _engine_names(app.db):
+        pool = engine.pool
+        labels = (("db", db_name),)
+        for name, method in (
+                ("db_pool_size", "size"), ("db_pool_checked_out", "checkedout"),
+                ("db_pool_checked_in", "checkedin"), ("db_pool_overflow", "overflow")):
+            # SingletonThreadPool/StaticPool (SQLite в памяти) не ведут этот учет
+            if callable(getattr(pool, method, None)):
+                samples.append(Sample(name, labels, getattr(pool, method)()))
+
+    response_cache = getattr(app, "response_cache", None)
+    if response_cache is not None:
+        hits, misses = response_cache.hits, response_cache.misses
+        samples.extend([
+            Sample("response_cache_hits_total", (), hits),
+            Sample("response_cache_misses_total", (), misses),
+            Sample("response_cache_hit_ratio", (), hits / (hits + misses) if hits + misses else 0),
+            Sample("response_cache_entries", (), len(response_cache)),
+            Sample("response_cache_bytes", (), response_cache.size),
+        ])
+
+    team_registry = getattr(app, "team_registry", None)
+    if team_registry is not None:
+        checks, reloads = team_registry.checks, team_registry.reloads
+        samples.extend([
+            Sample("team_registry_checks_total", (), checks),
+            Sample("team_registry_reloads_total", (), reloads),
+            Sample("team_registry_hit_ratio", (), (checks - reloads) / checks if checks else 0),
+        ])
+
+    quarter_queue = getattr(app, "quarter_queue", None)
+    if quarter_queue is not None:
+        samples.extend([
+            Sample("quarter_queue_length", (), len(quarter_queue)),
+            Sample("quarter_queue_accepted_total", (), quarter_queue.accepted),
+            Sample("quarter_queue_rejected_total", (), quarter_queue.rejected),
+            Sample("quarter_queue_written_total", (), quarter_queue.written),
+            Sample("quarter_queue_failed_total", (), quarter_queue.failed),
+            Sample("quarter_queue_batches_total", (), quarter_queue.batches),
+        ])
+    return samples
+
+
+def register_request_metrics(app: Flask, db: scoped_session, metrics: RequestMetrics):
+    """
+    Учитывает каждый HTTP-запрос: количество по endpoint/методу/коду ответа и гистограмму длительности.
+    Если включен учет SQL (sql_instrumentation), добавляет количество и время SQL-запросов по endpoint.
+    Также считает выдачи соединений из пула каждого engine
+
+    Args:
+        app (Flask): приложение
+        db (scoped_session): сессия из init_db
+        metrics (RequestMetrics): хранилище метрик
+
+    Returns:
+        None
+    """
+    for db_name, engine in _engine_names(db):
+        labels = (("db", db_name),)
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy, labels=labels):
+            metrics.increment("db_pool_checkouts_total", labels)
+
+    def record_request(status_code: int):
+        started_at = g.pop("metrics_started_at", None)
+        if started_at is None:
+            return
+        metrics.observe_request(
+            request.endpoint or "unmatched", request.method, status_code,
+            time.perf_counter() - started_at, g.get("query_stats")
+        )
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_started_at = time.perf_counter()
+
+    @app.after_request
+    def observe_response(response: Response) -> Response:
+        record_request(response.status_code)
+        return response
+
+    @app.teardown_request
+    def observe_unhandled_error(exception=None):
+        # after_request не вызывается, если исключение не обработано - такой запрос завершится ответом 500
+        if exception is not None:
+            record_request(500)
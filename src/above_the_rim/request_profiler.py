@@ -0,0 +1,139 @@
+import cProfile
+import hmac
+import itertools
+import os
+import re
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_MODE_HEADER = "X-Profile-Mode"
+CPU_MODE = "cpu"
+MEMORY_MODE = "memory"
+
+
+class RequestProfiler:
+    """
+    WSGI-middleware профилирования отдельных запросов без передеплоя.
+
+    Запрос профилируется, если:
+        - в нем передан заголовок X-Profile с общим секретом (secret). X-Profile-Mode: memory - вместо
+          cProfile снимается снимок tracemalloc;
+        - или он попал в выборку: для endpoint из sample_rates профилируется каждый N-й запрос (cProfile).
+
+    Результат пишется в output_dir: <время>-<endpoint>-<длительность>ms.prof (pstats) или
+    <время>-<endpoint>-<длительность>ms-<пик>KiB.tracemalloc (tracemalloc.Snapshot.dump).
+
+    Профилируемый запрос выполняется целиком, включая формирование потокового тела ответа,
+    которое для этого собирается в памяти. tracemalloc действует на весь процесс, а cProfile в Python 3.12+
+    работает через sys.monitoring и не допускает второго активного профиля (ValueError), поэтому одновременно
+    снимается только один профиль каждого вида - остальные такие запросы выполняются без профилирования
+    """
+
+    def __init__(
+            self,
+            wsgi_app: Callable,
+            url_map: Map,
+            output_dir: str,
+            secret: Optional[str] = None,
+            sample_rates: Optional[dict[str, int]] = None):
+        self.wsgi_app = wsgi_app
+        self.url_map = url_map
+        self.output_dir = output_dir
+        self.secret = secret
+        self.sample_rates = sample_rates or {}
+        self._sample_counters = {endpoint: itertools.count(1) for endpoint in self.sample_rates}
+        self._cpu_lock = threading.Lock()
+        self._memory_lock = threading.Lock()
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        mode, endpoint = self._get_mode(environ)
+        if mode == CPU_MODE and self._cpu_lock.acquire(blocking=False):
+            try:
+                return self._profile_cpu(environ, start_response, endpoint)
+            finally:
+                self._cpu_lock.release()
+        if mode == MEMORY_MODE and self._memory_lock.acquire(blocking=False):
+            try:
+                return self._profile_memory(environ, start_response, endpoint)
+            finally:
+                self._memory_lock.release()
+        return self.wsgi_app(environ, start_response)
+
+    def _get_mode(self, environ: dict) -> tuple[Optional[str], Optional[str]]:
+        """
+        Решает, профилировать ли запрос
+
+        Args:
+            environ (dict): WSGI environ запроса
+
+        Returns:
+            tuple[Optional[str], Optional[str]]: режим (CPU_MODE, MEMORY_MODE или None - не профилировать)
+                и endpoint запроса
+        """
+        header_secret = environ.get("HTTP_X_PROFILE")
+        if self.secret and header_secret and hmac.compare_digest(header_secret.encode(), self.secret.encode()):
+            mode = environ.get("HTTP_X_PROFILE_MODE", CPU_MODE).lower()
+            return (MEMORY_MODE if mode == MEMORY_MODE else CPU_MODE), self._resolve_endpoint(environ)
+
+        if not self.sample_rates:
+            return None, None
+        endpoint = self._resolve_endpoint(environ)
+        counter = self._sample_counters.get(endpoint)
+        # next() у itertools.count атомарен под GIL - блокировка не нужна
+        if counter is not None and next(counter) % self.sample_rates[endpoint] == 0:
+            return CPU_MODE, endpoint
+        return None, endpoint
+
+    def _resolve_endpoint(self, environ: dict) -> str:
+        try:
+            endpoint, _ = self.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            return "unmatched"
+        return endpoint
+
+    def _run(self, environ: dict, start_response: Callable) -> list[bytes]:
+        iterable = self.wsgi_app(environ, start_response)
+        try:
+            return list(iterable)
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+
+    def _dump_path(self, endpoint: str, elapsed: float, suffix: str) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        safe_endpoint = re.sub(r"[^\w.-]", "_", endpoint)
+        return os.path.join(self.output_dir, f"{timestamp}-{safe_endpoint}-{elapsed * 1000:.0f}ms{suffix}")
+
+    def _profile_cpu(self, environ: dict, start_response: Callable, endpoint: str) -> list[bytes]:
+        profile = cProfile.Profile()
+        started_at = time.perf_counter()
+        profile.enable()
+        try:
+            return self._run(environ, start_response)
+        finally:
+            profile.disable()
+            profile.dump_stats(self._dump_path(endpoint, time.perf_counter() - started_at, ".prof"))
+
+    def _profile_memory(self, environ: dict, start_response: Callable, endpoint: str) -> list[bytes]:
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start(25)
+        tracemalloc.reset_peak()
+        started_at = time.perf_counter()
+        try:
+            return self._run(environ, start_response)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if not already_tracing:
+                tracemalloc.stop()
+            snapshot.dump(self._dump_path(endpoint, elapsed, f"-{peak // 1024}KiB.tracemalloc"))
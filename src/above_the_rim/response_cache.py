@@ -0,0 +1,136 @@
+import gzip
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Hashable
+
+from above_the_rim.response_compression import ResponseCompressor, IDENTITY, GZIP
+
+
+class CachedResponse(NamedTuple):
+    """
+    Закэшированный ответ: готовые байты тела в нужных кодировках (IDENTITY, GZIP, BROTLI) и ETag данных,
+    по которым он построен
+    """
+    etag: str
+    mimetype: str
+    bodies: dict[str, bytes]
+
+    @property
+    def size(self) -> int:
+        return sum(len(body) for body in self.bodies.values())
+
+
+class ResponseCache:
+    """
+    Кэш готовых (уже сериализованных, опционально сжатых) тел ответов с LRU-вытеснением по размеру.
+    Сжатые версии строятся один раз при сохранении, поэтому частые опросы не сжимают одно и то же тело заново:
+    во всех сжатиях compressor (для тел от compressor.min_size) и, с gzip_enabled, gzip для тела любого размера.
+
+    Ключ - роут и query string, значение действительно только для ETag (версий данных), с которым оно сохранено.
+    Любая запись в teams/games/quarters меняет версии данных, поэтому устаревшая запись просто не совпадет
+    по ETag и будет удалена при следующем обращении - в том числе если запись сделал другой процесс
+    """
+
+    def __init__(
+            self,
+            max_bytes: int,
+            gzip_enabled: bool = False,
+            gzip_level: int = 6,
+            compressor: Optional[ResponseCompressor] = None):
+        self.max_bytes = max_bytes
+        self.gzip_enabled = gzip_enabled
+        self.gzip_level = gzip_level
+        self.compressor = compressor
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        Суммарный размер тел ответов в кэше, байт
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, etag: str) -> Optional[CachedResponse]:
+        """
+        Возвращает закэшированный ответ, если он построен по тем же версиям данных
+
+        Args:
+            key (Hashable): ключ ответа (роут и query string)
+            etag (str): текущий ETag данных
+
+        Returns:
+            CachedResponse: ответ из кэша
+            None: ответа нет или он устарел (устаревший ответ удаляется)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.etag == etag:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, etag: str, body: bytes, mimetype: str) -> CachedResponse:
+        """
+        Сохраняет тело ответа (и его сжатые версии, если включено), вытесняя давно не использованные записи
+
+        Args:
+            key (Hashable): ключ ответа (роут и query string)
+            etag (str): ETag данных, по которым построен ответ
+            body (bytes): сериализованное тело ответа
+            mimetype (str): mimetype ответа
+
+        Returns:
+            CachedResponse: сохраненная запись. Если она больше max_bytes - возвращается, но не сохраняется
+        """
+        bodies = {IDENTITY: body}
+        if self.compressor is not None:
+            bodies.update(self.compressor.compress_all(body))
+        if self.gzip_enabled and GZIP not in bodies:
+            bodies[GZIP] = gzip.compress(body, compresslevel=self.gzip_level)
+        entry = CachedResponse(etag, mimetype, bodies)
+        if entry.size > self.max_bytes:
+            return entry
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+        return entry
+
+    def invalidate(self):
+        """
+        Полностью очищает кэш
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: Hashable):
+        """
+        Удаляет запись. Вызывается под self._lock
+
+        Args:
+            key (Hashable): ключ ответа
+
+        Returns:
+            None
+        """
+        entry = self._entries.pop(key)
+        self._size -= entry.size
@@ -0,0 +1,178 @@
+import gzip
+from typing import Iterable, Optional
+
+from flask import Flask, Response, request
+from werkzeug.datastructures import Accept, ETags
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+# Сжатия в порядке предпочтения сервера: brotli сжимает JSON лучше gzip. Доступен, если установлен пакет brotli
+ENCODINGS_PREFERENCE = (BROTLI, GZIP)
+AVAILABLE_ENCODINGS = tuple(encoding for encoding in ENCODINGS_PREFERENCE if encoding != BROTLI or brotli is not None)
+JSON_MIMETYPE = "application/json"
+
+
+def negotiate_encoding(accept_encodings: Accept, encodings: Iterable[str]) -> str:
+    """
+    Выбирает сжатие по Accept-Encoding клиента: с наибольшим q, при равных - первое из encodings
+
+    Args:
+        accept_encodings (Accept): Accept-Encoding запроса (request.accept_encodings)
+        encodings (Iterable[str]): доступные сжатия в порядке предпочтения сервера
+
+    Returns:
+        str: сжатие, либо IDENTITY - клиент не принимает ни одно из доступных
+    """
+    best, best_quality = IDENTITY, 0
+    for encoding in encodings:
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    ETag сжатого представления: у сжатого и несжатого тела разные байты, поэтому и разные ETag
+
+    Args:
+        etag (str): ETag несжатого ответа
+        encoding (str): сжатие
+
+    Returns:
+        str: ETag представления
+    """
+    return etag if encoding == IDENTITY else f"{etag}-{encoding}"
+
+
+def find_matching_etag(etag: str, if_none_match: ETags, accept_encodings: Accept) -> Optional[str]:
+    """
+    Ищет в If-None-Match ETag любого представления текущих данных, которое клиент может принять
+
+    Args:
+        etag (str): ETag несжатого ответа по текущим версиям данных
+        if_none_match (ETags): If-None-Match запроса
+        accept_encodings (Accept): Accept-Encoding запроса
+
+    Returns:
+        str: совпавший ETag (для ответа 304)
+        None: совпадений нет
+    """
+    if not if_none_match:
+        return None
+    for encoding in (IDENTITY, *ENCODINGS_PREFERENCE):
+        representation_etag = encoded_etag(etag, encoding)
+        if (encoding == IDENTITY or accept_encodings[encoding]) and if_none_match.contains(representation_etag):
+            return representation_etag
+    return None
+
+
+class ResponseCompressor:
+    """
+    Сжатие тел ответов: gzip и brotli (если установлен пакет brotli). Тела меньше min_size не сжимаются -
+    выигрыш в размере не окупает время на сжатие и распаковку
+    """
+
+    def __init__(
+            self,
+            encodings: Iterable[str] = AVAILABLE_ENCODINGS,
+            min_size: int = 1024,
+            gzip_level: int = 6,
+            brotli_quality: int = 5):
+        self.encodings = tuple(encoding for encoding in encodings if encoding in AVAILABLE_ENCODINGS)
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """
+        Сжимает тело
+
+        Args:
+            body (bytes): тело ответа
+            encoding (str): GZIP или BROTLI
+
+        Returns:
+            bytes: сжатое тело
+        """
+        if encoding == BROTLI:
+            return brotli.compress(body, quality=self.brotli_quality)
+        # mtime=0 - одинаковое тело дает одинаковые байты, ETag сжатого представления остается верным
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compress_all(self, body: bytes) -> dict[str, bytes]:
+        """
+        Сжимает тело всеми доступными сжатиями - для кэша готовых ответов
+
+        Args:
+            body (bytes): тело ответа
+
+        Returns:
+            dict[str, bytes]: сжатие -> сжатое тело. Пустой, если тело меньше min_size
+        """
+        if len(body) < self.min_size:
+            return {}
+        return {encoding: self.compress(body, encoding) for encoding in self.encodings}
+
+
+def compress_for_client(
+        body: bytes,
+        accept_encodings: Accept,
+        compressor: Optional[ResponseCompressor]) -> tuple[bytes, str, bool]:
+    """
+    Сжимает тело ответа сжатием, выбранным по Accept-Encoding клиента. Общая для Flask (register_response_compression)
+    и ASGI-режима логика сжатия ответов, которые не лежат в кэше готовых ответов
+
+    Args:
+        body (bytes): тело ответа
+        accept_encodings (Accept): Accept-Encoding запроса
+        compressor (Optional[ResponseCompressor]): настройки сжатия. None - сжатие выключено
+
+    Returns:
+        tuple[bytes, str, bool]: тело, сжатие (IDENTITY - тело не сжато) и нужен ли Vary: Accept-Encoding
+            (тело могло быть сжато для другого клиента)
+    """
+    if compressor is None or len(body) < compressor.min_size:
+        return body, IDENTITY, False
+    encoding = negotiate_encoding(accept_encodings, compressor.encodings)
+    if encoding == IDENTITY:
+        return body, IDENTITY, True
+    return compressor.compress(body, encoding), encoding, True
+
+
+def register_response_compression(app: Flask, compressor: ResponseCompressor):
+    """
+    Сжимает JSON-ответы (api/v1, api/v2) по Accept-Encoding клиента.
+
+    Ответы, уже сжатые кэшем готовых ответов (conditional_by_data_versions), потоковые ответы и тела
+    меньше compressor.min_size отдаются как есть. ETag сжатого ответа получает суффикс сжатия (encoded_etag)
+
+    Args:
+        app (Flask): приложение
+        compressor (ResponseCompressor): настройки сжатия
+
+    Returns:
+        None
+    """
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        if (response.mimetype != JSON_MIMETYPE or response.is_streamed or response.direct_passthrough
+                or "Content-Encoding" in response.headers):
+            return response
+        body, encoding, vary = compress_for_client(response.get_data(), request.accept_encodings, compressor)
+        if vary:
+            response.vary.add("Accept-Encoding")
+        if encoding == IDENTITY:
+            return response
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag is not None:
+            response.set_etag(encoded_etag(etag, encoding), weak)
+        return response
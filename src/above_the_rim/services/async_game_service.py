@@ -0,0 +1,111 @@
+from typing import Optional
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from above_the_rim.database.repositories.async_game import AsyncGameRepository
+from above_the_rim.database.repositories.async_quarters import AsyncQuartersRepository
+from above_the_rim.services.game_service import GameService
+
+
+class AsyncGameService:
+    """
+    Асинхронный сервис чтения Game для ASGI-режима. Возвращает те же структуры, что GameService,
+    поэтому ответы ASGI-роутов совпадают с ответами Flask-роутов.
+    Запись (добавление игр и четвертей) остается за GameService
+    """
+
+    def __init__(
+            self,
+            db: AsyncSession,
+            game_repository: AsyncGameRepository,
+            quarters_repository: AsyncQuartersRepository):
+        self.db = db
+        self.game_repository = game_repository
+        self.quarters_repository = quarters_repository
+
+    async def get_all_game_rows(self) -> list[Row]:
+        """
+        Возвращает все игры плоскими строками с именами команд
+
+        Returns:
+            list[Row]: строки как у GameService.get_all_game_rows
+        """
+        return await self.game_repository.get_all_game_rows()
+
+    async def get_game_rows_page(self, limit: int, after_id: Optional[int] = None) -> tuple[list[Row], Optional[int]]:
+        """
+        Возвращает страницу игр и курсор следующей страницы, см. GameService.get_game_rows_page
+
+        Args:
+            limit (int): максимальное количество игр на странице
+            after_id (Optional[int]): курсор - ID последней игры предыдущей страницы. None - первая страница
+
+        Returns:
+            tuple[list[Row], Optional[int]]: строки игр и next_cursor
+        """
+        games = await self.game_repository.get_game_rows_after_id(limit + 1, after_id)
+        if len(games) > limit:
+            games = games[:limit]
+            return games, games[-1].ID
+        return games, None
+
+    async def get_game_rows_by_page_params(
+            self,
+            page_params: Optional[tuple[int, Optional[int]]]) -> tuple[list[Row], Optional[int]]:
+        """
+        Возвращает все игры или страницу игр, см. GameService.get_game_rows_by_page_params
+
+        Args:
+            page_params (Optional[tuple[int, Optional[int]]]): (limit, after_id), None - все игры
+
+        Returns:
+            tuple[list[Row], Optional[int]]: строки игр и next_cursor (для всех игр - None)
+        """
+        if page_params is None:
+            return await self.get_all_game_rows(), None
+        return await self.get_game_rows_page(*page_params)
+
+    async def get_all_games_with_quarters(self) -> list[dict[str, object]]:
+        """
+        Возвращает все Games с Quarters двумя запросами, см. GameService.get_all_games_with_quarters
+
+        Returns:
+            list[dict[str, object]]: [{"game": <Row>, "quarters": [<Row>]}]
+        """
+        games = await self.game_repository.get_all_game_rows()
+        quarters = await self.quarters_repository.get_all_quarter_rows()
+        return GameService._attach_quarters(games, quarters)
+
+    async def get_games_with_quarters_page(
+            self,
+            limit: int,
+            after_id: Optional[int] = None) -> tuple[list[dict[str, object]], Optional[int]]:
+        """
+        Возвращает страницу Games с Quarters и курсор следующей страницы, см. GameService.get_games_with_quarters_page
+
+        Args:
+            limit (int): максимальное количество игр на странице
+            after_id (Optional[int]): курсор - ID последней игры предыдущей страницы. None - первая страница
+
+        Returns:
+            tuple[list[dict[str, object]], Optional[int]]: структура как у get_all_games_with_quarters и next_cursor
+        """
+        games, next_cursor = await self.get_game_rows_page(limit, after_id)
+        quarters = await self.quarters_repository.get_quarter_rows_by_game_ids(game.ID for game in games)
+        return GameService._attach_quarters(games, quarters), next_cursor
+
+    async def get_games_with_quarters_by_page_params(
+            self,
+            page_params: Optional[tuple[int, Optional[int]]]) -> tuple[list[dict[str, object]], Optional[int]]:
+        """
+        Возвращает все Games с Quarters или их страницу, см. GameService.get_games_with_quarters_by_page_params
+
+        Args:
+            page_params (Optional[tuple[int, Optional[int]]]): (limit, after_id), None - все игры
+
+        Returns:
+            tuple[list[dict[str, object]], Optional[int]]: структура как у get_all_games_with_quarters и next_cursor
+        """
+        if page_params is None:
+            return await self.get_all_games_with_quarters(), None
+        return await self.get_games_with_quarters_page(*page_params)
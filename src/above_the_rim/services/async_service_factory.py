@@ -0,0 +1,44 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from above_the_rim.database.repositories.async_data_version import AsyncDataVersionRepository
+from above_the_rim.database.repositories.async_game import AsyncGameRepository
+from above_the_rim.database.repositories.async_quarters import AsyncQuartersRepository
+from above_the_rim.database.repositories.async_team import AsyncTeamRepository
+from above_the_rim.services.async_game_service import AsyncGameService
+from above_the_rim.services.async_team_service import AsyncTeamService
+
+
+class AsyncServiceFactory:
+    """
+    Фабрика асинхронных сервисов. Создается на каждый запрос вокруг его AsyncSession
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def get_game_service(self) -> AsyncGameService:
+        """
+        Инициализирует и возвращает AsyncGameService
+
+        Returns:
+            AsyncGameService: асинхронный сервис чтения Game
+        """
+        return AsyncGameService(self.db, AsyncGameRepository(self.db), AsyncQuartersRepository(self.db))
+
+    def get_team_service(self) -> AsyncTeamService:
+        """
+        Инициализирует и возвращает AsyncTeamService
+
+        Returns:
+            AsyncTeamService: асинхронный сервис чтения Team
+        """
+        return AsyncTeamService(self.db, AsyncTeamRepository(self.db))
+
+    def get_data_version_repository(self) -> AsyncDataVersionRepository:
+        """
+        Инициализирует и возвращает AsyncDataVersionRepository
+
+        Returns:
+            AsyncDataVersionRepository: репозиторий версий данных для ETag
+        """
+        return AsyncDataVersionRepository(self.db)
@@ -0,0 +1,37 @@
+from typing import Optional
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from above_the_rim.database.repositories.async_team import AsyncTeamRepository
+
+
+class AsyncTeamService:
+    """
+    Асинхронный сервис чтения Team для ASGI-режима. Запись (добавление и удаление команд) остается за TeamService
+    """
+
+    def __init__(self, db: AsyncSession, team_repo: AsyncTeamRepository):
+        self.db = db
+        self.team_repo = team_repo
+
+    async def get_all_teams(self) -> list[Row]:
+        """
+        Возвращает все команды
+
+        Returns:
+            list[Row]: строки (ID, SHORT, NAME) в порядке Team.ID
+        """
+        return await self.team_repo.get_all_teams()
+
+    async def get_team_by_short(self, short: str) -> Optional[Row]:
+        """
+        Возвращает команду по сокращенному имени
+
+        Args:
+            short (str): сокращенное имя команды
+
+        Returns:
+            Row: строка (ID, SHORT, NAME)
+            None: команды нет
+        """
+        return await self.team_repo.get_team_by_short(short)
@@ -0,0 +1,40 @@
+from typing import Iterable
+from sqlalchemy.orm import Session
+
+from above_the_rim.database.repositories.data_version import DataVersionRepository
+
+
+class DataVersionService:
+    """
+    Сервис версий данных: по версиям таблиц строит ETag для условных GET-запросов
+    """
+
+    def __init__(self, db: Session, data_version_repository: DataVersionRepository):
+        self.db = db
+        self.data_version_repository = data_version_repository
+
+    def get_etag(self, names: Iterable[str]) -> str:
+        """
+        Строит ETag из версий наборов данных одним запросом по первичному ключу, без чтения самих данных.
+        Любая запись в один из наборов меняет ETag
+
+        Args:
+            names (Iterable[str]): имена наборов данных, от которых зависит ответ, например ('teams', 'games')
+
+        Returns:
+            str: значение ETag (без кавычек), например 'teams.3-games.10'
+        """
+        return self.format_etag(self.data_version_repository.get_versions(names))
+
+    @staticmethod
+    def format_etag(versions: dict[str, int]) -> str:
+        """
+        Собирает ETag из версий наборов данных
+
+        Args:
+            versions (dict[str, int]): имя набора данных -> версия, в порядке перечисления в роуте
+
+        Returns:
+            str: значение ETag (без кавычек), например 'teams.3-games.10'
+        """
+        return "-".join(f"{name}.{version}" for name, version in versions.items())
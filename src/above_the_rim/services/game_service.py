@@ -1,12 +1,20 @@
-from typing import Type
+from typing import Type, Optional, Iterator, Union
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from above_the_rim.database.models import Game, Team, Quarters
+from above_the_rim.database.db import use_primary
+from above_the_rim.database.models import Game, Quarters
+from above_the_rim.database.repositories.data_version import (
+    DataVersionRepository, GAMES_VERSION, QUARTERS_VERSION, STANDINGS_VERSION
+)
 from above_the_rim.database.repositories.game import GameRepository
 from above_the_rim.database.repositories.team import TeamRepository
 from above_the_rim.database.repositories.quarters import QuartersRepository
-from above_the_rim.errors.game_errors import GameNotFoundError
-from above_the_rim.errors.team_errors import TeamNotFoundError
+from above_the_rim.database.repositories.team_standings import TeamStandingsRepository
+from above_the_rim.errors.game_errors import GameNotFoundError, InvalidQuarterError, GameUpdateConflictError
+from above_the_rim.errors.team_errors import TeamNotFoundError, SameTeamError
+from above_the_rim.services.team_registry import TeamRegistry, TeamEntry
 
 
 class GameService:
@@ -18,11 +26,21 @@ class GameService:
             db: Session,
             game_repository: GameRepository,
             team_repository: TeamRepository,
-            quarters_repository: QuartersRepository):
+            quarters_repository: QuartersRepository,
+            team_standings_repository: TeamStandingsRepository,
+            team_registry: TeamRegistry,
+            data_version_repository: DataVersionRepository,
+            optimistic_score_updates: bool = False,
+            score_update_retries: int = 3):
         self.db = db
         self.game_repository = game_repository
         self.team_repository = team_repository
         self.quarters_repository = quarters_repository
+        self.team_standings_repository = team_standings_repository
+        self.team_registry = team_registry
+        self.data_version_repository = data_version_repository
+        self.optimistic_score_updates = optimistic_score_updates
+        self.score_update_retries = score_update_retries
 
     def get_all_games(self) -> list[Type[Game]]:
         """
@@ -34,6 +52,50 @@ class GameService:
         """
         return self.game_repository.get_all_games()
 
+    def get_all_game_rows(self) -> list[Row]:
+        """
+        Возвращает все игры в виде плоских строк с именами команд (без ORM-объектов)
+
+        Returns:
+            list[Row]: строки (ID, HOME_TEAM_NAME, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VISITING_TEAM_NAME)
+        """
+        return self.game_repository.get_all_game_rows()
+
+    def get_game_rows_page(self, limit: int, after_id: Optional[int] = None) -> tuple[list[Row], Optional[int]]:
+        """
+        Возвращает страницу игр (keyset pagination по Game.ID) и курсор следующей страницы
+
+        Args:
+            limit (int): максимальное количество игр на странице
+            after_id (Optional[int]): курсор - ID последней игры предыдущей страницы. None - первая страница
+
+        Returns:
+            tuple[list[Row], Optional[int]]: строки игр (как у GameService.get_all_game_rows)
+                и next_cursor - значение after_id для следующей страницы, либо None, если страница последняя
+        """
+        # Берем на одну запись больше, чтобы понять, есть ли следующая страница, без отдельного COUNT
+        games = self.game_repository.get_game_rows_after_id(limit + 1, after_id)
+        if len(games) > limit:
+            games = games[:limit]
+            return games, games[-1].ID
+        return games, None
+
+    def get_game_rows_by_page_params(
+            self,
+            page_params: Optional[tuple[int, Optional[int]]]) -> tuple[list[Row], Optional[int]]:
+        """
+        Возвращает все игры или страницу игр - по параметрам пагинации запроса (utils.get_page_params)
+
+        Args:
+            page_params (Optional[tuple[int, Optional[int]]]): (limit, after_id), None - все игры
+
+        Returns:
+            tuple[list[Row], Optional[int]]: строки игр и next_cursor (для всех игр - None)
+        """
+        if page_params is None:
+            return self.get_all_game_rows(), None
+        return self.get_game_rows_page(*page_params)
+
     def add_game_by_data(self, home_short:str, visiting_short:str, home_score:int=0, visiting_score:int=0) -> Game:
         """
         Добавляет новую запись Game в базу данных, принимая примитивные параметры, состовляющие Game
@@ -51,10 +113,12 @@ class GameService:
             TeamNotFoundError: домашнюю или гостевую команду не удалось найти по сокращенному имени.
 
         Note:
-            Для валидации team_short используй TeamService.validate_team_short
+            Для валидации team_short используй TeamService.validate_team_short.
+            Справочник команд другого процесса может еще помнить удаленную команду - тогда вставка нарушает
+            внешний ключ, справочник сбрасывается, а ошибка сообщается как TeamNotFoundError
         """
-        home_team = self.team_repository.get_team_by_short(home_short)
-        visiting_team = self.team_repository.get_team_by_short(visiting_short)
+        home_team = self.team_registry.get_team(home_short)
+        visiting_team = self.team_registry.get_team(visiting_short)
 
         if home_team is None:
             raise TeamNotFoundError(f"Home team short {home_short} does not exist")
@@ -71,27 +135,38 @@ class GameService:
 
         try:
             self.db.add(new_game)
+            self._update_standings(
+                home_team.ID, visiting_team.ID,
+                old_scores=(0, 0),
+                new_scores=(home_score, visiting_score),
+                is_new_game=True
+            )
+            self.data_version_repository.bump(GAMES_VERSION)
             self.db.commit()
             self.db.refresh(new_game)
             return new_game
+        except IntegrityError as e:
+            self.db.rollback()
+            self.team_registry.invalidate()
+            raise TeamNotFoundError(f"Team {home_short} or {visiting_short} does not exist") from e
         except:
             self.db.rollback()
             raise
 
-    def _get_team_or_raise(self, team_short:str) -> Team:
+    def _get_team_or_raise(self, team_short:str) -> TeamEntry:
         """
-        Поиск Team по team_short в БД, в случае ненахождения - исключение
+        Поиск Team по team_short в справочнике команд (TeamRegistry), в случае ненахождения - исключение
 
         Args:
             team_short: Короткое имя команды. Например: 'ATL'.
 
         Returns:
-            Team: объект команды из базы
+            TeamEntry: команда из справочника (ID, SHORT, NAME)
 
         Raises:
             TeamNotFoundError: не найдена по короткому имени
         """
-        team = self.team_repository.get_team_by_short(team_short)
+        team = self.team_registry.get_team(team_short)
         if team is None:
             raise TeamNotFoundError(f"Team short {team_short} does not exist")
         return team
@@ -208,9 +283,351 @@ class GameService:
         """
         return self.get_home_loses(team_short) + self.get_visiting_losses(team_short)
 
+    @staticmethod
+    def _standing_to_dict(standing) -> dict:
+        """
+        Приводит строку турнирной таблицы из GameRepository.get_standings к формату статистики команды
+
+        Args:
+            standing (Row): строка (ID, SHORT, NAME, WIN, LOST)
+
+        Returns:
+            dict: {"name": "Example Team", "short": "EXP", "win": 10, "lost": 3}
+        """
+        return {
+            "name": standing.NAME,
+            "short": standing.SHORT,
+            "win": int(standing.WIN),
+            "lost": int(standing.LOST),
+        }
+
+    def get_team_standing(self, team_short: str) -> dict:
+        """
+        Возвращает победы и поражения одной команды из материализованной таблицы team_standings.
+        Команда ищется в справочнике TeamRegistry, статистика читается одним запросом по первичному ключу
+
+        Args:
+            team_short (str): 3 символа, uppercase. Короткое имя команды. Например: 'ATL'.
+
+        Returns:
+            dict: {"name": "Example Team", "short": "EXP", "win": 10, "lost": 3}
+
+        Raises:
+            TeamNotFoundError: не найдена по короткому имени
+
+        Note:
+            Для валидации team_short используй TeamService.validate_team_short
+        """
+        team = self._get_team_or_raise(team_short)
+        standing = self.team_standings_repository.get_by_team_id(team.ID)
+        return {
+            "name": team.NAME,
+            "short": team.SHORT,
+            "win": standing.WIN if standing else 0,
+            "lost": standing.LOST if standing else 0,
+        }
+
+    def get_standings(self) -> list[dict]:
+        """
+        Возвращает турнирную таблицу всех команд одним запросом к team_standings
+
+        Returns:
+            list[dict]: список статистик команд, отсортированный по победам (по убыванию),
+                затем по поражениям (по возрастанию) и по short. Пример:
+                [
+                    {"name": "Example Team", "short": "EXP", "win": 10, "lost": 3}
+                ]
+        """
+        standings = [self._standing_to_dict(row) for row in self.team_standings_repository.get_standings()]
+        standings.sort(key=lambda item: (-item["win"], item["lost"], item["short"]))
+        return standings
+
+    def get_head_to_head(self, team_short: str, opponent_short: str) -> dict:
+        """
+        Возвращает очные встречи двух команд с точки зрения team_short: победы и поражения, отдельно
+        дома и в гостях, и среднюю разницу очков. Команды ищутся в справочнике TeamRegistry,
+        статистика считается одним запросом GameRepository.get_head_to_head
+
+        Args:
+            team_short (str): 3 символа, uppercase. Короткое имя команды. Например: 'ATL'.
+            opponent_short (str): короткое имя соперника
+
+        Returns:
+            dict: {
+                "team": {"name": "Example Team", "short": "EXP"},
+                "opponent": {"name": "Other Team", "short": "OTH"},
+                "games": 5, "win": 3, "lost": 2,
+                "home": {"games": 3, "win": 2, "lost": 1},
+                "away": {"games": 2, "win": 1, "lost": 1},
+                "average_margin": 4.2
+            }
+            average_margin - средняя разница (очки команды - очки соперника), None, если встреч не было
+
+        Raises:
+            SameTeamError: team_short и opponent_short - одна и та же команда
+            TeamNotFoundError: команда или соперник не найдены по короткому имени
+
+        Note:
+            Для валидации team_short и opponent_short используй TeamService.validate_team_short
+        """
+        if team_short == opponent_short:
+            raise SameTeamError(f"Team {team_short} cannot be compared with itself")
+        team = self._get_team_or_raise(team_short)
+        opponent = self._get_team_or_raise(opponent_short)
+        row = self.game_repository.get_head_to_head(team.ID, opponent.ID)
+        games = row.HOME_GAMES + row.VISITING_GAMES
+        return {
+            "team": {"name": team.NAME, "short": team.SHORT},
+            "opponent": {"name": opponent.NAME, "short": opponent.SHORT},
+            "games": games,
+            "win": row.HOME_WIN + row.VISITING_WIN,
+            "lost": row.HOME_LOST + row.VISITING_LOST,
+            "home": {"games": row.HOME_GAMES, "win": row.HOME_WIN, "lost": row.HOME_LOST},
+            "away": {"games": row.VISITING_GAMES, "win": row.VISITING_WIN, "lost": row.VISITING_LOST},
+            "average_margin": round(row.MARGIN / games, 2) if games else None,
+        }
+
+    @staticmethod
+    def _team_result(score: int, opponent_score: int) -> tuple[int, int, int, int]:
+        """
+        Вклад одной игры в строку турнирной таблицы команды
+
+        Args:
+            score (int): очки команды
+            opponent_score (int): очки соперника
+
+        Returns:
+            tuple[int, int, int, int]: (победа, поражение, набранные очки, пропущенные очки). Ничья - ни то, ни другое
+        """
+        return int(score > opponent_score), int(score < opponent_score), score, opponent_score
+
+    def _update_standings(
+            self,
+            home_team_id: int,
+            visiting_team_id: int,
+            old_scores: tuple[int, int],
+            new_scores: tuple[int, int],
+            is_new_game: bool = False):
+        """
+        Переносит изменение счета игры в team_standings в текущей транзакции (без commit).
+        Применяется разница между вкладом игры до и после изменения, поэтому смена лидера
+        корректно снимает победу с одной команды и отдает другой
+
+        Args:
+            home_team_id (int): ID домашней команды
+            visiting_team_id (int): ID команды-гостя
+            old_scores (tuple[int, int]): счет (домашние, гости) до изменения
+            new_scores (tuple[int, int]): счет (домашние, гости) после изменения
+            is_new_game (bool): игра только добавлена - прежнего вклада в таблицу у нее нет
+
+        Returns:
+            None
+        """
+        deltas: dict[int, list[int]] = {}
+        self._add_score_change_deltas(deltas, home_team_id, visiting_team_id, old_scores, new_scores, is_new_game)
+        self._apply_standings_deltas(deltas)
+
+    @classmethod
+    def _add_score_change_deltas(
+            cls,
+            deltas: dict[int, list[int]],
+            home_team_id: int,
+            visiting_team_id: int,
+            old_scores: tuple[int, int],
+            new_scores: tuple[int, int],
+            is_new_game: bool = False):
+        """
+        Добавляет к накопленным изменениям турнирной таблицы вклад изменения счета одной игры
+
+        Args:
+            deltas (dict[int, list[int]]): накопленные изменения: team_id -> [победы, поражения, очки, пропущено]
+            home_team_id (int): ID домашней команды
+            visiting_team_id (int): ID команды-гостя
+            old_scores (tuple[int, int]): счет (домашние, гости) до изменения
+            new_scores (tuple[int, int]): счет (домашние, гости) после изменения
+            is_new_game (bool): игра только добавлена - прежнего вклада в таблицу у нее нет
+
+        Returns:
+            None
+        """
+        old_home, old_visiting = old_scores
+        new_home, new_visiting = new_scores
+        sides = [
+            (home_team_id, (new_home, new_visiting), (old_home, old_visiting)),
+            (visiting_team_id, (new_visiting, new_home), (old_visiting, old_home)),
+        ]
+        for team_id, new_result, old_result in sides:
+            new_values = cls._team_result(*new_result)
+            old_values = cls._team_result(*old_result) if not is_new_game else (0, 0, 0, 0)
+            cls._add_standings_delta(deltas, team_id, [new - old for new, old in zip(new_values, old_values)])
+
+    @staticmethod
+    def _add_standings_delta(deltas: dict[int, list[int]], team_id: int, delta: list[int]):
+        """
+        Суммирует изменение строки турнирной таблицы команды с уже накопленными
+
+        Args:
+            deltas (dict[int, list[int]]): накопленные изменения: team_id -> [победы, поражения, очки, пропущено]
+            team_id (int): ID команды
+            delta (list[int]): изменение [победы, поражения, очки, пропущено]
+
+        Returns:
+            None
+        """
+        accumulated = deltas.setdefault(team_id, [0, 0, 0, 0])
+        for index, value in enumerate(delta):
+            accumulated[index] += value
+
+    def _apply_standings_deltas(self, deltas: dict[int, list[int]]):
+        """
+        Применяет накопленные изменения к team_standings: один атомарный UPDATE на команду (без commit)
+
+        Args:
+            deltas (dict[int, list[int]]): team_id -> [победы, поражения, очки, пропущено]
+
+        Returns:
+            None
+        """
+        for team_id, delta in deltas.items():
+            if not self.team_standings_repository.add_to_team(team_id, *delta):
+                # Строки нет только у команд, добавленных до того, как TeamService.add_team_by_data стал
+                # создавать ее вместе с командой: считаем ее по games (с учетом текущих изменений). Если
+                # параллельная транзакция уже вставила строку, к ней прибавляются только изменения этой
+                self.db.flush()
+                for standings in self.game_repository.get_standings(team_ids=[team_id]):
+                    self.team_standings_repository.insert_or_add(standings, *delta)
+
+    def refresh_standings(self):
+        """
+        Пересчитывает team_standings целиком по таблице games в текущей транзакции (без commit)
+
+        Returns:
+            None
+        """
+        self.db.flush()
+        self.team_standings_repository.delete_all()
+        self.team_standings_repository.insert_rows(self.game_repository.get_standings())
+
+    def rebuild_standings(self) -> int:
+        """
+        Полная пересборка team_standings по таблице games (восстановление после ручных правок БД и т.п.)
+
+        Returns:
+            int: количество команд в пересобранной таблице
+        """
+        try:
+            self.refresh_standings()
+            self.data_version_repository.bump(STANDINGS_VERSION)
+            self.db.commit()
+        except:
+            self.db.rollback()
+            raise
+        return len(self.team_standings_repository.get_standings())
+
+    @staticmethod
+    def parse_quarter(quarter_data: str) -> tuple[int, int]:
+        """
+        Разбирает счет четверти
+
+        Args:
+            quarter_data (str): счет в формате "<home_score>:<visiting_score>". Например - "21:12"
+
+        Returns:
+            tuple[int, int]: (очки домашней команды, очки гостей)
+
+        Raises:
+            InvalidQuarterError: строка не в формате "<home_score>:<visiting_score>"
+        """
+        try:
+            home_score, visiting_score = [int(score) for score in str(quarter_data).split(":")]
+        except ValueError:
+            raise InvalidQuarterError(f"Invalid quarter score: {quarter_data}")
+        return home_score, visiting_score
+
+    def add_games_batch(self, games: list[dict]) -> list[Optional[int]]:
+        """
+        Добавляет пачку игр (с четвертями) в одной транзакции: команды всех игр ищутся одним запросом,
+        игры и четверти добавляются через executemany, турнирная таблица обновляется одним UPDATE на команду
+
+        Args:
+            games (list[dict]): игры в формате
+                {
+                    "home_short": "PRG", "visiting_short": "CHW",
+                    "home_score": 0, "visiting_score": 0,
+                    "quarters": ["12:20", "21:12"]
+                }
+                Итоговый счет игры - переданный счет плюс сумма четвертей
+
+        Returns:
+            list[Optional[int]]: ID добавленных игр в порядке games. None - команда игры не найдена, игра пропущена
+
+        Raises:
+            InvalidQuarterError: счет четверти не в формате "<home_score>:<visiting_score>"
+
+        Note:
+            Для валидации team_short используй TeamService.validate_team_short
+        """
+        shorts = {game["home_short"] for game in games} | {game["visiting_short"] for game in games}
+        team_ids = {team.SHORT: team.ID for team in self.team_repository.get_teams_by_shorts(shorts)}
+
+        results: list[Optional[int]] = [None] * len(games)
+        positions, game_rows, game_quarters = [], [], []
+        for position, game in enumerate(games):
+            home_team_id = team_ids.get(game["home_short"])
+            visiting_team_id = team_ids.get(game["visiting_short"])
+            if home_team_id is None or visiting_team_id is None:
+                continue
+
+            quarters = game.get("quarters", [])
+            quarter_scores = [self.parse_quarter(quarter) for quarter in quarters]
+            positions.append(position)
+            game_quarters.append(quarter_scores)
+            game_rows.append({
+                "HOME_TEAM_ID": home_team_id,
+                "VISITING_TEAM_ID": visiting_team_id,
+                "HOME_TEAM_SCORE": game.get("home_score", 0) + sum(home for home, _ in quarter_scores),
+                "VISITING_TEAM_SCORE": game.get("visiting_score", 0) + sum(visiting for _, visiting in quarter_scores),
+            })
+
+        if not game_rows:
+            return results
+
+        try:
+            game_ids = self.game_repository.add_games(game_rows)
+            self.quarters_repository.add_quarters([
+                {"GAME_ID": game_id, "NUMBER": number, "HOME_POINTS": home, "VISITING_POINTS": visiting}
+                for game_id, quarter_scores in zip(game_ids, game_quarters)
+                for number, (home, visiting) in enumerate(quarter_scores, start=1)
+            ])
+
+            deltas: dict[int, list[int]] = {}
+            for row in game_rows:
+                home, visiting = row["HOME_TEAM_SCORE"], row["VISITING_TEAM_SCORE"]
+                self._add_standings_delta(deltas, row["HOME_TEAM_ID"], list(self._team_result(home, visiting)))
+                self._add_standings_delta(deltas, row["VISITING_TEAM_ID"], list(self._team_result(visiting, home)))
+            self._apply_standings_deltas(deltas)
+
+            self.data_version_repository.bump(GAMES_VERSION)
+            self.data_version_repository.bump(QUARTERS_VERSION)
+            self.db.commit()
+        except:
+            self.db.rollback()
+            raise
+
+        for position, game_id in zip(positions, game_ids):
+            results[position] = game_id
+        return results
+
     def add_game_quarter(self, game_id: int, quarter_data: str):
         """
-        Добавляет запись Quarters и обновляет счет соответствующей Game
+        Добавляет запись Quarters и обновляет счет соответствующей Game и турнирную таблицу.
+        Четверть может поменять лидера матча, поэтому победа/поражение переносятся между командами.
+
+        Счет увеличивается атомарным UPDATE в той же транзакции, что и вставка четверти,
+        а изменение турнирной таблицы считается по счету, который вернул этот UPDATE,
+        поэтому параллельные четверти одной игры не теряются.
+        При optimistic_score_updates UPDATE выполняется только для прочитанной версии игры (Game.VERSION),
+        при конфликте транзакция откатывается и повторяется до score_update_retries раз
 
         Args:
             game_id (int): ID сущности Game
@@ -221,42 +638,249 @@ class GameService:
             
         Raises:
             GameNotFoundError: если Game не найдена по ID
+            InvalidQuarterError: quarter_data не в формате "<home_score>:<visiting_score>"
+            GameUpdateConflictError: при optimistic_score_updates версия игры менялась параллельно при всех попытках
         """
-        game = self.game_repository.get_game_by_id(game_id)
+        home_score, visiting_score = self.parse_quarter(quarter_data)
+        # Запись и чтение после нее - в основной БД, а не в реплике
+        use_primary(self.db)
+
+        attempts = self.score_update_retries + 1 if self.optimistic_score_updates else 1
+        for _ in range(attempts):
+            expected_version = None
+            if self.optimistic_score_updates:
+                game = self.game_repository.get_score_row(game_id)
+                if game is None:
+                    raise GameNotFoundError(f"Game with ID '{game_id}' not found")
+                expected_version = game.VERSION
+
+            try:
+                # UPDATE первым: он берет блокировку строки игры, и номер четверти ниже считается уже под ней
+                game = self.game_repository.increment_scores(game_id, home_score, visiting_score, expected_version)
+                if game is None:
+                    self.db.rollback()
+                    if expected_version is None:
+                        raise GameNotFoundError(f"Game with ID '{game_id}' not found")
+                    continue
+
+                self.quarters_repository.add_quarter(Quarters(
+                    GAME_ID=game_id,
+                    NUMBER=self.quarters_repository.get_next_number(game_id),
+                    HOME_POINTS=home_score,
+                    VISITING_POINTS=visiting_score
+                ))
+                self._update_standings(
+                    game.HOME_TEAM_ID, game.VISITING_TEAM_ID,
+                    old_scores=(game.HOME_TEAM_SCORE - home_score, game.VISITING_TEAM_SCORE - visiting_score),
+                    new_scores=(game.HOME_TEAM_SCORE, game.VISITING_TEAM_SCORE)
+                )
+                self.data_version_repository.bump(GAMES_VERSION)
+                self.data_version_repository.bump(QUARTERS_VERSION)
+                self.db.commit()
+                return
+            except:
+                self.db.rollback()
+                raise
+
+        raise GameUpdateConflictError(f"Game with ID '{game_id}' was updated concurrently, retries exhausted")
+
+    def validate_game_quarter(self, game_id: Union[int, str], quarter_data: str) -> tuple[int, int, int]:
+        """
+        Проверяет четверть до постановки в очередь записи (см. services.quarter_queue): формат счета и наличие игры
+
+        Args:
+            game_id (Union[int, str]): ID сущности Game, в том числе строкой из URL
+            quarter_data (str): счет четверти в формате "<home_score>:<visiting_score>"
 
-        if game is None:
+        Returns:
+            tuple[int, int, int]: (ID игры числом, очки домашней команды, очки гостей). Очередь группирует
+                четверти по ID игры, поэтому в нее передается только этот ID: "1" и "01" - одна игра
+
+        Raises:
+            GameNotFoundError: если Game не найдена по ID или ID не число
+            InvalidQuarterError: quarter_data не в формате "<home_score>:<visiting_score>"
+        """
+        home_points, visiting_points = self.parse_quarter(quarter_data)
+        try:
+            game_id = int(game_id)
+        except ValueError:
+            raise GameNotFoundError(f"Game with ID '{game_id}' not found")
+        # Игра могла быть только что создана - реплика может ее еще не видеть
+        use_primary(self.db)
+        if self.game_repository.get_score_row(game_id) is None:
             raise GameNotFoundError(f"Game with ID '{game_id}' not found")
+        return game_id, home_points, visiting_points
+
+    def add_game_quarters_batch(self, quarters: list[tuple[int, int, int]]) -> list[bool]:
+        """
+        Добавляет пачку четвертей (в том числе нескольких разных игр) в одной транзакции - group commit.
+        Счет каждой игры увеличивается одним атомарным UPDATE на сумму ее четвертей, четверти добавляются
+        через executemany с номерами по порядку в пачке, турнирная таблица - одним UPDATE на команду
+
+        Args:
+            quarters (list[tuple[int, int, int]]): четверти (game_id, очки домашней команды, очки гостей)
+                в порядке поступления
+
+        Returns:
+            list[bool]: для каждой четверти - записана ли она. False - игра не найдена (например, удалена)
+
+        Note:
+            Оптимистичная блокировка (optimistic_score_updates) здесь не нужна: счет меняется только атомарным UPDATE
+        """
+        points_by_game: dict[int, list[int]] = {}
+        for game_id, home_points, visiting_points in quarters:
+            points = points_by_game.setdefault(game_id, [0, 0])
+            points[0] += home_points
+            points[1] += visiting_points
 
-        home_score, visiting_score = [int(score) for score in quarter_data.split(":")]
+        use_primary(self.db)
         try:
-            self.quarters_repository.add_quarter(Quarters(GAME_ID=game_id, QUARTERS=quarter_data))
-            game.HOME_TEAM_SCORE += home_score
-            game.VISITING_TEAM_SCORE += visiting_score
+            # game_id -> номер следующей четверти игры
+            games: dict[int, int] = {}
+            deltas: dict[int, list[int]] = {}
+            for game_id, (home_points, visiting_points) in points_by_game.items():
+                game = self.game_repository.increment_scores(game_id, home_points, visiting_points)
+                if game is None:
+                    continue
+                # Номер первой четверти игры в пачке - уже под блокировкой строки игры, взятой UPDATE
+                games[game_id] = self.quarters_repository.get_next_number(game_id)
+                self._add_score_change_deltas(
+                    deltas, game.HOME_TEAM_ID, game.VISITING_TEAM_ID,
+                    old_scores=(game.HOME_TEAM_SCORE - home_points, game.VISITING_TEAM_SCORE - visiting_points),
+                    new_scores=(game.HOME_TEAM_SCORE, game.VISITING_TEAM_SCORE)
+                )
+
+            quarter_rows = []
+            for game_id, home_points, visiting_points in quarters:
+                if game_id not in games:
+                    continue
+                quarter_rows.append({
+                    "GAME_ID": game_id, "NUMBER": games[game_id],
+                    "HOME_POINTS": home_points, "VISITING_POINTS": visiting_points
+                })
+                games[game_id] += 1
+            self.quarters_repository.add_quarters(quarter_rows)
+            self._apply_standings_deltas(deltas)
+
+            if quarter_rows:
+                self.data_version_repository.bump(GAMES_VERSION)
+                self.data_version_repository.bump(QUARTERS_VERSION)
             self.db.commit()
         except:
             self.db.rollback()
             raise
+        return [game_id in games for game_id, _, _ in quarters]
 
     def get_all_games_with_quarters(self) -> list[dict[str, object]]:
         """
-        Возвращает список всех Games, с дополнительной информацией о Quarters
+        Возвращает список всех Games, с дополнительной информацией о Quarters.
+        Выполняет постоянное количество запросов (игры + все четверти), независимо от количества игр
 
         Returns:
             list[dict[str, object]]: кастомная структура сырых данных для использования в контроллере. Пример:
                 [
                     {
-                        "game": <Game object>,
-                        "quarters": [<Quarters objects list>]
+                        "game": <Row (ID, HOME_TEAM_NAME, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VISITING_TEAM_NAME)>,
+                        "quarters": [<Row (ID, GAME_ID, NUMBER, HOME_POINTS, VISITING_POINTS, QUARTERS)>]
                     }
                 ]
         """
-        games = self.game_repository.get_all_games()
-        games_with_quarters = []
-        for game in games:
-            quarters = self.quarters_repository.get_quarters_by_game_id(game.ID)
-            games_with_quarters.append({
-                "game": game,
-                "quarters": quarters
-            })
+        games = self.game_repository.get_all_game_rows()
+        quarters = self.quarters_repository.get_all_quarter_rows()
+        return self._attach_quarters(games, quarters)
+
+    def get_games_with_quarters_by_rows(self, games: list[Row]) -> list[dict[str, object]]:
+        """
+        Догружает Quarters для уже полученного набора игр одним пакетным запросом
+
+        Args:
+            games (list[Row]): строки игр из GameRepository (должны содержать ID)
+
+        Returns:
+            list[dict[str, object]]: структура как у GameService.get_all_games_with_quarters
+        """
+        quarters = self.quarters_repository.get_quarter_rows_by_game_ids(game.ID for game in games)
+        return self._attach_quarters(games, quarters)
+
+    def get_games_with_quarters_page(
+            self,
+            limit: int,
+            after_id: Optional[int] = None) -> tuple[list[dict[str, object]], Optional[int]]:
+        """
+        Возвращает страницу Games с Quarters (keyset pagination по Game.ID) и курсор следующей страницы
+
+        Args:
+            limit (int): максимальное количество игр на странице
+            after_id (Optional[int]): курсор - ID последней игры предыдущей страницы. None - первая страница
+
+        Returns:
+            tuple[list[dict[str, object]], Optional[int]]: структура как у GameService.get_all_games_with_quarters
+                и next_cursor (см. GameService.get_game_rows_page)
+        """
+        games, next_cursor = self.get_game_rows_page(limit, after_id)
+        return self.get_games_with_quarters_by_rows(games), next_cursor
+
+    def get_games_with_quarters_by_page_params(
+            self,
+            page_params: Optional[tuple[int, Optional[int]]]) -> tuple[list[dict[str, object]], Optional[int]]:
+        """
+        Возвращает все Games с Quarters или их страницу - по параметрам пагинации запроса (utils.get_page_params)
+
+        Args:
+            page_params (Optional[tuple[int, Optional[int]]]): (limit, after_id), None - все игры
+
+        Returns:
+            tuple[list[dict[str, object]], Optional[int]]: структура как у GameService.get_all_games_with_quarters
+                и next_cursor (для всех игр - None)
+        """
+        if page_params is None:
+            return self.get_all_games_with_quarters(), None
+        return self.get_games_with_quarters_page(*page_params)
 
-        return games_with_quarters
\ No newline at end of file
+    def iter_games_with_quarters(self, batch_size: int = 1000) -> Iterator[dict[str, object]]:
+        """
+        Потоково отдает все Games с Quarters по одной игре, не загружая всю таблицу в память
+
+        Args:
+            batch_size (int): размер пачки строк, читаемых из БД за раз
+
+        Returns:
+            Iterator[dict[str, object]]: элементы вида
+                {
+                    "game": <Row (ID, HOME_TEAM_NAME, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VISITING_TEAM_NAME, ...)>,
+                    "quarters": ["12:20", "21:12"]
+                }
+        """
+        current_game = None
+        quarters: list[str] = []
+        for row in self.game_repository.iter_game_rows_with_quarters(batch_size):
+            if current_game is None or current_game.ID != row.ID:
+                if current_game is not None:
+                    yield {"game": current_game, "quarters": quarters}
+                current_game, quarters = row, []
+            if row.QUARTERS is not None:
+                quarters.append(row.QUARTERS)
+
+        if current_game is not None:
+            yield {"game": current_game, "quarters": quarters}
+
+    @staticmethod
+    def _attach_quarters(games: list, quarters: list) -> list[dict[str, object]]:
+        """
+        Группирует четверти по GAME_ID в памяти и сопоставляет их играм
+
+        Args:
+            games (list): игры (объекты с атрибутом ID)
+            quarters (list): четверти (объекты с атрибутом GAME_ID), в порядке добавления
+
+        Returns:
+            list[dict[str, object]]: [{"game": <game>, "quarters": [<quarters>]}], в порядке games
+        """
+        quarters_by_game_id: dict[int, list] = {}
+        for quarter in quarters:
+            quarters_by_game_id.setdefault(quarter.GAME_ID, []).append(quarter)
+
+        return [
+            {"game": game, "quarters": quarters_by_game_id.get(game.ID, [])}
+            for game in games
+        ]
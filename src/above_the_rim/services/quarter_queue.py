@@ -0,0 +1,214 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+from sqlalchemy.orm import scoped_session
+
+from above_the_rim.errors.game_errors import QuarterQueueFullError, QuarterQueueClosedError
+from above_the_rim.services.game_service import GameService
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedQuarter(NamedTuple):
+    """
+    Проверенная четверть, ожидающая записи в БД
+    """
+    game_id: int
+    home_points: int
+    visiting_points: int
+
+
+class QuarterQueue:
+    """
+    Очередь отложенной записи четвертей (write-behind) с group commit.
+
+    Запрос только проверяет четверть и кладет ее в ограниченную очередь процесса, а фоновый поток-писатель
+    забирает четверти пачками (до batch_size штук или пока не пройдет flush_interval секунд с первой
+    четверти пачки) и записывает каждую пачку одной транзакцией (GameService.add_game_quarters_batch).
+    Количество commit (и fsync) определяется количеством пачек, а не запросов.
+
+    Если очередь заполнена, put ждет до put_timeout секунд и выбрасывает QuarterQueueFullError (backpressure).
+    Очередь принимает четверти только между start и stop и только пока жив поток-писатель, иначе put
+    выбрасывает QuarterQueueClosedError - четверть, которую некому записать, не должна получать 202.
+    stop закрывает очередь и дописывает все принятые четверти перед остановкой писателя.
+
+    Принятая четверть видна в чтениях только после записи ее пачки, а четверти, не дописанные
+    из-за аварийного завершения процесса, теряются - режим включается явно (QUARTER_QUEUE_ENABLED)
+    """
+
+    def __init__(
+            self,
+            game_service_factory: Callable[[], GameService],
+            db: scoped_session,
+            max_size: int = 10_000,
+            batch_size: int = 500,
+            flush_interval: float = 0.05,
+            put_timeout: float = 1.0):
+        self.game_service_factory = game_service_factory
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.accepted = 0
+        self.rejected = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self._queue: queue.Queue[Optional[QueuedQuarter]] = queue.Queue(maxsize=max_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # stop ждет завершения начатых put, чтобы ни одна принятая четверть не встала за маркером остановки
+        self._puts_done = threading.Condition(self._lock)
+        self._pending_puts = 0
+        self._closed = True
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        """
+        Запущен ли поток-писатель
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Запускает поток-писатель и открывает очередь для put (повторный вызов ничего не делает)
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(target=self._run, name="quarter-queue-writer", daemon=True)
+            self._thread.start()
+            self._closed = False
+
+    def put(self, game_id: int, home_points: int, visiting_points: int):
+        """
+        Ставит проверенную четверть в очередь записи
+
+        Args:
+            game_id (int): ID сущности Game
+            home_points (int): очки домашней команды
+            visiting_points (int): очки гостей
+
+        Returns:
+            None
+
+        Raises:
+            QuarterQueueFullError: очередь заполнена и место не освободилось за put_timeout секунд
+            QuarterQueueClosedError: очередь остановлена (stop) или поток-писатель не работает
+        """
+        with self._lock:
+            if self._closed or not self.running:
+                self.rejected += 1
+                raise QuarterQueueClosedError("Quarter queue writer is not running")
+            self._pending_puts += 1
+        try:
+            self._queue.put(QueuedQuarter(game_id, home_points, visiting_points), timeout=self.put_timeout)
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            raise QuarterQueueFullError("Quarter queue is full")
+        else:
+            with self._lock:
+                self.accepted += 1
+        finally:
+            with self._lock:
+                self._pending_puts -= 1
+                self._puts_done.notify_all()
+
+    def join(self):
+        """
+        Ждет, пока все принятые к этому моменту четверти будут записаны (или не смогут быть записаны)
+
+        Returns:
+            None
+        """
+        self._queue.join()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Дописывает все принятые четверти и останавливает поток-писатель. Вызывается при завершении процесса
+
+        Args:
+            timeout (Optional[float]): сколько секунд ждать писателя. None - без ограничения
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._closed = True
+            # Начатые put дождутся места в очереди (писатель еще работает) или отвалятся по put_timeout
+            self._puts_done.wait_for(lambda: self._pending_puts == 0)
+            thread = self._thread
+            self._thread = None
+        if thread is None or not thread.is_alive():
+            return
+        # Маркер остановки встает в конец очереди - писатель дойдет до него, записав все, что было до него
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: list[QueuedQuarter]):
+        """
+        Записывает пачку одной транзакцией. Если пачка не записалась, четверти пишутся по одной,
+        чтобы одна проблемная четверть не потеряла остальные
+
+        Args:
+            batch (list[QueuedQuarter]): четверти пачки в порядке поступления
+
+        Returns:
+            None
+        """
+        try:
+            game_service = self.game_service_factory()
+            try:
+                written = game_service.add_game_quarters_batch(list(batch))
+            except Exception:
+                logger.exception("Quarter batch of %d failed, writing quarters one by one", len(batch))
+                written = []
+                for quarter in batch:
+                    try:
+                        written.extend(game_service.add_game_quarters_batch([quarter]))
+                    except Exception:
+                        logger.exception("Quarter for game %s was not written", quarter.game_id)
+                        written.append(False)
+            with self._lock:
+                self.batches += 1
+                self.written += sum(written)
+                self.failed += len(written) - sum(written)
+        finally:
+            # Сессия потока-писателя не должна держать соединение и identity map между пачками
+            self.db.remove()
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 
+from above_the_rim.database.repositories.data_version import DataVersionRepository
 from above_the_rim.database.repositories.game import GameRepository
 from above_the_rim.database.repositories.quarters import QuartersRepository
 from above_the_rim.database.repositories.team import TeamRepository
+from above_the_rim.database.repositories.team_standings import TeamStandingsRepository
 
 
 class RepositoryFactory:
@@ -37,4 +39,22 @@ class RepositoryFactory:
         Returns:
             QuartersRepository: репозиторий, через который идет взаимодействие с БД по сущности Quarters
         """
-        return QuartersRepository(self.db)
\ No newline at end of file
+        return QuartersRepository(self.db)
+
+    def get_team_standings_repository(self) -> TeamStandingsRepository:
+        """
+        Инициализирует и возвращает TeamStandingsRepository
+
+        Returns:
+            TeamStandingsRepository: репозиторий, через который идет взаимодействие с БД по турнирной таблице
+        """
+        return TeamStandingsRepository(self.db)
+
+    def get_data_version_repository(self) -> DataVersionRepository:
+        """
+        Инициализирует и возвращает DataVersionRepository
+
+        Returns:
+            DataVersionRepository: репозиторий, через который идет взаимодействие с БД по счетчикам версий данных
+        """
+        return DataVersionRepository(self.db)
@@ -0,0 +1,89 @@
+"""
+Тела JSON-ответов списков команд и игр. Общие для Flask-роутов (api/v1, api/v2) и асинхронных роутов
+ASGI-режима (above_the_rim.asgi), поэтому оба стека отдают одинаковые ответы
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import Row
+
+# (limit, after_id) из utils.get_page_params, None - пагинация не запрошена
+PageParams = Optional[tuple[int, Optional[int]]]
+
+WRONG_PAGINATION_RESPONSE = {"success": False, "data": "Wrong pagination parameters"}
+
+
+def format_game_summary(game: Row, quarters: Iterable[Row] = ()) -> str:
+    """
+    Строка игры для списков игр
+
+    Args:
+        game (Row): строка (ID, HOME_TEAM_NAME, HOME_TEAM_SCORE, VISITING_TEAM_SCORE, VISITING_TEAM_NAME)
+        quarters (Iterable[Row]): четверти игры в порядке Quarters.NUMBER. Пусто - без скобок
+
+    Returns:
+        str: например 'Prague Gulls 33:32 Chicago Wizards (12:20,21:12)'
+    """
+    summary = f"{game.HOME_TEAM_NAME} {game.HOME_TEAM_SCORE}:{game.VISITING_TEAM_SCORE} {game.VISITING_TEAM_NAME}"
+    quarters = [quarter.QUARTERS for quarter in quarters]
+    return f"{summary} ({','.join(quarters)})" if quarters else summary
+
+
+def _with_cursor(response: dict, page_params: PageParams, next_cursor: Optional[int]) -> dict:
+    if page_params is not None:
+        response["next_cursor"] = next_cursor
+    return response
+
+
+def build_teams_response(teams: Iterable[Row]) -> dict:
+    """
+    Тело ответа GET /api/v1/teams
+
+    Args:
+        teams (Iterable[Row]): команды (SHORT, NAME)
+
+    Returns:
+        dict: {"data": {"EXP": "Example Team"}, "success": True}
+    """
+    return {"data": {team.SHORT: team.NAME for team in teams}, "success": True}
+
+
+def build_games_response(games: Iterable[Row], page_params: PageParams, next_cursor: Optional[int]) -> dict:
+    """
+    Тело ответа GET /api/v1/games
+
+    Args:
+        games (Iterable[Row]): строки игр (GameService.get_game_rows_by_page_params)
+        page_params (PageParams): параметры пагинации запроса
+        next_cursor (Optional[int]): курсор следующей страницы
+
+    Returns:
+        dict: {"data": {1: "Chicago Wizards 123:89 Prague Gulls"}, "success": True}
+            и "next_cursor", если запрошена пагинация
+    """
+    response = {"data": {game.ID: format_game_summary(game) for game in games}, "success": True}
+    return _with_cursor(response, page_params, next_cursor)
+
+
+def build_games_with_quarters_response(
+        games_with_quarters: Iterable[dict[str, object]],
+        page_params: PageParams,
+        next_cursor: Optional[int]) -> dict:
+    """
+    Тело ответа GET /api/v2/games
+
+    Args:
+        games_with_quarters (Iterable[dict[str, object]]): [{"game": <Row>, "quarters": [<Row>]}]
+            (GameService.get_games_with_quarters_by_page_params)
+        page_params (PageParams): параметры пагинации запроса
+        next_cursor (Optional[int]): курсор следующей страницы
+
+    Returns:
+        dict: {"data": {3: "Prague Wizards 33:32 Chicago Gulls (12:20,21:12)"}, "success": True}
+            и "next_cursor", если запрошена пагинация
+    """
+    response = {
+        "data": {item["game"].ID: format_game_summary(item["game"], item["quarters"]) for item in games_with_quarters},
+        "success": True,
+    }
+    return _with_cursor(response, page_params, next_cursor)
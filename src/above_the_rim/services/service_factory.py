@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 
+from above_the_rim.services.data_version_service import DataVersionService
 from above_the_rim.services.game_service import GameService
 from above_the_rim.services.repository_factory import RepositoryFactory
+from above_the_rim.services.team_registry import TeamRegistry
 from above_the_rim.services.team_service import TeamService
 
 
@@ -10,9 +12,21 @@ class ServiceFactory:
     Фабрика сервисов. Централизированно и правильно создает сервисы
     """
 
-    def __init__(self, db: Session, repo_factory: RepositoryFactory):
+    def __init__(
+            self,
+            db: Session,
+            repo_factory: RepositoryFactory,
+            team_registry: TeamRegistry = None,
+            optimistic_score_updates: bool = False,
+            score_update_retries: int = 3):
         self.db = db
         self.repo_factory = repo_factory
+        self.optimistic_score_updates = optimistic_score_updates
+        self.score_update_retries = score_update_retries
+        self.team_registry = team_registry or TeamRegistry(
+            repo_factory.get_team_repository(),
+            repo_factory.get_data_version_repository()
+        )
 
     def get_game_service(self) -> GameService:
         """
@@ -26,7 +40,12 @@ class ServiceFactory:
             self.db,
             self.repo_factory.get_game_repository(),
             self.repo_factory.get_team_repository(),
-            self.repo_factory.get_quarters_repository()
+            self.repo_factory.get_quarters_repository(),
+            self.repo_factory.get_team_standings_repository(),
+            self.team_registry,
+            self.repo_factory.get_data_version_repository(),
+            optimistic_score_updates=self.optimistic_score_updates,
+            score_update_retries=self.score_update_retries
         )
 
     def get_team_service(self) -> TeamService:
@@ -40,5 +59,21 @@ class ServiceFactory:
         return TeamService(
             self.db,
             self.repo_factory.get_team_repository(),
-            self.get_game_service()
-        )
\ No newline at end of file
+            self.repo_factory.get_team_standings_repository(),
+            self.get_game_service(),
+            self.repo_factory.get_data_version_repository(),
+            self.team_registry
+        )
+
+    def get_data_version_service(self) -> DataVersionService:
+        """
+        Инициализирует и возвращает DataVersionService
+
+        Returns:
+            DataVersionService: сервис версий данных (ETag для условных GET-запросов)
+
+        """
+        return DataVersionService(
+            self.db,
+            self.repo_factory.get_data_version_repository()
+        )
@@ -0,0 +1,119 @@
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from above_the_rim.database.repositories.data_version import DataVersionRepository, TEAMS_VERSION
+from above_the_rim.database.repositories.team import TeamRepository
+
+
+class TeamEntry(NamedTuple):
+    """
+    Запись справочника команд. Повторяет поля модели Team, поэтому может использоваться вместо нее
+    """
+    ID: int
+    SHORT: str
+    NAME: str
+
+
+class TeamRegistry:
+    """
+    Кэш справочника команд в памяти процесса: short -> TeamEntry(ID, SHORT, NAME).
+    Команды меняются редко, поэтому поиск по short не требует обращения к БД.
+
+    Актуальность между процессами отслеживается по счетчику DataVersion 'teams' (generation):
+    не чаще раза в check_interval секунд читается одна строка по первичному ключу,
+    и справочник перезагружается, только если счетчик изменился.
+    Записи в текущем процессе сбрасывают кэш сразу (TeamRegistry.invalidate)
+    """
+    DATA_VERSION_NAME = TEAMS_VERSION
+
+    def __init__(
+            self,
+            team_repository: TeamRepository,
+            data_version_repository: DataVersionRepository,
+            check_interval: float = 1.0):
+        self.team_repository = team_repository
+        self.data_version_repository = data_version_repository
+        self.check_interval = check_interval
+        self._teams: Optional[dict[str, TeamEntry]] = None
+        self._generation: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        # Сколько раз справочник сверял версию с БД и сколько из них перезагружал команды (для метрик)
+        self.checks = 0
+        self.reloads = 0
+
+    @property
+    def generation(self) -> Optional[int]:
+        """
+        Версия данных 'teams', с которой загружен справочник. None - справочник не загружен
+        """
+        return self._generation
+
+    def warm(self):
+        """
+        Загружает справочник заранее (при старте приложения), чтобы первый запрос не платил за загрузку
+
+        Returns:
+            None
+        """
+        self.invalidate()
+        self._get_teams()
+
+    def invalidate(self):
+        """
+        Сбрасывает справочник. Следующее обращение перезагрузит его из БД
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._teams = None
+            self._generation = None
+
+    def get_team(self, short: str) -> Optional[TeamEntry]:
+        """
+        Возвращает команду по сокращенному имени
+
+        Args:
+            short (str): сокращенное имя команды
+
+        Returns:
+            TeamEntry: команда найдена
+            None: команды с таким short нет
+        """
+        return self._get_teams().get(short)
+
+    def get_all_teams(self) -> list[TeamEntry]:
+        """
+        Возвращает все команды справочника
+
+        Returns:
+            list[TeamEntry]: команды в порядке Team.ID
+        """
+        return list(self._get_teams().values())
+
+    def _get_teams(self) -> dict[str, TeamEntry]:
+        """
+        Возвращает справочник, при необходимости проверяя generation и перезагружая его
+
+        Returns:
+            dict[str, TeamEntry]: short -> TeamEntry
+        """
+        teams = self._teams
+        if teams is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return teams
+
+        with self._lock:
+            if self._teams is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return self._teams
+
+            generation = self.data_version_repository.get_version(self.DATA_VERSION_NAME)
+            self.checks += 1
+            if self._teams is None or generation != self._generation:
+                self.reloads += 1
+                loaded_teams = sorted(self.team_repository.get_all_teams(), key=lambda team: team.ID)
+                self._teams = {team.SHORT: TeamEntry(team.ID, team.SHORT, team.NAME) for team in loaded_teams}
+                self._generation = generation
+            self._checked_at = time.monotonic()
+            return self._teams
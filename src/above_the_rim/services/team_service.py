@@ -3,9 +3,14 @@ from typing import List, Type
 from sqlalchemy.orm import Session
 
 from above_the_rim.database.models import Team
+from above_the_rim.database.repositories.data_version import (
+    DataVersionRepository, TEAMS_VERSION, GAMES_VERSION, QUARTERS_VERSION
+)
 from above_the_rim.database.repositories.team import TeamRepository
+from above_the_rim.database.repositories.team_standings import TeamStandingsRepository
 from above_the_rim.errors.team_errors import InvalidTeamShortError, TeamNotFoundError, TeamAlreadyExistsError
 from above_the_rim.services.game_service import GameService
+from above_the_rim.services.team_registry import TeamRegistry
 
 
 class TeamService:
@@ -17,10 +22,16 @@ class TeamService:
             self,
             db: Session,
             team_repo: TeamRepository,
-            game_service: GameService):
+            team_standings_repository: TeamStandingsRepository,
+            game_service: GameService,
+            data_version_repository: DataVersionRepository,
+            team_registry: TeamRegistry):
         self.db = db
         self.team_repo = team_repo
+        self.team_standings_repository = team_standings_repository
         self.game_service = game_service
+        self.data_version_repository = data_version_repository
+        self.team_registry = team_registry
 
     def get_all_teams(self) -> List[Type[Team]]:
         """
@@ -28,6 +39,10 @@ class TeamService:
 
         Returns:
             List[Type[Team]]: список команд
+
+        Note:
+            Читается из БД, а не из TeamRegistry: ответ помечается ETag по версии 'teams',
+            а справочник другого процесса может отставать от нее на TEAM_REGISTRY_CHECK_INTERVAL
         """
         return self.team_repo.get_all_teams()
 
@@ -62,7 +77,8 @@ class TeamService:
 
     def add_team_by_data(self, short: str, name: str):
         """
-        Добавляет Team в БД
+        Добавляет Team в БД вместе с ее нулевой строкой турнирной таблицы (в одной транзакции), поэтому
+        первые игры команды только обновляют существующую строку
 
         Args:
             short (str): Сокращенное имя команды (3 латинские буквы в верхнем регистре)
@@ -80,7 +96,11 @@ class TeamService:
         new_team = Team(SHORT=short, NAME=name)
         try:
             self.team_repo.add_team(new_team)
+            self.db.flush()
+            self.team_standings_repository.add_empty_row(new_team.ID)
+            self.data_version_repository.bump(TEAMS_VERSION)
             self.db.commit()
+            self.team_registry.invalidate()
         except IntegrityError:
             raise TeamAlreadyExistsError(f"Team '{name}' already exists")
         except:
@@ -102,7 +122,12 @@ class TeamService:
         """
         try:
             self.team_repo.delete_team(short)
+            # Вместе с командой удаляются ее игры, что меняет статистику соперников
+            self.game_service.refresh_standings()
+            for version_name in (TEAMS_VERSION, GAMES_VERSION, QUARTERS_VERSION):
+                self.data_version_repository.bump(version_name)
             self.db.commit()
+            self.team_registry.invalidate()
         except:
             self.db.rollback()
             raise
@@ -128,16 +153,33 @@ class TeamService:
         Note:
             Перед вызовом проверить валидность short с помощью TeamService.validate_team_short
         """
-        team = self.team_repo.get_team_by_short(team_short)
-        if team is None:
-            raise TeamNotFoundError(f"Team {team_short} not found")
+        return self.game_service.get_team_standing(team_short)
+
+    def get_head_to_head(self, team_short: str, opponent_short: str) -> dict:
+        """
+        Возвращает очные встречи команды с соперником
+
+        Args:
+            team_short (str): Сокращенное имя команды
+            opponent_short (str): Сокращенное имя соперника
+
+        Returns:
+            dict: статистика встреч, см. GameService.get_head_to_head
 
-        return {
-            "name": team.NAME,
-            "short": team.SHORT,
-            "win": self.game_service.get_total_wins(team_short),
-            "lost": self.game_service.get_total_losses(team_short),
-        }
+        Raises:
+            SameTeamError: команда и соперник совпадают
+            TeamNotFoundError: команда или соперник не найдены по short
 
+        Note:
+            Перед вызовом проверить валидность short с помощью TeamService.validate_team_short
+        """
+        return self.game_service.get_head_to_head(team_short, opponent_short)
 
+    def get_standings(self) -> List[dict]:
+        """
+        Возвращает турнирную таблицу всех команд
 
+        Returns:
+            List[dict]: [{"name": "Example Team", "short": "EXP", "win": 10, "lost": 3}, ...]
+        """
+        return self.game_service.get_standings()
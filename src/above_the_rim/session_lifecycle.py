@@ -0,0 +1,32 @@
+from flask import Flask, request
+from sqlalchemy.orm import scoped_session
+
+from above_the_rim.database.db import set_read_only
+
+READ_ONLY_METHODS = ("GET", "HEAD")
+
+def register_session_lifecycle(app: Flask, db: scoped_session, read_only_get: bool = True):
+    """
+    Привязывает сессию БД к запросу: каждый запрос работает в своей сессии, которая закрывается
+    (с откатом незавершенной транзакции при ошибке) по окончании запроса. Identity map не копится
+    между запросами, и следующий запрос читает актуальные строки
+
+    Args:
+        app (Flask): приложение
+        db (scoped_session): сессия из init_db, которую используют репозитории
+        read_only_get (bool): открывать сессии GET/HEAD-запросов только для чтения (см. database.db.set_read_only)
+
+    Returns:
+        None
+    """
+    if read_only_get:
+        @app.before_request
+        def open_read_only_session():
+            if request.method in READ_ONLY_METHODS:
+                set_read_only(db())
+
+    @app.teardown_appcontext
+    def remove_session(exception=None):
+        if exception is not None:
+            db.rollback()
+        db.remove()
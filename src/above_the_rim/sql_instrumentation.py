@@ -0,0 +1,154 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator
+
+from flask import Flask, g, Response
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import scoped_session
+
+from above_the_rim.database.db import get_engines
+
+
+class QueryStats:
+    """
+    Статистика SQL-запросов за период наблюдения (обычно - один HTTP-запрос): количество и суммарное время в БД
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: list[str] = []
+
+    def add(self, statement: str, duration: float):
+        """
+        Учитывает выполненный запрос
+
+        Args:
+            statement (str): текст SQL
+            duration (float): время выполнения, секунд
+
+        Returns:
+            None
+        """
+        self.count += 1
+        self.duration += duration
+        self.statements.append(statement)
+
+
+# Активные периоды наблюдения текущего потока/контекста. Вложенные (например, проверка в тесте вокруг
+# HTTP-запроса) учитывают один и тот же запрос каждый
+_active_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar("active_query_stats", default=())
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    duration = time.perf_counter() - started_at
+    for stats in _active_stats.get():
+        stats.add(statement, duration)
+
+
+def _handle_error(exception_context):
+    # Для упавшего запроса after_cursor_execute не вызывается - убираем его время начала
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine):
+    """
+    Подписывает engine на учет запросов в текущей QueryStats (см. record_queries). Повторный вызов ничего не делает
+
+    Args:
+        engine (Engine): engine SQLAlchemy
+
+    Returns:
+        None
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+def _start_recording(stats: QueryStats) -> Token:
+    return _active_stats.set(_active_stats.get() + (stats,))
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryStats]:
+    """
+    Считает запросы инструментированных engine (instrument_engine), выполненные внутри блока в текущем потоке
+
+    Returns:
+        Iterator[QueryStats]: статистика, заполняемая по ходу выполнения блока
+    """
+    stats = QueryStats()
+    token = _start_recording(stats)
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def query_stats_headers(stats: QueryStats) -> list[tuple[str, str]]:
+    """
+    Заголовки ответа со статистикой SQL-запросов - общие для Flask (register_sql_instrumentation) и ASGI-режима
+
+    Args:
+        stats (QueryStats): статистика запроса
+
+    Returns:
+        list[tuple[str, str]]: [("X-DB-Queries", "3"), ("Server-Timing", 'db;dur=1.52;desc="3 queries"')]
+    """
+    return [
+        ("X-DB-Queries", str(stats.count)),
+        ("Server-Timing", f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'),
+    ]
+
+
+def register_sql_instrumentation(app: Flask, db: scoped_session, expose_headers: bool = True):
+    """
+    Считает SQL-запросы и время в БД каждого HTTP-запроса. Статистика текущего запроса - g.query_stats,
+    при expose_headers она отдается в заголовках ответа:
+        X-DB-Queries: 3
+        Server-Timing: db;dur=1.52;desc="3 queries"
+
+    Args:
+        app (Flask): приложение
+        db (scoped_session): сессия из init_db - учитываются запросы к основной БД и к реплике
+        expose_headers (bool): добавлять ли заголовки X-DB-Queries и Server-Timing
+
+    Returns:
+        None
+
+    Note:
+        Учитываются запросы до формирования ответа. Запросы потоковых ответов (stream_with_context)
+        выполняются после него и в заголовки не попадают
+    """
+    for engine in get_engines(db):
+        instrument_engine(engine)
+
+    @app.before_request
+    def start_recording_queries():
+        g.query_stats = QueryStats()
+        g.query_stats_token = _start_recording(g.query_stats)
+
+    if expose_headers:
+        @app.after_request
+        def add_query_stats_headers(response: Response) -> Response:
+            stats = g.get("query_stats")
+            if stats is not None:
+                for name, value in query_stats_headers(stats):
+                    response.headers.add(name, value)
+            return response
+
+    @app.teardown_request
+    def stop_recording_queries(exception=None):
+        token = g.pop("query_stats_token", None)
+        if token is not None:
+            _active_stats.reset(token)
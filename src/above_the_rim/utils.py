@@ -1,14 +1,141 @@
-from flask import Blueprint
+from typing import Optional, Mapping, Callable
+from functools import wraps
+from flask import Blueprint, current_app, request
 import importlib
 import pkgutil
 import inspect
 
+from above_the_rim.conditional_response import PreparedResponse, find_prepared_response, store_response
+from above_the_rim.errors.pagination_errors import InvalidPaginationError
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+# Явный список блюпринтов пакетов: пакет -> ((модуль, имя Blueprint), ...) в порядке регистрации.
+# Позволяет не сканировать пакеты при старте (register_blueprints(..., use_manifest=True)).
+# Новый блюпринт нужно добавить и сюда - tests/test_startup.py сверяет список со сканированием пакетов
+BLUEPRINT_MANIFEST: dict[str, tuple[tuple[str, str], ...]] = {
+    "above_the_rim.api.v1": (("game", "game_route"), ("standings", "standings_route"), ("team", "team_route")),
+    "above_the_rim.api.v2": (("game", "game_route_v2"),),
+    "above_the_rim.pages": (("home", "home_route"),),
+    "above_the_rim.monitoring": (("metrics", "metrics_route"),),
+}
+
+
+def register_blueprints(app, package_name, package_path, use_manifest=False):
+    """
+    Автоматическая регистрация всех Blueprint-ов в указанном пакете.
+    При use_manifest модули пакета не сканируются - импортируются только блюпринты из BLUEPRINT_MANIFEST
+    """
+    if use_manifest and package_name in BLUEPRINT_MANIFEST:
+        for module_name, blueprint_name in BLUEPRINT_MANIFEST[package_name]:
+            module = importlib.import_module(f"{package_name}.{module_name}")
+            app.register_blueprint(getattr(module, blueprint_name))
+        return
 
-def register_blueprints(app, package_name, package_path):
-    """Автоматическая регистрация всех Blueprint-ов в указанном пакете."""
     for _, name, _ in pkgutil.iter_modules([package_path]):
         module = importlib.import_module(f"{package_name}.{name}")
 
         for obj_name, obj in inspect.getmembers(module):
             if isinstance(obj, Blueprint):
                 app.register_blueprint(obj)
+
+
+def get_page_params(args: Mapping[str, str]) -> Optional[tuple[int, Optional[int]]]:
+    """
+    Разбирает параметры keyset-пагинации из query string: ?limit=<int>&after_id=<int>
+
+    Args:
+        args (Mapping[str, str]): параметры запроса, например flask.request.args
+
+    Returns:
+        None: пагинация не запрошена (нет ни limit, ни after_id) - отдается полный список
+        tuple[int, Optional[int]]: (limit, after_id). limit по умолчанию DEFAULT_PAGE_LIMIT
+
+    Raises:
+        InvalidPaginationError: limit не в диапазоне 1..MAX_PAGE_LIMIT или after_id не целое неотрицательное число
+    """
+    if "limit" not in args and "after_id" not in args:
+        return None
+
+    try:
+        limit = int(args.get("limit", DEFAULT_PAGE_LIMIT))
+        after_id = int(args["after_id"]) if "after_id" in args else None
+    except ValueError:
+        raise InvalidPaginationError("limit and after_id must be integers")
+
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise InvalidPaginationError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+    if after_id is not None and after_id < 0:
+        raise InvalidPaginationError("after_id must not be negative")
+    return limit, after_id
+
+
+def to_flask_response(prepared: PreparedResponse):
+    """
+    Переводит PreparedResponse (conditional_response) в ответ Flask
+
+    Args:
+        prepared (PreparedResponse): готовый ответ
+
+    Returns:
+        Response: ответ current_app.response_class
+    """
+    response = current_app.response_class(prepared.body, status=prepared.status, mimetype=prepared.mimetype)
+    for name, value in prepared.headers:
+        response.headers.add(name, value)
+    return response
+
+
+def conditional_by_data_versions(*version_names: str, cache: bool = False, compressible: bool = True) -> Callable:
+    """
+    Декоратор GET-роута: выставляет ETag по версиям наборов данных (DataVersion) и на If-None-Match
+    с совпадающим ETag отвечает 304 Not Modified, не вызывая сам роут (без ORM и сериализации).
+
+    С cache=True готовое тело ответа сохраняется в current_app.response_cache по роуту и query string
+    и отдается оттуда сырыми байтами, пока не изменятся версии данных.
+
+    Наборы данных и cache сохраняются в атрибутах view-функции (data_versions, response_cached) - по ним
+    ASGI-режим отвечает на те же роуты так же (см. above_the_rim.asgi и above_the_rim.conditional_response)
+
+    Args:
+        *version_names (str): имена наборов данных, от которых зависит ответ, например 'teams', 'games'
+        cache (bool): кэшировать тело ответа (для роутов с дорогой сборкой ответа)
+        compressible (bool): ответ роута - JSON, который может сжиматься (response_compression).
+            False для потоковых ответов: их 304 не получает Vary: Accept-Encoding
+
+    Returns:
+        Callable: декоратор для view-функции
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            data_version_service = current_app.service_factory.get_data_version_service()
+            # Версии читаются до данных: если запись случится между ними, ETag окажется старее ответа,
+            # и следующий запрос клиента просто получит 200, а не устаревший 304
+            etag = data_version_service.get_etag(version_names)
+            response_cache = current_app.response_cache if cache else None
+            cache_key = (request.endpoint, request.query_string)
+            prepared = find_prepared_response(
+                etag, request.if_none_match, request.accept_encodings, response_cache, cache_key,
+                compressible and current_app.response_compressor is not None
+            )
+            if prepared is not None:
+                return to_flask_response(prepared)
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            if response_cache is None or response.is_streamed:
+                # Сжатие, если нужно, - в response_compression, там же суффикс сжатия у ETag
+                response.set_etag(etag)
+                return response
+            return to_flask_response(store_response(
+                response_cache, cache_key, etag, response.get_data(), response.mimetype, request.accept_encodings
+            ))
+
+        wrapper.data_versions = version_names
+        wrapper.response_cached = cache
+        wrapper.response_compressible = compressible
+        return wrapper
+    return decorator
@@ -42,6 +42,81 @@ class TestApi(unittest.TestCase):
             test_cases: list[dict] = json.load(f)
         self._run_test_cases(test_cases)
 
+    def test_export_games_ndjson(self):
+        """
+        Проверяет потоковую выгрузку /api/v2/games/export: одна строка NDJSON на игру, четверти в порядке добавления
+        """
+        TestUtils.recreate_db(self.db)
+        TestUtils.populate_db(self.db, {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"}
+            ],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 2, "VISITING_TEAM_ID": 1, "HOME_TEAM_SCORE": 33, "VISITING_TEAM_SCORE": 32},
+                {"ID": 2, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0}
+            ],
+            "quarters": [
+                {"ID": 1, "GAME_ID": 1, "QUARTERS": "12:20"},
+                {"ID": 2, "GAME_ID": 1, "QUARTERS": "21:12"}
+            ]
+        })
+        response = self.app.test_client().get("/api/v2/games/export")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        # Строки сериализует app.json - компактно и с сортировкой ключей, как остальные ответы
+        self.assertEqual(
+            '{"home_team":"Chicago Wizards","home_team_score":0,"id":2,"quarters":[],'
+            '"visiting_team":"Prague Gulls","visiting_team_score":0}',
+            response.get_data(as_text=True).splitlines()[1]
+        )
+        self.assertEqual(lines, [
+            {"id": 1, "home_team": "Prague Gulls", "home_team_score": 33,
+             "visiting_team": "Chicago Wizards", "visiting_team_score": 32, "quarters": ["12:20", "21:12"]},
+            {"id": 2, "home_team": "Chicago Wizards", "home_team_score": 0,
+             "visiting_team": "Prague Gulls", "visiting_team_score": 0, "quarters": []},
+        ])
+
+    def test_conditional_get_by_data_versions(self):
+        """
+        Проверяет ETag/If-None-Match: 304 пока данные не менялись, новый ETag после записи через API
+        """
+        TestUtils.recreate_db(self.db)
+        TestUtils.populate_db(self.db, {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"}
+            ]
+        })
+        self.app.team_registry.invalidate()
+        client = self.app.test_client()
+
+        for url in ["/api/v1/teams", "/api/v1/games/", "/api/v2/games/", "/api/v1/standings/"]:
+            with self.subTest(msg=url):
+                response = client.get(url)
+                self.assertEqual(response.status_code, 200)
+                etag = response.headers["ETag"]
+
+                not_modified = client.get(url, headers={"If-None-Match": etag})
+                self.assertEqual(not_modified.status_code, 304)
+                self.assertEqual(not_modified.headers["ETag"], etag)
+                self.assertEqual(not_modified.data, b"")
+
+        games_etag = client.get("/api/v2/games/").headers["ETag"]
+        teams_etag = client.get("/api/v1/teams").headers["ETag"]
+        client.post("/api/v2/games/", json={"home_team": "PRG", "visiting_team": "CHW"})
+        client.post("/api/v2/games/1", json={"quarters": "12:20"})
+
+        response = client.get("/api/v2/games/", headers={"If-None-Match": games_etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], games_etag)
+        self.assertEqual(response.get_json()["data"], {"1": "Prague Gulls 12:20 Chicago Wizards (12:20)"})
+        self.assertEqual(client.get("/api/v1/teams", headers={"If-None-Match": teams_etag}).status_code, 304)
+
+        client.post("/api/v1/teams", json={"short": "BOS", "name": "Boston Owls"})
+        self.assertEqual(client.get("/api/v1/teams", headers={"If-None-Match": teams_etag}).status_code, 200)
+
     def _run_test_cases(self, test_cases):
         """
         Запускает тест кейсы из файла конфигурации data/test_api_*.json
@@ -57,8 +132,14 @@ class TestApi(unittest.TestCase):
                 if test_case.get('clearDb', True):
                     TestUtils.recreate_db(self.db)
                 TestUtils.populate_db(self.db, test_case['setup'])
+                # populate_db пишет в БД напрямую, минуя сервисы и версии данных - сбрасываем кэши приложения
+                self.app.team_registry.invalidate()
+                self.app.response_cache.invalidate()
                 request_params = TestUtils.get_request_params(test_case['request'])
-                response = self.app.test_client().open(**request_params)
+                # Необязательная верхняя граница количества SQL-запросов роута
+                max_queries = test_case['expected'].get('max_queries', float('inf'))
+                with TestUtils.assert_max_queries(self, self.db, max_queries):
+                    response = self.app.test_client().open(**request_params)
                 self.assertEqual(
                     first=response.status_code,
                     second=test_case['expected']['status'],
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import unittest
+
+from above_the_rim.asgi import create_asgi_app
+from above_the_rim.configs.test import TestConfig
+from utils import SAMPLE_DATA, TestUtils
+
+class TestAsgi(unittest.IsolatedAsyncioTestCase):
+    """
+    Асинхронные роуты ASGI-режима должны отвечать так же, как Flask-роуты
+    """
+
+    def setUp(self):
+        class FileConfig(TestConfig):
+            DB_URL = TestUtils.get_temp_db_url(self)
+            METRICS_ENABLED = True
+            SQL_INSTRUMENTATION_ENABLED = True
+
+        self.asgi_app = create_asgi_app(FileConfig())
+        self.flask_app = self.asgi_app.flask_app
+        self.addCleanup(lambda: self.flask_app.db.get_bind().dispose())
+        TestUtils.populate_db(self.flask_app.db, {
+            **SAMPLE_DATA,
+            "games": SAMPLE_DATA["games"] + [
+                {"ID": 2, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 76, "VISITING_TEAM_SCORE": 67}
+            ]
+        })
+        self.flask_app.db.remove()
+
+    async def asyncTearDown(self):
+        await self.asgi_app.session_maker.kw["bind"].dispose()
+        self.asgi_app.wsgi_executor.shutdown()
+
+    async def _request(self, method: str, path: str, query_string: bytes = b"", headers: list = None, body: bytes = b""):
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await self.asgi_app({
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": query_string,
+            "headers": headers or [],
+            "server": ("localhost", 80),
+            "client": ("127.0.0.1", 12345),
+        }, receive, send)
+        start = next(message for message in messages if message["type"] == "http.response.start")
+        response_body = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+        return start["status"], dict(start["headers"]), response_body
+
+    async def test_responses_match_flask(self):
+        client = self.flask_app.test_client()
+        for path, query_string in [
+            ("/api/v1/teams", b""),
+            ("/api/v1/games/", b""),
+            ("/api/v1/games/", b"limit=1"),
+            ("/api/v1/games/", b"limit=0"),
+            ("/api/v2/games/", b""),
+            ("/api/v2/games/", b"limit=1&after_id=1"),
+        ]:
+            with self.subTest(path=path, query_string=query_string):
+                status, headers, body = await self._request("GET", path, query_string)
+                flask_response = client.get(path, query_string=query_string.decode())
+                self.assertEqual(flask_response.status_code, status)
+                self.assertEqual(flask_response.get_data(), body)
+                self.assertEqual(flask_response.headers.get("ETag"), headers.get(b"etag", b"").decode() or None)
+
+    async def test_compressed_responses_match_flask(self):
+        self.flask_app.response_compressor.min_size = 0
+        client = self.flask_app.test_client()
+        for path in ("/api/v1/teams", "/api/v1/games/", "/api/v2/games/"):
+            with self.subTest(path=path):
+                status, headers, body = await self._request("GET", path, headers=[(b"accept-encoding", b"gzip")])
+                flask_response = client.get(path, headers={"Accept-Encoding": "gzip"})
+                self.assertEqual((200, 200), (flask_response.status_code, status))
+                self.assertEqual(b"gzip", headers[b"content-encoding"])
+                self.assertEqual(flask_response.get_data(), body)
+                self.assertEqual(flask_response.headers["ETag"], headers[b"etag"].decode())
+
+                status, headers, _ = await self._request(
+                    "GET", path, headers=[(b"accept-encoding", b"gzip"), (b"if-none-match", headers[b"etag"])]
+                )
+                self.assertEqual(304, status)
+                self.assertEqual(b"Accept-Encoding", headers[b"vary"])
+
+    async def test_not_modified_by_etag(self):
+        status, headers, _ = await self._request("GET", "/api/v2/games/")
+        self.assertEqual(200, status)
+        status, _, body = await self._request("GET", "/api/v2/games/", headers=[(b"if-none-match", headers[b"etag"])])
+        self.assertEqual(304, status)
+        self.assertEqual(b"", body)
+
+    async def test_other_routes_served_by_flask(self):
+        status, _, _ = await self._request(
+            "POST", "/api/v1/teams",
+            headers=[(b"content-type", b"application/json"), (b"content-length", b"39")],
+            body=b'{"short": "BOS", "name": "Boston Owls"}'
+        )
+        self.assertEqual(201, status)
+        status, _, body = await self._request("GET", "/api/v1/teams")
+        self.assertEqual(200, status)
+        self.assertIn(b'"BOS":"Boston Owls"', body)
+
+    async def test_shares_response_cache_with_flask(self):
+        client = self.flask_app.test_client()
+        response_cache = self.flask_app.response_cache
+        flask_response = client.get("/api/v2/games/", query_string="limit=1")
+        self.assertEqual(0, response_cache.hits)
+
+        status, headers, body = await self._request("GET", "/api/v2/games/", b"limit=1")
+        self.assertEqual(200, status)
+        self.assertEqual(1, response_cache.hits)
+        self.assertEqual(flask_response.get_data(), body)
+
+        status, _, _ = await self._request("GET", "/api/v1/games/", b"limit=x")
+        self.assertEqual(400, status)
+        self.assertEqual(1, len(response_cache))
+
+    async def test_metrics_and_query_stats(self):
+        status, headers, _ = await self._request("GET", "/api/v1/teams")
+        self.assertEqual(200, status)
+        self.assertEqual(b"2", headers[b"x-db-queries"])
+        self.assertIn(b"db;dur=", headers[b"server-timing"])
+
+        counters, histograms = self.flask_app.request_metrics.collect()
+        labels = (("endpoint", "team.get_teams"), ("method", "GET"))
+        self.assertEqual(1, counters[("http_requests_total", labels + (("status", "200"),))])
+        self.assertEqual(2, counters[("http_request_db_queries_total", (("endpoint", "team.get_teams"),))])
+        self.assertIn(("http_request_duration_seconds", labels), histograms)
+
+    async def test_flask_requests_run_in_thread_pool(self):
+        # Оба запроса должны одновременно дойти до Flask - с одним общим потоком второй ждал бы первый
+        barrier = threading.Barrier(2, timeout=5)
+        flask_wsgi_app = self.flask_app.wsgi_app
+
+        def waiting_wsgi_app(environ, start_response):
+            barrier.wait()
+            return flask_wsgi_app(environ, start_response)
+
+        self.flask_app.wsgi_app = waiting_wsgi_app
+        responses = await asyncio.gather(*(self._request("GET", "/api/v1/standings/") for _ in range(2)))
+        self.assertEqual([200, 200], [status for status, _, _ in responses])
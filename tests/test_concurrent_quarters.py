@@ -0,0 +1,95 @@
+import threading
+import unittest
+from types import SimpleNamespace
+
+from above_the_rim.database.db import init_db
+from above_the_rim.errors.game_errors import GameUpdateConflictError
+from above_the_rim.services.repository_factory import RepositoryFactory
+from above_the_rim.services.service_factory import ServiceFactory
+from utils import SAMPLE_DATA, TestUtils
+
+THREADS = 8
+QUARTERS_PER_THREAD = 10
+
+class TestConcurrentQuarters(unittest.TestCase):
+    """
+    Параллельные четверти одной игры из многих потоков: счет, номера четвертей и турнирная таблица
+    должны сойтись точно. Файловая SQLite, у каждого потока своя сессия (scoped_session)
+    """
+
+    def setUp(self):
+        self.db = init_db(TestUtils.get_temp_db_url(self))
+        self.addCleanup(lambda: self.db.get_bind().dispose())
+        self.addCleanup(self.db.remove)
+        self.repo_factory = RepositoryFactory(self.db)
+        TestUtils.populate_db(self.db, {
+            "teams": SAMPLE_DATA["teams"],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0}
+            ]
+        })
+        self.db.remove()
+
+    def _run_threads(self, service_factory: ServiceFactory):
+        errors = []
+        start = threading.Barrier(THREADS)
+
+        def post_quarters(thread_number: int):
+            try:
+                start.wait()
+                game_service = service_factory.get_game_service()
+                for _ in range(QUARTERS_PER_THREAD):
+                    # Поток 0 набирает больше очков гостям, остальные - хозяевам: лидер матча меняется
+                    game_service.add_game_quarter(1, "1:9" if thread_number == 0 else "2:1")
+            except Exception as error:
+                errors.append(error)
+            finally:
+                self.db.remove()
+
+        threads = [threading.Thread(target=post_quarters, args=(number,)) for number in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+
+    def _assert_totals(self):
+        game_repository = self.repo_factory.get_game_repository()
+        game = game_repository.get_score_row(1)
+        quarters_count = THREADS * QUARTERS_PER_THREAD
+        expected_home = QUARTERS_PER_THREAD * 1 + (THREADS - 1) * QUARTERS_PER_THREAD * 2
+        expected_visiting = QUARTERS_PER_THREAD * 9 + (THREADS - 1) * QUARTERS_PER_THREAD * 1
+        self.assertEqual((expected_home, expected_visiting), (game.HOME_TEAM_SCORE, game.VISITING_TEAM_SCORE))
+        self.assertEqual(quarters_count, game.VERSION)
+
+        quarters = self.repo_factory.get_quarters_repository().get_quarter_rows_by_game_ids([1])
+        self.assertEqual(list(range(1, quarters_count + 1)), [quarter.NUMBER for quarter in quarters])
+
+        self.assertEqual(
+            [tuple(row) for row in game_repository.get_standings()],
+            [tuple(row) for row in self.repo_factory.get_team_standings_repository().get_standings()]
+        )
+
+    def test_atomic_increments(self):
+        self._run_threads(ServiceFactory(self.db, self.repo_factory))
+        self._assert_totals()
+
+    def test_optimistic_updates_with_retries(self):
+        self._run_threads(ServiceFactory(
+            self.db, self.repo_factory, optimistic_score_updates=True, score_update_retries=THREADS * QUARTERS_PER_THREAD
+        ))
+        self._assert_totals()
+
+    def test_optimistic_conflict_exhausts_retries(self):
+        game_service = ServiceFactory(
+            self.db, self.repo_factory, optimistic_score_updates=True, score_update_retries=2
+        ).get_game_service()
+        # Версия, прочитанная до чужого обновления: UPDATE с проверкой версии не затронет ни одной строки
+        stale_row = SimpleNamespace(**{**game_service.game_repository.get_score_row(1)._mapping, "VERSION": -1})
+        game_service.game_repository.get_score_row = lambda game_id: stale_row
+
+        with self.assertRaises(GameUpdateConflictError):
+            game_service.add_game_quarter(1, "2:1")
+        game = self.repo_factory.get_game_repository().get_score_row(1)
+        self.assertEqual((0, 0, 0), (game.HOME_TEAM_SCORE, game.VISITING_TEAM_SCORE, game.VERSION))
+        self.assertEqual([], self.repo_factory.get_quarters_repository().get_quarter_rows_by_game_ids([1]))
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import text
+
+from above_the_rim.configs.base import BaseConfig
+from above_the_rim.database.db import init_db, get_engine_options
+from above_the_rim.database.models import Game, Quarters
+from above_the_rim.database.repositories.data_version import (
+    DataVersionRepository, TEAMS_VERSION, GAMES_VERSION, QUARTERS_VERSION, STANDINGS_VERSION
+)
+from utils import TestUtils
+
+class TestInitDb(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.tmp_dir.name, 'test.db')}"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _init_db(self, config=BaseConfig):
+        db = init_db(self.db_url, **get_engine_options(config))
+        self.addCleanup(db.get_bind().dispose)
+        self.addCleanup(db.remove)
+        return db
+
+    def test_sqlite_pragmas_applied(self):
+        db = self._init_db()
+        self.assertEqual("wal", db.execute(text("PRAGMA journal_mode")).scalar())
+        self.assertEqual(1, db.execute(text("PRAGMA synchronous")).scalar())
+        self.assertEqual(1, db.execute(text("PRAGMA foreign_keys")).scalar())
+        self.assertEqual(5000, db.execute(text("PRAGMA busy_timeout")).scalar())
+        self.assertEqual(-64 * 1024, db.execute(text("PRAGMA cache_size")).scalar())
+
+    def test_pool_options_applied(self):
+        class PoolConfig(BaseConfig):
+            DB_POOL_SIZE = 3
+            DB_MAX_OVERFLOW = 2
+            DB_POOL_TIMEOUT = 7
+
+        pool = self._init_db(PoolConfig).get_bind().pool
+        self.assertEqual(3, pool.size())
+        self.assertEqual(2, pool._max_overflow)
+        self.assertEqual(7, pool.timeout())
+
+    def test_data_versions_seeded_with_schema(self):
+        db = self._init_db()
+        names = [TEAMS_VERSION, GAMES_VERSION, QUARTERS_VERSION, STANDINGS_VERSION]
+        rows = db.execute(text('SELECT "NAME", "VERSION" FROM data_versions ORDER BY "NAME"')).all()
+        self.assertEqual(sorted((name, 0) for name in names), [tuple(row) for row in rows])
+
+        # Первая запись только обновляет готовую строку
+        DataVersionRepository(db).bump(GAMES_VERSION)
+        self.assertEqual(1, DataVersionRepository(db).get_version(GAMES_VERSION))
+        self.assertEqual(4, db.execute(text("SELECT COUNT(*) FROM data_versions")).scalar())
+
+    def test_team_delete_cascades(self):
+        db = self._init_db()
+        TestUtils.populate_db(db, {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"}
+            ],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 33, "VISITING_TEAM_SCORE": 32}
+            ],
+            "quarters": [
+                {"ID": 1, "GAME_ID": 1, "QUARTERS": "33:32"}
+            ]
+        })
+        db.execute(text("DELETE FROM teams WHERE ID = 2"))
+        db.commit()
+        self.assertEqual(0, db.query(Game).count())
+        self.assertEqual(0, db.query(Quarters).count())
@@ -0,0 +1,58 @@
+import unittest
+
+from above_the_rim.database.db import init_db
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.services.repository_factory import RepositoryFactory
+from utils import TestUtils
+
+class TestGameRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.db = init_db(TestConfig.DB_URL)
+        repo_factory = RepositoryFactory(self.db)
+        self.game_repository = repo_factory.get_game_repository()
+        setup_data = {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"},
+                {"ID": 3, "SHORT": "BOS", "NAME": "Boston Owls"}
+            ],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 2, "VISITING_TEAM_ID": 1, "HOME_TEAM_SCORE": 76, "VISITING_TEAM_SCORE": 67},
+                {"ID": 2, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 33, "VISITING_TEAM_SCORE": 32},
+                {"ID": 3, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 10, "VISITING_TEAM_SCORE": 12}
+            ]
+        }
+        TestUtils.populate_db(self.db, setup_data)
+
+    def test_get_all_game_rows(self):
+        rows = self.game_repository.get_all_game_rows()
+        self.assertEqual(3, len(rows))
+        first = rows[0]
+        self.assertEqual(1, first.ID)
+        self.assertEqual("Prague Gulls", first.HOME_TEAM_NAME)
+        self.assertEqual("Chicago Wizards", first.VISITING_TEAM_NAME)
+        self.assertEqual((76, 67), (first.HOME_TEAM_SCORE, first.VISITING_TEAM_SCORE))
+
+    def test_get_all_game_rows_does_not_load_orm_objects(self):
+        self.db.expunge_all()
+        self.game_repository.get_all_game_rows()
+        self.assertEqual(0, len(self.db.identity_map))
+
+    def test_get_standings_all_teams(self):
+        standings = {row.SHORT: (row.WIN, row.LOST) for row in self.game_repository.get_standings()}
+        self.assertEqual({"CHW": (1, 2), "PRG": (2, 1), "BOS": (0, 0)}, standings)
+
+    def test_get_standings_one_team(self):
+        standings = self.game_repository.get_standings("PRG")
+        self.assertEqual(1, len(standings))
+        self.assertEqual((2, 1), (standings[0].WIN, standings[0].LOST))
+
+    def test_get_standings_team_not_found(self):
+        self.assertEqual([], self.game_repository.get_standings("DDD"))
+
+    def test_get_head_to_head(self):
+        head_to_head = self.game_repository.get_head_to_head(1, 2)
+        self.assertEqual((2, 1, 1, 1, 0, 1, -10), tuple(head_to_head))
+        self.assertEqual((1, 1, 0, 2, 1, 1, 10), tuple(self.game_repository.get_head_to_head(2, 1)))
+        self.assertEqual((0, 0, 0, 0, 0, 0, 0), tuple(self.game_repository.get_head_to_head(1, 3)))
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from above_the_rim.database.db import init_db
 from above_the_rim.configs.test import TestConfig
@@ -14,7 +15,7 @@ class TestGameService(unittest.TestCase):
         self.repo_factory = RepositoryFactory(self.db)
         self.service_factory = ServiceFactory(self.db, self.repo_factory)
 
-    def test_get_game_with_quarters(self):
+    def _populate_games_with_quarters(self):
         setup_data = {
             "teams": [
                 {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
@@ -31,6 +32,8 @@ class TestGameService(unittest.TestCase):
         }
         TestUtils.populate_db(self.db, setup_data)
 
+    def test_get_game_with_quarters(self):
+        self._populate_games_with_quarters()
         game_service: GameService = self.service_factory.get_game_service()
         all_games = game_service.get_all_games_with_quarters()
         game_1_data, game_2_data = all_games
@@ -39,3 +42,101 @@ class TestGameService(unittest.TestCase):
         self.assertEqual(len(game_2_data["quarters"]), 2)
         self.assertEqual(quarters_2_1.QUARTERS, "12:20")
         self.assertEqual(quarters_2_2.QUARTERS, "21:12")
+
+    def test_get_games_with_quarters_by_rows(self):
+        self._populate_games_with_quarters()
+        game_service: GameService = self.service_factory.get_game_service()
+        game_service.quarters_repository.IN_CHUNK_SIZE = 1
+        game_rows = game_service.get_all_game_rows()
+        games = game_service.get_games_with_quarters_by_rows(game_rows[::-1])
+        self.assertEqual([2, 1], [item["game"].ID for item in games])
+        self.assertEqual(["12:20", "21:12"], [q.QUARTERS for q in games[0]["quarters"]])
+        self.assertEqual([], games[1]["quarters"])
+
+    def test_standings_follow_quarter_lead_changes(self):
+        TestUtils.populate_db(self.db, {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"}
+            ]
+        })
+        game_service: GameService = self.service_factory.get_game_service()
+        game = game_service.add_game_by_data("PRG", "CHW")
+        game_service.add_game_by_data("CHW", "PRG", 70, 60)
+
+        game_service.add_game_quarter(game.ID, "20:12")
+        self.assertEqual({"CHW": (1, 1), "PRG": (1, 1)}, self._standings())
+
+        # Гости выходят вперед - победа переходит к CHW
+        game_service.add_game_quarter(game.ID, "10:30")
+        self.assertEqual({"CHW": (2, 0), "PRG": (0, 2)}, self._standings())
+
+        # Ничья - у игры нет ни победителя, ни проигравшего
+        game_service.add_game_quarter(game.ID, "12:0")
+        self.assertEqual({"CHW": (1, 0), "PRG": (0, 1)}, self._standings())
+
+        self._assert_standings_match_games()
+
+    def test_rebuild_standings(self):
+        self._populate_games_with_quarters()
+        game_service: GameService = self.service_factory.get_game_service()
+        game_service.team_standings_repository.delete_all()
+        self.db.commit()
+        self.assertEqual(2, game_service.rebuild_standings())
+        self._assert_standings_match_games()
+
+    def test_standings_row_created_for_team_without_row(self):
+        self._populate_games_with_quarters()
+        game_service: GameService = self.service_factory.get_game_service()
+        game_service.team_standings_repository.delete_all()
+        self.db.commit()
+        game_service.add_game_by_data("CHW", "PRG", 80, 70)
+        self.assertEqual({"CHW": (1, 2), "PRG": (2, 1)}, self._standings())
+        self._assert_standings_match_games()
+
+    def test_new_team_gets_standings_row(self):
+        self._populate_games_with_quarters()
+        self.service_factory.get_team_service().add_team_by_data("BOS", "Boston Owls")
+        game_service: GameService = self.service_factory.get_game_service()
+        team_id = game_service.team_registry.get_team("BOS").ID
+        self.assertEqual((0, 0, 0, 0), tuple(game_service.team_standings_repository.get_by_team_id(team_id)))
+
+        game_service.add_game_by_data("BOS", "PRG", 80, 70)
+        self.assertEqual((1, 0), self._standings()["BOS"])
+        self._assert_standings_match_games()
+
+    def test_standings_fallback_adds_to_concurrently_inserted_row(self):
+        self._populate_games_with_quarters()
+        game_service: GameService = self.service_factory.get_game_service()
+        # Строки уже вставлены параллельной транзакцией, но UPDATE этой транзакции их не увидел
+        with mock.patch.object(game_service.team_standings_repository, "add_to_team", return_value=0):
+            game_service.add_game_by_data("CHW", "PRG", 80, 70)
+        self.assertEqual({"CHW": (1, 2), "PRG": (2, 1)}, self._standings())
+        self._assert_standings_match_games()
+
+    def test_add_games_batch(self):
+        self._populate_games_with_quarters()
+        game_service: GameService = self.service_factory.get_game_service()
+        game_ids = game_service.add_games_batch([
+            {"home_short": "CHW", "visiting_short": "PRG", "quarters": ["30:10", "5:20"]},
+            {"home_short": "CHW", "visiting_short": "DDD"},
+            {"home_short": "PRG", "visiting_short": "CHW", "home_score": 10, "visiting_score": 0, "quarters": ["0:5"]},
+        ])
+        self.assertEqual([3, None, 4], game_ids)
+        games = {item["game"].ID: item for item in game_service.get_all_games_with_quarters()}
+        self.assertEqual((35, 30), (games[3]["game"].HOME_TEAM_SCORE, games[3]["game"].VISITING_TEAM_SCORE))
+        self.assertEqual(["30:10", "5:20"], [q.QUARTERS for q in games[3]["quarters"]])
+        self.assertEqual((10, 5), (games[4]["game"].HOME_TEAM_SCORE, games[4]["game"].VISITING_TEAM_SCORE))
+        self.assertEqual({"CHW": (1, 3), "PRG": (3, 1)}, self._standings())
+        self._assert_standings_match_games()
+
+    def _standings(self):
+        game_service: GameService = self.service_factory.get_game_service()
+        return {item["short"]: (item["win"], item["lost"]) for item in game_service.get_standings()}
+
+    def _assert_standings_match_games(self):
+        game_service: GameService = self.service_factory.get_game_service()
+        self.assertEqual(
+            [tuple(row) for row in game_service.game_repository.get_standings()],
+            [tuple(row) for row in game_service.team_standings_repository.get_standings()]
+        )
@@ -0,0 +1,97 @@
+import dataclasses
+import datetime
+import decimal
+import unittest
+import uuid
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.json_provider import FastJSONProvider
+from utils import TestUtils
+
+@dataclasses.dataclass
+class Score:
+    visiting: int
+    home: int
+
+# Данные, на которых ответ должен совпадать с DefaultJSONProvider байт в байт
+PAYLOADS = [
+    {"data": {10: "Prague Gulls 33:32 Chicago Wizards", 2: "Chicago Wizards 76:67 Prague Gulls"}, "success": True},
+    {"success": True, "data": [{"short": "PRG", "name": "Prague Gulls", "win": 3, "lost": 1}]},
+    {"data": {3: {"quarters": ["12:20", "21:12"], "id": 3}, 1: {"quarters": [], "id": 1}}},
+    {"data": {"average_margin": -3.33, "games": 3, "wins": 1}, "success": True},
+    {"data": {"average_margin": None, "games": 0, "wins": 0}, "success": True},
+    {"b": [1, 2.5, None, False, (3, 4)], "a": {"é": "Praha Racci 😀", "\x7f": "\n\t\"\\"}},
+    {"big": 2 ** 70, "small": -1},
+    {"date": datetime.date(2024, 1, 2), "time": datetime.datetime(2024, 1, 2, 3, 4, 5)},
+    {"id": uuid.UUID(int=5), "price": decimal.Decimal("1.10"), "score": Score(32, 33)},
+    [],
+    "plain string",
+    None,
+]
+
+class TestFastJSONProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.default = DefaultJSONProvider(self.app)
+        self.providers = [FastJSONProvider(self.app), FastJSONProvider(self.app, use_orjson=False)]
+
+    def test_same_output_as_default_provider(self):
+        with self.app.app_context():
+            for payload in PAYLOADS:
+                expected = self.default.response(payload).get_data()
+                for provider in self.providers:
+                    with self.subTest(payload=payload, use_orjson=provider.use_orjson):
+                        self.assertEqual(expected, provider.response(payload).get_data())
+                        self.assertEqual(self.default.dumps(payload), provider.dumps(payload))
+
+    def test_int_keys_sorted_numerically(self):
+        for provider in self.providers:
+            self.assertEqual('{"2":"b","10":"a"}', provider.dumps({10: "a", 2: "b"}, separators=(",", ":")))
+
+    def test_nested_objects_under_int_keys(self):
+        # Вложенные объекты с ключами-строками сериализует orjson и вставляет в ответ целиком
+        games = {10: {"quarters": ["12:20"], "id": 10, "team": "Praž"}, 2: {"id": 2, "quarters": []}}
+        expected = self.default.dumps({"data": games, "success": True}, separators=(",", ":"))
+        for provider in self.providers:
+            with self.subTest(use_orjson=provider.use_orjson):
+                self.assertEqual(
+                    expected, provider.dumps({"data": games, "success": True}, separators=(",", ":"))
+                )
+
+    def test_not_serializable_raises_type_error(self):
+        for provider in self.providers:
+            with self.assertRaises(TypeError):
+                provider.dumps({"data": object()}, separators=(",", ":"))
+
+
+class TestFastJSONProviderApi(unittest.TestCase):
+
+    def test_installed_in_app(self):
+        app = create_app(TestConfig())
+        self.assertIsInstance(app.json, FastJSONProvider)
+        TestUtils.populate_db(app.db, {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Pražské Racci"}
+            ],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 2, "VISITING_TEAM_ID": 1, "HOME_TEAM_SCORE": 33, "VISITING_TEAM_SCORE": 32},
+                {"ID": 10, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0},
+                {"ID": 2, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0}
+            ]
+        })
+        app.team_registry.invalidate()
+
+        response = app.test_client().get("/api/v2/games/")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            b'{"data":{"1":"Pra\\u017esk\\u00e9 Racci 33:32 Chicago Wizards",'
+            b'"2":"Chicago Wizards 0:0 Pra\\u017esk\\u00e9 Racci",'
+            b'"10":"Chicago Wizards 0:0 Pra\\u017esk\\u00e9 Racci"},"success":true}\n',
+            response.get_data()
+        )
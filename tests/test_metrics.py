@@ -0,0 +1,139 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.request_metrics import RequestMetrics
+from utils import TestUtils
+
+def parse_metrics(text: str) -> dict[str, float]:
+    """
+    Разбирает текст Prometheus в словарь 'имя{метки}' -> значение (без строк # HELP/# TYPE)
+    """
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+class MetricsConfig(TestConfig):
+    METRICS_ENABLED = True
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.app = TestUtils.create_app_with_data(MetricsConfig())
+        self.client = self.app.test_client()
+
+    def test_requests_by_endpoint_and_status(self):
+        for _ in range(3):
+            self.client.get("/api/v2/games/")
+        self.client.get("/api/v1/team/CHW")
+        self.client.get("/api/v1/team/NOPE")
+        self.client.get("/no/such/page")
+
+        response = self.client.get("/metrics")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("text/plain; version=0.0.4; charset=utf-8", response.content_type)
+        text = response.get_data(as_text=True)
+        samples = parse_metrics(text)
+
+        prefix = "above_the_rim_http_requests_total"
+        self.assertEqual(3, samples[f'{prefix}{{endpoint="game_v2.get_games",method="GET",status="200"}}'])
+        self.assertEqual(1, samples[f'{prefix}{{endpoint="team.get_team_stats",method="GET",status="200"}}'])
+        self.assertEqual(1, samples[f'{prefix}{{endpoint="team.get_team_stats",method="GET",status="400"}}'])
+        self.assertEqual(1, samples[f'{prefix}{{endpoint="unmatched",method="GET",status="404"}}'])
+        self.assertIn("# TYPE above_the_rim_http_request_duration_seconds histogram", text)
+
+        histogram = "above_the_rim_http_request_duration_seconds"
+        labels = 'endpoint="game_v2.get_games",method="GET"'
+        buckets = [
+            value for name, value in samples.items() if name.startswith(f"{histogram}_bucket{{{labels},")
+        ]
+        self.assertEqual(sorted(buckets), buckets)
+        self.assertEqual(3, samples[f'{histogram}_bucket{{{labels},le="+Inf"}}'])
+        self.assertEqual(3, samples[f"{histogram}_count{{{labels}}}"])
+        self.assertGreater(samples[f"{histogram}_sum{{{labels}}}"], 0)
+
+        # Первый список игр строится, следующие два отдаются из кэша ответов
+        self.assertEqual(2, samples["above_the_rim_response_cache_hits_total"])
+        self.assertAlmostEqual(2 / 3, samples["above_the_rim_response_cache_hit_ratio"])
+        # Прогрев при старте и перезагрузка после invalidate в setUp
+        self.assertEqual(2, samples["above_the_rim_team_registry_reloads_total"])
+        self.assertGreater(samples['above_the_rim_db_pool_checkouts_total{db="primary"}'], 0)
+
+    def test_counters_from_many_threads(self):
+        metrics = RequestMetrics()
+        labels = (("endpoint", "team.get_teams"),)
+
+        def worker():
+            for _ in range(1000):
+                metrics.increment("http_requests_total", labels)
+                metrics.observe("http_request_duration_seconds", labels, 0.02)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        samples = parse_metrics(metrics.render())
+        self.assertEqual(8000, samples['above_the_rim_http_requests_total{endpoint="team.get_teams"}'])
+        self.assertEqual(0, samples['above_the_rim_http_request_duration_seconds_bucket{endpoint="team.get_teams",le="0.01"}'])
+        self.assertEqual(8000, samples['above_the_rim_http_request_duration_seconds_bucket{endpoint="team.get_teams",le="0.025"}'])
+        self.assertAlmostEqual(160, samples['above_the_rim_http_request_duration_seconds_sum{endpoint="team.get_teams"}'])
+
+    def test_finished_threads_folded(self):
+        metrics = RequestMetrics()
+        labels = (("endpoint", "team.get_teams"),)
+
+        # Как threaded-сервер Werkzeug: новый поток на каждый запрос
+        for _ in range(500):
+            thread = threading.Thread(target=metrics.increment, args=("http_requests_total", labels))
+            thread.start()
+            thread.join()
+
+        self.assertLess(len(metrics._shards), 100)
+        samples = parse_metrics(metrics.render())
+        self.assertEqual(500, samples['above_the_rim_http_requests_total{endpoint="team.get_teams"}'])
+        self.assertEqual(0, len(metrics._shards))
+
+    def test_pool_gauges(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            class FileConfig(MetricsConfig):
+                DB_URL = f"sqlite:///{os.path.join(tmp_dir, 'test.db')}"
+
+            app = create_app(FileConfig())
+            client = app.test_client()
+            client.get("/api/v1/teams")
+            samples = parse_metrics(client.get("/metrics").get_data(as_text=True))
+            app.db.get_bind().dispose()
+
+        self.assertEqual(FileConfig.DB_POOL_SIZE, samples['above_the_rim_db_pool_size{db="primary"}'])
+        self.assertEqual(0, samples['above_the_rim_db_pool_checked_out{db="primary"}'])
+        self.assertIn('above_the_rim_db_pool_overflow{db="primary"}', samples)
+
+    def test_metrics_disabled(self):
+        class NoMetricsConfig(TestConfig):
+            METRICS_ENABLED = False
+
+        client = create_app(NoMetricsConfig()).test_client()
+        self.assertEqual(404, client.get("/metrics").status_code)
+        self.assertEqual(200, client.get("/api/v1/teams").status_code)
+
+    def test_metrics_disabled_by_default(self):
+        self.assertEqual(404, create_app(TestConfig()).test_client().get("/metrics").status_code)
+
+    def test_metrics_token(self):
+        class TokenConfig(MetricsConfig):
+            METRICS_TOKEN = "scrape-secret"
+
+        client = create_app(TokenConfig()).test_client()
+        self.assertEqual(401, client.get("/metrics").status_code)
+        self.assertEqual(401, client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code)
+        response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        self.assertEqual(200, response.status_code)
+        self.assertIn("above_the_rim_http_requests_total", response.get_data(as_text=True))
@@ -0,0 +1,142 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.errors.game_errors import QuarterQueueFullError, QuarterQueueClosedError
+from above_the_rim.services.quarter_queue import QuarterQueue
+from utils import SAMPLE_DATA, TestUtils
+
+class TestQuarterQueue(unittest.TestCase):
+    """
+    Отложенная запись четвертей: ответ 202 после проверки, запись пачками, backpressure и дозапись при остановке.
+    Файловая SQLite - поток-писатель должен видеть ту же БД, что и запросы
+    """
+
+    def setUp(self):
+        class QueueConfig(TestConfig):
+            DB_URL = TestUtils.get_temp_db_url(self)
+            QUARTER_QUEUE_ENABLED = True
+            # Большой интервал: все четверти теста попадают в одну пачку, если их не дописывает stop
+            QUARTER_QUEUE_FLUSH_INTERVAL = 0.5
+
+        self.app = TestUtils.create_app_with_data(QueueConfig(), {
+            "teams": SAMPLE_DATA["teams"],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0},
+                {"ID": 2, "HOME_TEAM_ID": 2, "VISITING_TEAM_ID": 1, "HOME_TEAM_SCORE": 10, "VISITING_TEAM_SCORE": 0}
+            ]
+        })
+        self.db = self.app.db
+        self.quarter_queue: QuarterQueue = self.app.quarter_queue
+        self.addCleanup(lambda: self.db.get_bind().dispose())
+        self.addCleanup(self.quarter_queue.stop)
+        self.client = self.app.test_client()
+
+    def _get_games(self) -> dict:
+        return self.client.get("/api/v2/games/").get_json()["data"]
+
+    def test_quarters_written_in_one_batch(self):
+        for game_id, quarter in [(1, "10:12"), (2, "1:20"), (1, "5:1"), (2, "3:3")]:
+            response = self.client.post(f"/api/v2/games/{game_id}", json={"quarters": quarter})
+            self.assertEqual(202, response.status_code)
+            self.assertEqual({"success": True, "data": "Quarter accepted"}, response.get_json())
+
+        self.quarter_queue.join()
+        self.assertEqual((4, 4, 1), (self.quarter_queue.accepted, self.quarter_queue.written, self.quarter_queue.batches))
+        self.assertEqual({
+            "1": "Chicago Wizards 15:13 Prague Gulls (10:12,5:1)",
+            "2": "Prague Gulls 14:23 Chicago Wizards (1:20,3:3)"
+        }, self._get_games())
+
+        standings = {row["short"]: (row["win"], row["lost"]) for row in self.client.get("/api/v1/standings/").get_json()["data"]}
+        self.assertEqual({"CHW": (2, 0), "PRG": (0, 2)}, standings)
+
+    def test_invalid_quarter_rejected_before_queue(self):
+        response = self.client.post("/api/v2/games/1", json={"quarters": "10-12"})
+        self.assertEqual((400, "Wrong quarters format"), (response.status_code, response.get_json()["data"]))
+        response = self.client.post("/api/v2/games/99", json={"quarters": "10:12"})
+        self.assertEqual((400, "There is no game with id 99"), (response.status_code, response.get_json()["data"]))
+        self.assertEqual(0, self.quarter_queue.accepted)
+
+    def test_game_id_from_url_normalized(self):
+        for path in ("/api/v2/games/1", "/api/v2/games/01"):
+            self.assertEqual(202, self.client.post(path, json={"quarters": "1:2"}).status_code)
+        response = self.client.post("/api/v2/games/abc", json={"quarters": "1:2"})
+        self.assertEqual((400, "There is no game with id abc"), (response.status_code, response.get_json()["data"]))
+
+        self.quarter_queue.join()
+        self.assertEqual(1, self.quarter_queue.batches)
+        quarters = self.app.service_factory.get_game_service().quarters_repository.get_quarters_by_game_id(1)
+        self.assertEqual([1, 2], [quarter.NUMBER for quarter in quarters])
+
+    def test_stop_drains_queue(self):
+        for _ in range(20):
+            self.assertEqual(202, self.client.post("/api/v2/games/1", json={"quarters": "1:2"}).status_code)
+        self.quarter_queue.stop()
+
+        self.assertFalse(self.quarter_queue.running)
+        self.assertEqual(20, self.quarter_queue.written)
+        self.assertEqual("Chicago Wizards 20:40 Prague Gulls", self._get_games()["1"].split(" (")[0])
+
+    def test_full_queue_rejects_with_503(self):
+        self.quarter_queue.stop()
+        # Писатель забирает первую четверть и ждет, пока тест не освободит его - остальные копятся в очереди
+        writer_released = threading.Event()
+
+        def blocked_game_service():
+            writer_released.wait(5)
+            return self.app.service_factory.get_game_service()
+
+        full_queue = QuarterQueue(blocked_game_service, self.db, max_size=2, batch_size=1, put_timeout=0.01)
+        self.app.quarter_queue = full_queue
+        full_queue.start()
+        self.addCleanup(full_queue.stop)
+        self.addCleanup(writer_released.set)
+        full_queue.put(1, 1, 1)
+        while len(full_queue):
+            time.sleep(0.001)
+        for _ in range(2):
+            full_queue.put(1, 1, 1)
+        with self.assertRaises(QuarterQueueFullError):
+            full_queue.put(1, 1, 1)
+
+        response = self.client.post("/api/v2/games/1", json={"quarters": "1:1"})
+        self.assertEqual(503, response.status_code)
+        self.assertEqual("1", response.headers["Retry-After"])
+        self.assertEqual((3, 2), (full_queue.accepted, full_queue.rejected))
+
+        # Остановка дописывает все принятое
+        writer_released.set()
+        full_queue.stop()
+        self.assertEqual(3, full_queue.written)
+
+    def test_stopped_queue_rejects_with_503(self):
+        self.quarter_queue.stop()
+        with self.assertRaises(QuarterQueueClosedError):
+            self.quarter_queue.put(1, 1, 1)
+
+        response = self.client.post("/api/v2/games/1", json={"quarters": "1:1"})
+        self.assertEqual(503, response.status_code)
+        self.assertEqual("Quarter queue is not running, try again later", response.get_json()["data"])
+        self.assertEqual((0, 0, 2), (len(self.quarter_queue), self.quarter_queue.accepted, self.quarter_queue.rejected))
+
+    def test_dead_writer_rejects(self):
+        def broken_game_service():
+            raise RuntimeError("Database is gone")
+
+        not_started = QuarterQueue(broken_game_service, self.db)
+        with self.assertRaises(QuarterQueueClosedError):
+            not_started.put(1, 1, 1)
+
+        dead_writer = QuarterQueue(broken_game_service, self.db, flush_interval=0)
+        # Исключение завершает поток-писатель, трассировка в stderr тесту не нужна
+        with mock.patch("threading.excepthook"):
+            dead_writer.start()
+            dead_writer.put(1, 1, 1)
+            dead_writer._thread.join(5)
+        self.assertFalse(dead_writer.running)
+        with self.assertRaises(QuarterQueueClosedError):
+            dead_writer.put(1, 1, 1)
+        self.assertEqual((1, 1), (dead_writer.accepted, dead_writer.rejected))
@@ -0,0 +1,52 @@
+import unittest
+
+from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
+
+from above_the_rim.database.db import init_db, get_engine_options
+from above_the_rim.database.models import Quarters
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.services.repository_factory import RepositoryFactory
+from utils import TestUtils
+
+class TestQuartersRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.db = init_db(TestConfig.DB_URL, **get_engine_options(TestConfig))
+        self.quarters_repository = RepositoryFactory(self.db).get_quarters_repository()
+        TestUtils.populate_db(self.db, {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"}
+            ],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 2, "VISITING_TEAM_ID": 1, "HOME_TEAM_SCORE": 33, "VISITING_TEAM_SCORE": 32},
+                {"ID": 2, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0}
+            ],
+            "quarters": [
+                {"ID": 1, "GAME_ID": 1, "QUARTERS": "12:20"},
+                {"ID": 2, "GAME_ID": 1, "QUARTERS": "21:12"}
+            ]
+        })
+
+    def test_quarter_rows_keep_api_format(self):
+        rows = self.quarters_repository.get_quarter_rows_by_game_ids([1, 2])
+        self.assertEqual([(1, 12, 20, "12:20"), (2, 21, 12, "21:12")],
+                         [(row.NUMBER, row.HOME_POINTS, row.VISITING_POINTS, row.QUARTERS) for row in rows])
+
+    def test_get_next_number(self):
+        self.assertEqual(3, self.quarters_repository.get_next_number(1))
+        self.assertEqual(1, self.quarters_repository.get_next_number(2))
+
+    def test_points_aggregate_in_sql(self):
+        query = (
+            select(func.sum(Quarters.HOME_POINTS), func.sum(Quarters.VISITING_POINTS))
+            .where(Quarters.GAME_ID == 1)
+        )
+        self.assertEqual((33, 32), tuple(self.db.execute(query).one()))
+
+    def test_quarter_number_unique_per_game(self):
+        self.db.add(Quarters(GAME_ID=1, NUMBER=2, HOME_POINTS=1, VISITING_POINTS=1))
+        with self.assertRaises(IntegrityError):
+            self.db.flush()
+        self.db.rollback()
@@ -0,0 +1,73 @@
+import re
+import unittest
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from above_the_rim.database.db import init_db
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.services.repository_factory import RepositoryFactory
+from utils import SAMPLE_DATA, TestUtils
+
+# Полный просмотр таблицы с играми/четвертями/статистикой в плане запроса. teams - справочник,
+# его просмотр целиком допустим (например, в турнирной таблице всех команд)
+TABLE_SCAN = re.compile(r"^SCAN (games|quarters|team_standings)\b")
+
+class TestQueryPlans(unittest.TestCase):
+    """
+    Горячие запросы репозиториев должны идти по индексам: EXPLAIN QUERY PLAN каждого реально
+    выполненного запроса не должен содержать полного просмотра таблицы
+    """
+
+    def setUp(self):
+        self.db = init_db(TestConfig.DB_URL)
+        self.repo_factory = RepositoryFactory(self.db)
+        TestUtils.populate_db(self.db, SAMPLE_DATA)
+
+    @contextmanager
+    def _capture_queries(self):
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                queries.append((statement, parameters))
+
+        engine = self.db.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    def _assert_no_table_scan(self, call):
+        with self._capture_queries() as queries:
+            call()
+        self.assertTrue(queries)
+        connection = self.db.connection().connection.dbapi_connection
+        for statement, parameters in queries:
+            plan = [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            scans = [detail for detail in plan if TABLE_SCAN.match(detail)]
+            self.assertEqual([], scans, f"{statement}\n{plan}")
+
+    def test_hot_queries_use_indexes(self):
+        game_repository = self.repo_factory.get_game_repository()
+        quarters_repository = self.repo_factory.get_quarters_repository()
+        team_standings_repository = self.repo_factory.get_team_standings_repository()
+        hot_queries = {
+            "get_home_wins_by_team_id": lambda: game_repository.get_home_wins_by_team_id(1),
+            "get_visiting_wins_by_team_id": lambda: game_repository.get_visiting_wins_by_team_id(1),
+            "get_home_loses_by_team_id": lambda: game_repository.get_home_loses_by_team_id(1),
+            "get_visiting_losses_by_team_id": lambda: game_repository.get_visiting_losses_by_team_id(1),
+            "get_standings(team_short)": lambda: game_repository.get_standings(team_short="CHW"),
+            "get_standings(team_ids)": lambda: game_repository.get_standings(team_ids=[1]),
+            "get_head_to_head": lambda: game_repository.get_head_to_head(1, 2),
+            "get_game_by_id": lambda: game_repository.get_game_by_id(1),
+            "get_game_rows_after_id": lambda: game_repository.get_game_rows_after_id(10, after_id=0),
+            "get_quarters_by_game_id": lambda: quarters_repository.get_quarters_by_game_id(1),
+            "get_quarter_rows_by_game_ids": lambda: quarters_repository.get_quarter_rows_by_game_ids([1]),
+            "get_next_number": lambda: quarters_repository.get_next_number(1),
+            "team_standings.get_by_team_id": lambda: team_standings_repository.get_by_team_id(1),
+        }
+        for name, call in hot_queries.items():
+            with self.subTest(query=name):
+                self._assert_no_table_scan(call)
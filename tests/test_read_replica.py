@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine, insert
+
+from above_the_rim.database.db import Base, init_db, use_primary
+from above_the_rim.database.models import Team
+from above_the_rim.services.repository_factory import RepositoryFactory
+from above_the_rim.services.service_factory import ServiceFactory
+
+class TestReadReplica(unittest.TestCase):
+    """
+    Основная БД и реплика - два файла SQLite. Репликации между ними нет, поэтому по содержимому
+    видно, в какую из БД ушел запрос
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        replica_url = f"sqlite:///{os.path.join(self.tmp_dir.name, 'replica.db')}"
+        self.replica_engine = create_engine(replica_url)
+        self.addCleanup(self.replica_engine.dispose)
+        Base.metadata.create_all(bind=self.replica_engine)
+
+        self.db = init_db(f"sqlite:///{os.path.join(self.tmp_dir.name, 'primary.db')}", read_db_url=replica_url)
+        self.addCleanup(lambda: self.db().read_bind.dispose())
+        self.addCleanup(lambda: self.db.get_bind().dispose())
+        self.addCleanup(self.db.remove)
+        self.service_factory = ServiceFactory(self.db, RepositoryFactory(self.db))
+
+    def _team_shorts(self) -> list[str]:
+        return [team.SHORT for team in self.service_factory.get_team_service().get_all_teams()]
+
+    def test_reads_go_to_replica(self):
+        with self.replica_engine.begin() as connection:
+            connection.execute(insert(Team), [{"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"}])
+        self.assertEqual(["CHW"], self._team_shorts())
+
+        use_primary(self.db)
+        self.assertEqual([], self._team_shorts())
+
+    def test_writes_go_to_primary_with_read_your_writes(self):
+        self.service_factory.get_team_service().add_team_by_data("PRG", "Prague Gulls")
+        # Та же сессия после записи читает из основной БД
+        self.assertEqual(["PRG"], self._team_shorts())
+
+        # Новая сессия (следующий запрос) снова читает из реплики
+        self.db.remove()
+        self.assertEqual([], self._team_shorts())
+        use_primary(self.db)
+        self.assertEqual(["PRG"], self._team_shorts())
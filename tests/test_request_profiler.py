@@ -0,0 +1,94 @@
+import os
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.base import parse_sample_rates
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.request_profiler import PROFILE_HEADER, PROFILE_MODE_HEADER
+from utils import TestUtils
+
+class TestRequestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.profile_dir = tmp_dir.name
+
+        class ProfilerConfig(TestConfig):
+            PROFILER_ENABLED = True
+            PROFILER_SECRET = "s3cret"
+            PROFILER_DIR = self.profile_dir
+            PROFILER_SAMPLE_RATES = {"team.get_teams": 3}
+
+        self.app = TestUtils.create_app_with_data(ProfilerConfig())
+        self.client = self.app.test_client()
+
+    def _dumps(self) -> list[str]:
+        return sorted(os.listdir(self.profile_dir))
+
+    def test_cpu_profile_by_secret_header(self):
+        response = self.client.get("/api/v2/games/", headers={PROFILE_HEADER: "s3cret"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"1": "Prague Gulls 33:32 Chicago Wizards (12:20,21:12)"}, response.get_json()["data"])
+
+        dumps = self._dumps()
+        self.assertEqual(1, len(dumps))
+        self.assertRegex(dumps[0], r"^\d{8}-\d{6}-\d{6}-game_v2\.get_games-\d+ms\.prof$")
+        functions = {function for _, _, function in pstats.Stats(os.path.join(self.profile_dir, dumps[0])).stats}
+        self.assertIn("get_all_games_with_quarters", functions)
+
+    def test_concurrent_cpu_profile_skipped(self):
+        profiler = self.app.wsgi_app
+        # Другой запрос уже профилируется - этот выполняется без профилирования, а не падает
+        with profiler._cpu_lock:
+            response = self.client.get("/api/v2/games/", headers={PROFILE_HEADER: "s3cret"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([], self._dumps())
+
+    def test_wrong_secret_is_ignored(self):
+        self.assertEqual(200, self.client.get("/api/v2/games/", headers={PROFILE_HEADER: "guess"}).status_code)
+        self.assertEqual([], self._dumps())
+
+    def test_memory_snapshot(self):
+        response = self.client.get(
+            "/api/v2/games/export", headers={PROFILE_HEADER: "s3cret", PROFILE_MODE_HEADER: "memory"}
+        )
+        self.assertEqual(200, response.status_code)
+        # Потоковое тело ответа не теряется при профилировании
+        self.assertEqual(1, len(response.get_data(as_text=True).splitlines()))
+
+        dumps = self._dumps()
+        self.assertEqual(1, len(dumps))
+        self.assertRegex(dumps[0], r"-game_v2\.export_games-\d+ms-\d+KiB\.tracemalloc$")
+        tracemalloc.Snapshot.load(os.path.join(self.profile_dir, dumps[0]))
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_sampling_one_in_n(self):
+        for _ in range(6):
+            self.assertEqual(200, self.client.get("/api/v1/teams").status_code)
+        self.client.get("/api/v1/team/CHW")
+
+        dumps = self._dumps()
+        self.assertEqual(2, len(dumps))
+        self.assertTrue(all("-team.get_teams-" in dump for dump in dumps))
+
+    def test_disabled_by_default(self):
+        class NotProfiledConfig(TestConfig):
+            PROFILER_SECRET = "s3cret"
+            PROFILER_DIR = self.profile_dir
+
+        client = create_app(NotProfiledConfig()).test_client()
+        self.assertEqual(200, client.get("/api/v1/teams", headers={PROFILE_HEADER: "s3cret"}).status_code)
+        self.assertEqual([], self._dumps())
+
+    def test_parse_sample_rates(self):
+        self.assertEqual(
+            {"game_v2.get_games": 100, "team.get_team_stats": 50},
+            parse_sample_rates("game_v2.get_games=100, team.get_team_stats=50")
+        )
+        self.assertEqual({}, parse_sample_rates(None))
+        with self.assertRaises(ValueError):
+            parse_sample_rates("game_v2.get_games=0")
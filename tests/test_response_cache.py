@@ -0,0 +1,85 @@
+import gzip
+import unittest
+
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.response_cache import ResponseCache
+from utils import SAMPLE_DATA, TestUtils
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_get_requires_same_etag(self):
+        cache = ResponseCache(max_bytes=1024)
+        cache.put("games", "v1", b"body", "application/json")
+        self.assertEqual(b"body", cache.get("games", "v1").bodies["identity"])
+        self.assertIsNone(cache.get("games", "v2"))
+        self.assertEqual(0, len(cache))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_lru_eviction_by_size(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.put("a", "v", b"aaaa", "application/json")
+        cache.put("b", "v", b"bbbb", "application/json")
+        cache.get("a", "v")
+        cache.put("c", "v", b"cccc", "application/json")
+        self.assertIsNone(cache.get("b", "v"))
+        self.assertIsNotNone(cache.get("a", "v"))
+        self.assertIsNotNone(cache.get("c", "v"))
+        self.assertEqual(8, cache.size)
+
+    def test_entry_larger_than_limit_not_stored(self):
+        cache = ResponseCache(max_bytes=3)
+        entry = cache.put("a", "v", b"aaaa", "application/json")
+        self.assertEqual(b"aaaa", entry.bodies["identity"])
+        self.assertEqual(0, len(cache))
+
+    def test_gzip_body(self):
+        cache = ResponseCache(max_bytes=1024, gzip_enabled=True)
+        entry = cache.put("a", "v", b"aaaa" * 10, "application/json")
+        self.assertEqual(b"aaaa" * 10, gzip.decompress(entry.bodies["gzip"]))
+
+
+class TestResponseCacheApi(unittest.TestCase):
+
+    def setUp(self):
+        config = TestConfig()
+        config.RESPONSE_CACHE_GZIP = True
+        self.app = TestUtils.create_app_with_data(config, {
+            "teams": SAMPLE_DATA["teams"],
+            "games": [
+                {"ID": 1, "HOME_TEAM_ID": 2, "VISITING_TEAM_ID": 1, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0}
+            ]
+        })
+        self.client = self.app.test_client()
+
+    def test_cached_response_served_until_write(self):
+        cache = self.app.response_cache
+        first = self.client.get("/api/v2/games/")
+        second = self.client.get("/api/v2/games/")
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual({"1": "Prague Gulls 0:0 Chicago Wizards"}, second.get_json()["data"])
+
+        self.client.post("/api/v2/games/1", json={"quarters": "21:12"})
+        third = self.client.get("/api/v2/games/")
+        self.assertEqual(1, cache.hits)
+        self.assertEqual({"1": "Prague Gulls 21:12 Chicago Wizards (21:12)"}, third.get_json()["data"])
+
+    def test_cache_key_includes_query_string(self):
+        self.client.get("/api/v1/games/?limit=1")
+        response = self.client.get("/api/v1/games/")
+        self.assertNotIn("next_cursor", response.get_json())
+        self.assertEqual(2, len(self.app.response_cache))
+
+    def test_gzip_representation(self):
+        plain = self.client.get("/api/v1/games/")
+        compressed = self.client.get("/api/v1/games/", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual("gzip", compressed.headers["Content-Encoding"])
+        self.assertIn("Accept-Encoding", compressed.headers["Vary"])
+        self.assertEqual(plain.data, gzip.decompress(compressed.data))
+        self.assertNotEqual(plain.headers["ETag"], compressed.headers["ETag"])
+
+        not_modified = self.client.get(
+            "/api/v1/games/",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]}
+        )
+        self.assertEqual(304, not_modified.status_code)
@@ -0,0 +1,124 @@
+import gzip
+import unittest
+from unittest import mock
+
+from werkzeug.http import parse_accept_header
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.response_compression import (
+    BROTLI, GZIP, IDENTITY, ResponseCompressor, brotli, negotiate_encoding
+)
+from utils import TestUtils
+
+class TestNegotiateEncoding(unittest.TestCase):
+
+    def test_negotiate(self):
+        for accept_encoding, expected in [
+            ("gzip, br", BROTLI),
+            ("gzip;q=1.0, br;q=0.5", GZIP),
+            ("gzip", GZIP),
+            ("*", BROTLI),
+            ("deflate", IDENTITY),
+            ("br;q=0, gzip;q=0", IDENTITY),
+            (None, IDENTITY),
+        ]:
+            with self.subTest(accept_encoding=accept_encoding):
+                self.assertEqual(expected, negotiate_encoding(parse_accept_header(accept_encoding), (BROTLI, GZIP)))
+
+    def test_compress_all_respects_min_size(self):
+        compressor = ResponseCompressor(encodings=(GZIP,), min_size=10)
+        self.assertEqual({}, compressor.compress_all(b"short"))
+        self.assertEqual(b"long enough body", gzip.decompress(compressor.compress_all(b"long enough body")[GZIP]))
+        # mtime=0: одинаковые тела - одинаковые байты, ETag сжатого представления не врет
+        self.assertEqual(compressor.compress(b"body" * 10, GZIP), compressor.compress(b"body" * 10, GZIP))
+
+    @unittest.skipUnless(brotli, "brotli is not installed")
+    def test_brotli(self):
+        compressor = ResponseCompressor(min_size=0)
+        self.assertEqual((BROTLI, GZIP), compressor.encodings)
+        self.assertEqual(b"body" * 100, brotli.decompress(compressor.compress(b"body" * 100, BROTLI)))
+
+
+class MetricsConfig(TestConfig):
+    # /metrics - ответ не в JSON, его сжатие не касается
+    METRICS_ENABLED = True
+
+class TestResponseCompressionApi(unittest.TestCase):
+
+    def setUp(self):
+        teams = [{"ID": i, "SHORT": f"T{i:02d}", "NAME": f"Team number {i}"} for i in range(1, 61)]
+        self.app = TestUtils.create_app_with_data(MetricsConfig(), {
+            "teams": teams,
+            "games": [
+                {"ID": i, "HOME_TEAM_ID": i, "VISITING_TEAM_ID": i + 1, "HOME_TEAM_SCORE": 0, "VISITING_TEAM_SCORE": 0}
+                for i in range(1, 60)
+            ]
+        })
+        self.min_size = self.app.response_compressor.min_size
+        self.client = self.app.test_client()
+
+    def test_large_json_compressed(self):
+        for path in ("/api/v1/standings/", "/api/v1/teams", "/api/v2/games/"):
+            with self.subTest(path=path):
+                plain = self.client.get(path)
+                self.assertNotIn("Content-Encoding", plain.headers)
+                self.assertGreaterEqual(len(plain.data), self.min_size)
+
+                compressed = self.client.get(path, headers={"Accept-Encoding": "gzip"})
+                self.assertEqual("gzip", compressed.headers["Content-Encoding"])
+                self.assertIn("Accept-Encoding", compressed.headers["Vary"])
+                self.assertEqual(plain.data, gzip.decompress(compressed.data))
+                self.assertLess(len(compressed.data), len(plain.data))
+                self.assertEqual(plain.headers["ETag"][:-1] + '-gzip"', compressed.headers["ETag"])
+
+                not_modified = self.client.get(
+                    path, headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]}
+                )
+                self.assertEqual(304, not_modified.status_code)
+                self.assertEqual(compressed.headers["ETag"], not_modified.headers["ETag"])
+                self.assertIn("Accept-Encoding", not_modified.headers["Vary"])
+
+    def test_not_modified_vary_only_for_compressible_routes(self):
+        for path, vary in (("/api/v1/standings/", "Accept-Encoding"), ("/api/v2/games/export", None)):
+            with self.subTest(path=path):
+                etag = self.client.get(path).headers["ETag"]
+                not_modified = self.client.get(path, headers={"If-None-Match": etag})
+                self.assertEqual(304, not_modified.status_code)
+                self.assertEqual(vary, not_modified.headers.get("Vary"))
+
+    def test_small_and_non_json_not_compressed(self):
+        for path in ("/api/v1/team/T01", "/metrics"):
+            with self.subTest(path=path):
+                response = self.client.get(path, headers={"Accept-Encoding": "gzip"})
+                self.assertEqual(200, response.status_code)
+                self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_cached_response_compressed_once(self):
+        compressor = self.app.response_compressor
+        with mock.patch.object(compressor, "compress", wraps=compressor.compress) as compress:
+            bodies = [self.client.get("/api/v2/games/", headers={"Accept-Encoding": "gzip"}).data for _ in range(3)]
+            self.assertEqual(len(compressor.encodings), compress.call_count)
+        self.assertEqual(1, len(set(bodies)))
+        self.assertEqual(2, self.app.response_cache.hits)
+
+        # Не кэшируемый роут сжимается на каждый запрос
+        with mock.patch.object(compressor, "compress", wraps=compressor.compress) as compress:
+            for _ in range(2):
+                self.client.get("/api/v1/standings/", headers={"Accept-Encoding": "gzip"})
+            self.assertEqual(2, compress.call_count)
+
+    def test_disabled(self):
+        class NotCompressedConfig(TestConfig):
+            RESPONSE_COMPRESSION_ENABLED = False
+
+        app = create_app(NotCompressedConfig())
+        TestUtils.populate_db(app.db, {
+            "teams": [{"ID": i, "SHORT": f"T{i:02d}", "NAME": f"Team number {i}"} for i in range(1, 61)]
+        })
+        response = app.test_client().get("/api/v1/standings/", headers={"Accept-Encoding": "gzip"})
+        self.assertGreaterEqual(len(response.data), self.min_size)
+        self.assertNotIn("Content-Encoding", response.headers)
+        not_modified = app.test_client().get("/api/v1/standings/", headers={"If-None-Match": response.headers["ETag"]})
+        self.assertEqual(304, not_modified.status_code)
+        self.assertNotIn("Vary", not_modified.headers)
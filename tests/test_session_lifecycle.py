@@ -0,0 +1,38 @@
+import unittest
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.database.models import Team
+from above_the_rim.errors.db_errors import ReadOnlySessionError
+from utils import TestUtils
+
+class TestSessionLifecycle(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestConfig())
+        self.db = self.app.db
+        TestUtils.recreate_db(self.db)
+
+    def test_session_removed_after_request(self):
+        TestUtils.populate_db(self.db, {"teams": [{"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"}]})
+        self.db.remove()
+        response = self.app.test_client().get("/api/v1/teams")
+        self.assertEqual(200, response.status_code)
+        self.assertFalse(self.db.registry.has())
+
+    def test_get_session_is_read_only(self):
+        @self.app.route("/test/write", methods=["GET", "POST"])
+        def write_team():
+            self.db.add(Team(SHORT="CHW", NAME="Chicago Wizards"))
+            self.db.commit()
+            return "ok"
+
+        self.app.config["PROPAGATE_EXCEPTIONS"] = True
+        client = self.app.test_client()
+        with self.assertRaises(ReadOnlySessionError):
+            client.get("/test/write")
+        self.assertFalse(self.db.registry.has())
+        self.assertEqual(0, self.db.query(Team).count())
+
+        self.assertEqual(200, client.post("/test/write").status_code)
+        self.assertEqual(1, self.db.query(Team).count())
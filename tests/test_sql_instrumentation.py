@@ -0,0 +1,50 @@
+import re
+import unittest
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.test import TestConfig
+from utils import TestUtils
+
+class InstrumentedConfig(TestConfig):
+    SQL_INSTRUMENTATION_ENABLED = True
+
+class TestSqlInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.app = TestUtils.create_app_with_data(InstrumentedConfig())
+        self.db = self.app.db
+        self.client = self.app.test_client()
+
+    def test_query_stats_headers(self):
+        response = self.client.get("/api/v1/team/PRG")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("3", response.headers["X-DB-Queries"])
+        self.assertRegex(response.headers["Server-Timing"], r'^db;dur=\d+\.\d{2};desc="3 queries"$')
+
+        # Справочник команд уже прогрет - следующий запрос дешевле, счетчик считается заново
+        response = self.client.get("/api/v1/team/PRG")
+        self.assertEqual("1", response.headers["X-DB-Queries"])
+
+    def test_headers_disabled_by_default(self):
+        response = create_app(TestConfig()).test_client().get("/api/v1/teams")
+        self.assertNotIn("X-DB-Queries", response.headers)
+        self.assertNotIn("Server-Timing", response.headers)
+
+    def test_games_list_has_no_n_plus_one(self):
+        with TestUtils.assert_max_queries(self, self.db, 3) as small_stats:
+            self.client.get("/api/v2/games/")
+
+        TestUtils.populate_db(self.db, {
+            "games": [
+                {"ID": game_id, "HOME_TEAM_ID": 1, "VISITING_TEAM_ID": 2, "HOME_TEAM_SCORE": 1, "VISITING_TEAM_SCORE": 0}
+                for game_id in range(2, 52)
+            ],
+            "quarters": [{"GAME_ID": game_id, "QUARTERS": "1:0"} for game_id in range(2, 52)]
+        })
+        self.app.response_cache.invalidate()
+        self.db.remove()
+        with TestUtils.assert_max_queries(self, self.db, small_stats.count) as large_stats:
+            response = self.client.get("/api/v2/games/")
+        self.assertEqual(51, len(response.get_json()["data"]))
+        self.assertEqual(str(large_stats.count), response.headers["X-DB-Queries"])
+        self.assertTrue(all(not re.search(r"\bquarters\b.*\bID = \?", statement) for statement in large_stats.statements))
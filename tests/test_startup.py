@@ -0,0 +1,63 @@
+import importlib
+import inspect
+import os
+import pkgutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from alembic.script import ScriptDirectory
+from flask import Blueprint
+
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.database.db import Base, SCHEMA_REVISION, init_db
+from above_the_rim.utils import BLUEPRINT_MANIFEST
+
+MIGRATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "migrations")
+
+class TestStartup(unittest.TestCase):
+
+    def test_manifest_matches_packages(self):
+        for package_name, manifest in BLUEPRINT_MANIFEST.items():
+            with self.subTest(package=package_name):
+                package = importlib.import_module(package_name)
+                scanned = []
+                for _, module_name, _ in pkgutil.iter_modules(package.__path__):
+                    module = importlib.import_module(f"{package_name}.{module_name}")
+                    scanned.extend(
+                        (module_name, name) for name, obj in inspect.getmembers(module) if isinstance(obj, Blueprint)
+                    )
+                self.assertEqual(sorted(scanned), sorted(manifest))
+
+    def test_manifest_registers_same_routes(self):
+        class ManifestConfig(TestConfig):
+            BLUEPRINT_MANIFEST_ENABLED = True
+
+        def routes(app):
+            return sorted((rule.rule, rule.endpoint, tuple(sorted(rule.methods))) for rule in app.url_map.iter_rules())
+
+        self.assertEqual(routes(create_app(TestConfig())), routes(create_app(ManifestConfig())))
+
+    def test_schema_revision_is_alembic_head(self):
+        self.assertEqual([SCHEMA_REVISION], ScriptDirectory(MIGRATIONS_PATH).get_heads())
+
+    def test_create_all_skipped_at_head(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "test.db")
+            connection = sqlite3.connect(db_path)
+            connection.execute("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+            connection.execute("INSERT INTO alembic_version VALUES ('0000older0000')")
+            connection.commit()
+
+            with mock.patch.object(Base.metadata, "create_all") as create_all:
+                init_db(f"sqlite:///{db_path}").get_bind().dispose()
+            create_all.assert_called_once()
+
+            connection.execute("UPDATE alembic_version SET version_num = ?", (SCHEMA_REVISION,))
+            connection.commit()
+            connection.close()
+            with mock.patch.object(Base.metadata, "create_all") as create_all:
+                init_db(f"sqlite:///{db_path}").get_bind().dispose()
+            create_all.assert_not_called()
@@ -0,0 +1,81 @@
+import unittest
+
+from above_the_rim.database.db import init_db
+from above_the_rim.configs.test import TestConfig
+from above_the_rim.errors.team_errors import TeamNotFoundError
+from above_the_rim.services.repository_factory import RepositoryFactory
+from above_the_rim.services.service_factory import ServiceFactory
+from above_the_rim.services.team_registry import TeamRegistry
+from utils import TestUtils
+
+class TestTeamRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.db = init_db(TestConfig.DB_URL)
+        self.repo_factory = RepositoryFactory(self.db)
+        TestUtils.populate_db(self.db, {
+            "teams": [
+                {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+                {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"}
+            ]
+        })
+        self.team_repository = self.repo_factory.get_team_repository()
+        self.loads_count = 0
+        get_all_teams = self.team_repository.get_all_teams
+
+        def counting_get_all_teams():
+            self.loads_count += 1
+            return get_all_teams()
+
+        self.team_repository.get_all_teams = counting_get_all_teams
+
+    def _create_registry(self, check_interval: float) -> TeamRegistry:
+        return TeamRegistry(self.team_repository, self.repo_factory.get_data_version_repository(), check_interval)
+
+    def test_lookup_uses_loaded_registry(self):
+        registry = self._create_registry(check_interval=60)
+        registry.warm()
+        self.assertEqual((1, "CHW", "Chicago Wizards"), registry.get_team("CHW"))
+        self.assertIsNone(registry.get_team("DDD"))
+        self.assertEqual(["CHW", "PRG"], [team.SHORT for team in registry.get_all_teams()])
+        self.assertEqual(1, self.loads_count)
+
+    def test_invalidated_by_team_service_writes(self):
+        registry = self._create_registry(check_interval=60)
+        team_service = ServiceFactory(self.db, self.repo_factory, registry).get_team_service()
+        registry.warm()
+
+        team_service.add_team_by_data("BOS", "Boston Owls")
+        self.assertEqual("Boston Owls", registry.get_team("BOS").NAME)
+
+        team_service.delete_team_by_short("CHW")
+        self.assertIsNone(registry.get_team("CHW"))
+        self.assertEqual(3, self.loads_count)
+
+    def test_stale_generation_detected_by_other_process(self):
+        registry = self._create_registry(check_interval=0)
+        other_process_registry = self._create_registry(check_interval=0)
+        team_service = ServiceFactory(self.db, self.repo_factory, other_process_registry).get_team_service()
+        registry.warm()
+        generation = registry.generation
+
+        self.assertIsNotNone(registry.get_team("CHW"))
+        self.assertEqual(1, self.loads_count)
+
+        team_service.add_team_by_data("BOS", "Boston Owls")
+        self.assertEqual("Boston Owls", registry.get_team("BOS").NAME)
+        self.assertEqual(generation + 1, registry.generation)
+
+    def test_game_with_team_deleted_by_other_process(self):
+        registry = self._create_registry(check_interval=60)
+        other_process_registry = self._create_registry(check_interval=60)
+        game_service = ServiceFactory(self.db, self.repo_factory, registry).get_game_service()
+        team_service = ServiceFactory(self.db, self.repo_factory, other_process_registry).get_team_service()
+        registry.warm()
+
+        team_service.delete_team_by_short("CHW")
+        # Справочник еще помнит CHW - нарушение внешнего ключа сообщается как ненайденная команда
+        with self.assertRaises(TeamNotFoundError):
+            game_service.add_game_by_data("CHW", "PRG")
+        self.assertIsNone(registry.get_team("CHW"))
+        self.assertEqual([], game_service.get_all_games())
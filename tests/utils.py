@@ -1,8 +1,33 @@
+import os
+import tempfile
+import unittest
+from contextlib import contextmanager
+from flask import Flask
 from sqlalchemy.orm import Session
 from functools import wraps
-from typing import Callable
+from typing import Callable, Iterator, Optional
 
-from above_the_rim.database.db import Base
+from above_the_rim.app_factory import create_app
+from above_the_rim.configs.base import BaseConfig
+from above_the_rim.database.db import Base, get_engines
+from above_the_rim.database.repositories.game import GameRepository
+from above_the_rim.database.repositories.team_standings import TeamStandingsRepository
+from above_the_rim.sql_instrumentation import QueryStats, instrument_engine, record_queries
+
+# Общий набор данных тестов: две команды и игра Prague Gulls 33:32 Chicago Wizards с четвертями 12:20 и 21:12
+SAMPLE_DATA = {
+    "teams": [
+        {"ID": 1, "SHORT": "CHW", "NAME": "Chicago Wizards"},
+        {"ID": 2, "SHORT": "PRG", "NAME": "Prague Gulls"}
+    ],
+    "games": [
+        {"ID": 1, "HOME_TEAM_ID": 2, "VISITING_TEAM_ID": 1, "HOME_TEAM_SCORE": 33, "VISITING_TEAM_SCORE": 32}
+    ],
+    "quarters": [
+        {"ID": 1, "GAME_ID": 1, "QUARTERS": "12:20"},
+        {"ID": 2, "GAME_ID": 1, "QUARTERS": "21:12"}
+    ]
+}
 
 class TestUtils:
     @staticmethod
@@ -39,16 +64,77 @@ class TestUtils:
                         {"ID": 1, "SHORT": "CHG", "NAME": "Chicago Gulls"},
                         {"ID": 2, "SHORT": "PRW", "NAME": "Prague Wizards"}
                       ]
+                Для quarters можно передавать счет строкой ("QUARTERS": "21:12") и не указывать NUMBER -
+                четверти игры нумеруются в порядке перечисления
+                Материализованная таблица team_standings после заполнения пересчитывается по games,
+                как это делают сервисы при записи
 
         Returns:
             None
         """
+        quarter_numbers: dict[int, int] = {}
         for table_name, items in setup_data.items():
             ModelClass = TestUtils.get_model_by_table_name(table_name)
             for item in items:
+                if table_name == "quarters" and "NUMBER" not in item:
+                    # Четверти игры нумеруются в порядке перечисления, как при добавлении через API
+                    quarter_numbers[item["GAME_ID"]] = quarter_numbers.get(item["GAME_ID"], 0) + 1
+                    item = {**item, "NUMBER": quarter_numbers[item["GAME_ID"]]}
                 db.add(ModelClass(**item))
+        db.flush()
+        TestUtils.rebuild_standings(db)
         db.commit()
 
+    @staticmethod
+    def rebuild_standings(db: Session):
+        """
+        Пересчитывает team_standings по таблице games (без commit)
+
+        Args:
+            db (sqlalchemy.orm.Session): Объект сессии БД
+
+        Returns:
+            None
+        """
+        standings_repository = TeamStandingsRepository(db)
+        standings_repository.delete_all()
+        standings_repository.insert_rows(GameRepository(db).get_standings())
+
+    @staticmethod
+    def create_app_with_data(config: BaseConfig, setup_data: Optional[dict] = None) -> Flask:
+        """
+        Создает приложение с пересозданной БД, заполненной setup_data. Справочник команд сбрасывается,
+        сессия закрывается - первый запрос теста работает как первый запрос после старта
+
+        Args:
+            config (BaseConfig): конфиг приложения
+            setup_data (Optional[dict]): данные для populate_db, по умолчанию SAMPLE_DATA
+
+        Returns:
+            Flask: приложение
+        """
+        app = create_app(config)
+        TestUtils.recreate_db(app.db)
+        TestUtils.populate_db(app.db, SAMPLE_DATA if setup_data is None else setup_data)
+        app.team_registry.invalidate()
+        app.db.remove()
+        return app
+
+    @staticmethod
+    def get_temp_db_url(test_case: unittest.TestCase) -> str:
+        """
+        URL файловой БД SQLite во временной директории, которая удаляется после теста
+
+        Args:
+            test_case (unittest.TestCase): тест, к которому привязывается удаление директории
+
+        Returns:
+            str: URL вида sqlite:///<tmp>/test.db
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
+        test_case.addCleanup(tmp_dir.cleanup)
+        return f"sqlite:///{os.path.join(tmp_dir.name, 'test.db')}"
+
     @staticmethod
     def recreate_db(db: Session):
         """
@@ -62,4 +148,26 @@ class TestUtils:
         """
         engine = db.get_bind()
         Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
\ No newline at end of file
+        Base.metadata.create_all(bind=engine)
+
+    @staticmethod
+    @contextmanager
+    def assert_max_queries(test_case: unittest.TestCase, db: Session, max_queries: int) -> Iterator[QueryStats]:
+        """
+        Проверяет, что код внутри блока выполнил не больше max_queries SQL-запросов - ловит N+1
+
+        Args:
+            test_case (unittest.TestCase): тест, в котором делается проверка
+            db (sqlalchemy.orm.Session): сессия из init_db - учитываются запросы ее engine
+            max_queries (int): допустимое количество запросов
+
+        Returns:
+            Iterator[QueryStats]: статистика запросов блока
+        """
+        for engine in get_engines(db):
+            instrument_engine(engine)
+        with record_queries() as stats:
+            yield stats
+        test_case.assertLessEqual(
+            stats.count, max_queries, "Слишком много SQL-запросов:\n" + "\n".join(stats.statements)
+        )